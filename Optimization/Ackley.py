@@ -0,0 +1,41 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from ContinuousFunction import ContinuousFunction
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B-Epsilon
+
+    Standard N-dimensional test problem for load testing the hybrid.
+
+    This is the Ackley Function, a nearly flat outer region around a
+    deep central funnel.
+    Known optimum at ::   0 at (0, ..., 0)
+"""
+
+class Ackley(ContinuousFunction):
+
+    lower = -32.768
+    upper = 32.768
+    defaultDimensions = 10
+
+
+    """
+     Solves the Ackley Function for a whole (n, D) array of
+     coordinates at once. Does not touch the instance variables.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of cost evaluations
+     """
+    def solveArray(self, positions):
+        positions = numpy.asarray(positions, dtype=float)
+        dimensions = positions.shape[-1]
+        return (-20*numpy.exp(-0.2*numpy.sqrt(numpy.sum(positions*positions, axis=-1)/dimensions))
+                - numpy.exp(numpy.sum(numpy.cos(2*numpy.pi*positions), axis=-1)/dimensions)
+                + 20 + numpy.e)
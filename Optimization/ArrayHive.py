@@ -0,0 +1,266 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Hive import Hive
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 2A/B-Arrays
+
+    Structure-of-arrays Hive for very large populations. Positions,
+    velocities, personal bests, costs and IDs live in contiguous
+    typed arrays, one row per particle, instead of one Particle and
+    one Function object per particle. A particle's ID is its row; the
+    population order (best first) is kept as a separate index array,
+    so sorting never moves the particle data itself.
+
+    The annealing modes and the Swarm work on whole arrays through the
+    Hive accessors, so nothing per particle is allocated during a run.
+    Code that still wants per-particle objects can ask getPopulation()
+    for ParticleViews, __slots__ objects holding only the hive and a
+    row number.
+"""
+
+class ArrayHive(Hive):
+
+    """
+     Constructor. Parameters as for Hive, with "batch" as the default
+     mode.
+
+     @param batchSize: Chains annealed at once in "batch" mode, which
+         bounds the memory of the per-iteration random draws
+     """
+    def __init__(self, popSize, funcNum, saMode="batch", workers=None,
+                 seed=None, telemetry=None, stopping=None, cache=None,
+                 batchSize=4096, rng=None):
+        Hive.__init__(self, popSize, funcNum, saMode, workers, seed,
+                      telemetry, stopping, cache, rng)
+        self.batchSize = batchSize
+
+
+    """
+     Fills the arrays with random starting values, solved as one
+     array call. The draws match those of a Hive of Particles.
+     """
+    def setup(self):
+        random = numpy.random if self.rng is None else self.rng
+        randomState = numpy.random.get_state()
+        if(self.rng is not None):
+            generatorState = self.rng.bit_generator.state
+        self.FX = self.objective.create(self.rng, False)  # Bounds, checks and solveArray()
+        numpy.random.set_state(randomState)
+        if(self.rng is not None):
+            self.rng.bit_generator.state = generatorState
+        size = self.populationSize
+        dimensions = self.FX.getDimensions()
+        self.positions = random.uniform(self.FX.initLower, self.FX.initUpper,
+                                        (size, dimensions))
+        self.velocities = numpy.zeros((size, dimensions))
+        self.currentCosts = self.FX.solveArray(self.positions)
+        self.bestPositions = self.positions.copy()
+        self.bestCosts = self.currentCosts.copy()
+        self.order = numpy.arange(size)        # Population order, best first
+        self.evaluations = self.evaluations + size
+
+
+    """
+     Sorts the population order based off fitness, best first. A
+     stable argsort; the particle rows stay where they are.
+     """
+    def sortListFitness(self):
+        self.order = self.order[numpy.argsort(self.bestCosts[self.order], kind="stable")]
+
+
+    """
+     Population arrays in population order; see Hive.
+     """
+    def getPositions(self):
+        return self.positions[self.order]
+
+    def getBestPositions(self):
+        return self.bestPositions[self.order]
+
+    def getVelocities(self):
+        return self.velocities[self.order]
+
+    def getCurrentCosts(self):
+        return self.currentCosts[self.order]
+
+    def getBestCosts(self):
+        return self.bestCosts[self.order]
+
+    def getIDs(self):
+        return self.order.copy()
+
+    def getBestPosition(self, index):
+        return self.bestPositions[self.order[index]]
+
+    def getFunction(self):
+        return self.FX
+
+
+    """
+     Moves every particle, in population order.
+
+     @param positions:  (n, D) new coord vectors
+     @param velocities: (n, D) velocities that led there
+     """
+    def moveTo(self, positions, velocities):
+        self.positions[self.order] = positions
+        self.velocities[self.order] = velocities
+
+
+    """
+     Writes SA results back; see Hive.
+     """
+    def setResult(self, index, position, cost):
+        row = self.order[index]
+        self.positions[row] = position
+        self.bestPositions[row] = position
+        self.bestCosts[row] = cost
+
+    def setResults(self, index, positions, costs):
+        if(numpy.ndim(index) == 0):
+            rows = self.order[index:index + len(costs)]
+        else:
+            rows = self.order[index]
+        self.positions[rows] = positions
+        self.bestPositions[rows] = positions
+        self.bestCosts[rows] = costs
+
+
+    """
+     Overwrites the whole population; see Hive.
+     """
+    def setArrays(self, particles, positions, currentCosts, bestPositions,
+                  bestCosts, velocities):
+        rows = numpy.asarray(particles, dtype=numpy.int64)
+        self.positions[rows] = positions
+        self.currentCosts[rows] = currentCosts
+        self.bestPositions[rows] = bestPositions
+        self.bestCosts[rows] = bestCosts
+        self.velocities[rows] = velocities
+        self.order = rows.copy()
+
+
+    """
+     Returns views of the particles in population order. Built on
+     each call; the views stay bound to their particle after later
+     sorts.
+
+     @return: list of ParticleView
+     """
+    def getPopulation(self):
+        return [ParticleView(self, row) for row in self.order.tolist()]
+
+
+    """
+     Moves the positions, personal bests and their costs into the
+     population arrays of a SharedBestBoard. The hive keeps writing
+     them in place, so other processes mapping the board read the
+     population as it evolves without copies. Rows are particle IDs,
+     not population order.
+
+     @param board: SharedBestBoard with a population of this size
+     """
+    def shareArrays(self, board):
+        if(board.getPopulationSize() != self.populationSize or
+           board.getDimensions() != self.positions.shape[1]):
+            raise ValueError("board holds %s particles of %d dimensions, hive has %d of %d" %
+                             (board.getPopulationSize(), board.getDimensions(),
+                              self.populationSize, self.positions.shape[1]))
+        positions, bestPositions, bestCosts = board.getArrays()
+        positions[:] = self.positions
+        bestPositions[:] = self.bestPositions
+        bestCosts[:] = self.bestCosts
+        self.positions = positions
+        self.bestPositions = bestPositions
+        self.bestCosts = bestCosts
+
+
+    """
+     Bytes held by the population arrays.
+
+     @return: Returns the byte count.
+     """
+    def getArrayBytes(self):
+        return (self.positions.nbytes + self.velocities.nbytes +
+                self.currentCosts.nbytes + self.bestPositions.nbytes +
+                self.bestCosts.nbytes + self.order.nbytes)
+
+
+    """
+     Prints every particle. On demand only.
+     """
+    def hiveAdmin(self):
+        for particle in self.getPopulation():
+            particle.particleAdmin()
+
+
+"""
+---------------------------------------
+CLASS :: ParticleView
+---------------------------------------
+
+ Particle interface over one row of an ArrayHive. Reads and writes
+ go straight to the hive's arrays.
+ """
+class ParticleView(object):
+
+    __slots__ = ("hive", "row")
+
+    def __init__(self, hive, row):
+        self.hive = hive
+        self.row = row
+
+
+    """
+     Returns particle ID number, its row in the hive.
+     """
+    def getID(self):
+        return self.row
+
+
+    """
+     Sets and returns the velocity vector.
+     """
+    def setVelocity(self, vel):
+        self.hive.velocities[self.row] = vel
+
+    def getVelocity(self):
+        return self.hive.velocities[self.row]
+
+
+    """
+     Returns bestCost and the coordinates.
+
+     @return: Best cost.
+     @return: Current cost.
+     @return: Current coord vector
+     @return: Best coord vector
+     """
+    def getBestCost(self):
+        return float(self.hive.bestCosts[self.row])
+
+    def getCurrentCost(self):
+        return float(self.hive.currentCosts[self.row])
+
+    def getPosition(self):
+        return self.hive.positions[self.row]
+
+    def getBestPosition(self):
+        return self.hive.bestPositions[self.row]
+
+
+    """
+     Prints an admin output.
+     """
+    def particleAdmin(self):
+        print("*** Particle Printout Start: %s -->" % self.row)
+        print("<-- %s Report -->" % self.hive.FX.__class__.__name__)
+        print("  BestSol: %s" % self.getBestCost())
+        print("  Best:    %s" % self.getBestPosition())
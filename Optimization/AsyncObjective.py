@@ -0,0 +1,472 @@
+""" Python Package Support """
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy
+
+""" Internal Package Support """
+from ContinuousFunction import ContinuousFunction
+from Objectives import ObjectiveDefinition, getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1C-Async
+
+    Objectives backed by slow external evaluations, e.g. a call into a
+    simulator taking tens of milliseconds. An AsyncObjective evaluates
+    a block of coordinate vectors as a coroutine; the AsyncEvaluator
+    splits every array the engines ask for into blocks of batchSize
+    rows and keeps up to concurrency blocks in flight at once. An
+    AsyncFunction puts the evaluator behind the ordinary
+    ContinuousFunction interface, so the Hive and the annealers use it
+    unchanged ::
+
+        simulator = SimulatorProcess("branin", latency=0.02)
+        objective = simulatedObjective(simulator, concurrency=32)
+        swarm = Swarm(64, 2.05, 2.05, 1.0, .7298, objective, saMode="auto")
+
+    The in-flight evaluations come from the array calls: in "batch"
+    mode every SA step evaluates all chains at once, so an objective
+    built here prefers that mode. A scalar chain has one evaluation
+    outstanding at a time whatever the limit, and the evaluator holds
+    an event loop and sockets, so the objectives are not offered to
+    worker processes.
+
+    SimulatorProcess is a local stand-in for the external simulator ::
+    a subprocess serving a registered objective over a socket, one
+    JSON line per request, with an artificial latency ::
+
+        python AsyncObjective.py --objective branin --latency 0.02
+"""
+
+class AsyncObjective(object):
+
+    """
+     Evaluates a block of coordinate vectors.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: n cost evaluations
+     """
+    async def evaluate(self, positions):
+        raise NotImplementedError
+
+
+    """
+     Releases connections and other resources. Called from the
+     evaluator's event loop.
+     """
+    async def close(self):
+        pass
+
+
+"""
+---------------------------------------
+CLASS :: LatencyObjective
+---------------------------------------
+
+ In-process stand-in; a registered objective answered after a delay.
+ """
+class LatencyObjective(AsyncObjective):
+
+    """
+     @param objective: Objective key, see Objectives.getObjective()
+     @param latency:   Seconds per request
+     """
+    def __init__(self, objective, latency=0.02):
+        self.FX = getObjective(objective).create()
+        self.latency = latency
+
+    async def evaluate(self, positions):
+        await asyncio.sleep(self.latency)
+        return self.FX.solveArray(positions)
+
+
+"""
+---------------------------------------
+CLASS :: SocketObjective
+---------------------------------------
+
+ Client of a simulator speaking the SimulatorProcess protocol :: one
+ JSON line {"positions": [[...], ...]} per request, answered by
+ {"costs": [...]} or {"error": message}. Connections are opened on
+ demand, one per request in flight, and kept for reuse.
+ """
+class SocketObjective(AsyncObjective):
+
+    """
+     @param host: Simulator host
+     @param port: Simulator port
+     """
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.idle = list()
+
+    async def evaluate(self, positions):
+        if(self.idle):
+            reader, writer = self.idle.pop()
+        else:
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            request = {"positions": numpy.asarray(positions, dtype=float).tolist()}
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            line = await reader.readline()
+        except BaseException:
+            writer.close()
+            raise
+        if(not line):
+            writer.close()
+            raise ConnectionError("Simulator at %s:%d closed the connection" %
+                                  (self.host, self.port))
+        self.idle.append((reader, writer))
+        reply = json.loads(line)
+        if("error" in reply):
+            raise RuntimeError("Simulator error: %s" % reply["error"])
+        return numpy.array(reply["costs"], dtype=float)
+
+    async def close(self):
+        while(self.idle):
+            reader, writer = self.idle.pop()
+            writer.close()
+            await writer.wait_closed()
+
+
+"""
+---------------------------------------
+CLASS :: AsyncEvaluator
+---------------------------------------
+
+ Runs the evaluations of an AsyncObjective with a concurrency limit
+ and batching. evaluate() is the blocking entry point of the engines
+ and drives a private event loop; code already running in an event
+ loop awaits evaluateAsync() instead. Use one or the other for a
+ given evaluator, as its connections belong to one loop.
+ """
+class AsyncEvaluator(object):
+
+    """
+     @param objective:   AsyncObjective
+     @param concurrency: Requests in flight at most
+     @param batchSize:   Coordinate vectors per request
+     """
+    def __init__(self, objective, concurrency=16, batchSize=1):
+        self.objective = objective
+        self.concurrency = max(1, int(concurrency))
+        self.batchSize = max(1, int(batchSize))
+        self.loop = None
+        self.semaphore = None
+        self.requests = 0
+        self.evaluations = 0
+        self.inFlight = 0
+        self.peakInFlight = 0
+        self.seconds = 0.0
+
+
+    """
+     Evaluates an array, blocking until every cost is in.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of n cost evaluations
+     """
+    def evaluate(self, positions):
+        if(self.loop is None):
+            self.loop = asyncio.new_event_loop()
+        start = time.perf_counter()
+        costs = self.loop.run_until_complete(self.evaluateAsync(positions))
+        self.seconds = self.seconds + time.perf_counter() - start
+        return costs
+
+
+    """
+     Coroutine form of evaluate().
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of n cost evaluations
+     """
+    async def evaluateAsync(self, positions):
+        positions = numpy.asarray(positions, dtype=float)
+        if(self.semaphore is None):
+            self.semaphore = asyncio.Semaphore(self.concurrency)
+        blocks = [positions[i:i + self.batchSize]
+                  for i in range (0, len(positions), self.batchSize)]
+        costs = await asyncio.gather(*[self.submit(block) for block in blocks])
+        if(not costs):
+            return numpy.empty(0)
+        return numpy.concatenate(costs)
+
+
+    """
+     Sends one block once a slot is free.
+
+     @param block: (m, D) array, at most batchSize rows
+
+     @return: array of m cost evaluations
+     """
+    async def submit(self, block):
+        async with self.semaphore:
+            self.inFlight = self.inFlight + 1
+            self.peakInFlight = max(self.peakInFlight, self.inFlight)
+            try:
+                costs = await self.objective.evaluate(block)
+            finally:
+                self.inFlight = self.inFlight - 1
+        costs = numpy.asarray(costs, dtype=float).reshape(-1)
+        if(len(costs) != len(block)):
+            raise ValueError("Objective returned %d costs for %d positions" %
+                             (len(costs), len(block)))
+        self.requests = self.requests + 1
+        self.evaluations = self.evaluations + len(block)
+        return costs
+
+
+    """
+     Closes the objective and the private event loop.
+     """
+    def close(self):
+        if(self.loop is not None):
+            self.loop.run_until_complete(self.objective.close())
+            self.loop.close()
+            self.loop = None
+            self.semaphore = None
+
+
+    """
+     Request counters.
+
+     @return: dict with requests, evaluations, peakInFlight and the
+         seconds spent blocked in evaluate()
+     """
+    def getStats(self):
+        return {"requests": self.requests,
+                "evaluations": self.evaluations,
+                "peakInFlight": self.peakInFlight,
+                "seconds": self.seconds}
+
+
+"""
+---------------------------------------
+CLASS :: AsyncFunction
+---------------------------------------
+
+ ContinuousFunction evaluated through an AsyncEvaluator. The bounds
+ are given per instance; every instance of one objective shares its
+ evaluator.
+ """
+class AsyncFunction(ContinuousFunction):
+
+    """
+     @param dimensions: Number of coordinates (None :: from the bounds)
+     @param evaluator:  AsyncEvaluator
+     @param lower:      Lower domain bound, scalar or per coordinate
+     @param upper:      Upper domain bound, scalar or per coordinate
+     @param wrap:       Wrap coords around the domain, else clip
+     @param rng:        NumPy Generator for the starting values
+     @param evaluate:   Solve at the starting values; see
+                         ContinuousFunction
+     """
+    def __init__(self, dimensions=None, evaluator=None, lower=None, upper=None,
+                 wrap=True, rng=None, evaluate=True):
+        self.evaluator = evaluator
+        self.lower = lower
+        self.upper = upper
+        self.wrap = wrap
+        ContinuousFunction.__init__(self, dimensions, rng, evaluate)
+
+    def solveArray(self, positions):
+        return self.evaluator.evaluate(positions)
+
+
+"""
+---------------------------------------
+CLASS :: AsyncObjectiveDefinition
+---------------------------------------
+
+ ObjectiveDefinition of an AsyncFunction. Prefers "batch" mode and is
+ kept out of worker processes.
+ """
+class AsyncObjectiveDefinition(ObjectiveDefinition):
+
+    """
+     Constructor.
+
+     @param name:       Registry name
+     @param evaluator:  AsyncEvaluator
+     @param lower:      Lower domain bound, scalar or per coordinate
+     @param upper:      Upper domain bound, scalar or per coordinate
+     @param stepRange:  SA neighborhood range
+     @param goal:       Known optimal cost (None :: unknown)
+     @param optimum:    A known optimal coord vector (None :: unknown)
+     @param dimensions: Number of coordinates (None :: from the bounds)
+     @param wrap:       Wrap coords around the domain, else clip
+     """
+    def __init__(self, name, evaluator, lower, upper, stepRange, goal=None,
+                 optimum=None, dimensions=None, wrap=True):
+        ObjectiveDefinition.__init__(self, name, AsyncFunction, stepRange, goal,
+                                     optimum, dimensions, True, False)
+        self.evaluator = evaluator
+        self.lower = lower
+        self.upper = upper
+        self.wrap = wrap
+
+    def create(self, rng=None, evaluate=True):
+        return AsyncFunction(self.dimensions, self.evaluator, self.lower,
+                             self.upper, self.wrap, rng, evaluate)
+
+    def withDimensions(self, dimensions):
+        optimum = self.optimum
+        if(optimum is not None):
+            optimum = numpy.full(dimensions, optimum[0])
+        return AsyncObjectiveDefinition(self.name, self.evaluator, self.lower,
+                                        self.upper, self.stepRange, self.goal,
+                                        optimum, dimensions, self.wrap)
+
+
+"""
+---------------------------------------
+CLASS :: SimulatorProcess
+---------------------------------------
+
+ Local stand-in for an external simulator :: a subprocess serving a
+ registered objective over a TCP socket with an artificial latency
+ per request. Requests on different connections are served
+ concurrently, as by a simulator farm.
+ """
+class SimulatorProcess(object):
+
+    """
+     Starts the subprocess and waits for it to listen.
+
+     @param objective: Registered objective key
+     @param latency:   Seconds per request
+     @param host:      Interface to listen on
+     @param port:      Port (0 :: any free port)
+     """
+    def __init__(self, objective="branin", latency=0.02, host="127.0.0.1", port=0):
+        self.objective = getObjective(objective)
+        self.latency = latency
+        self.host = host
+        self.process = subprocess.Popen([sys.executable, os.path.abspath(__file__),
+                                         "--objective", self.objective.name,
+                                         "--latency", str(latency),
+                                         "--host", host, "--port", str(port)],
+                                        stdout=subprocess.PIPE, text=True)
+        line = self.process.stdout.readline()
+        if(not line):
+            self.process.wait()
+            raise RuntimeError("Simulator exited with code %s" % self.process.returncode)
+        self.port = int(line)
+
+
+    """
+     Returns a client for the simulator.
+
+     @return: SocketObjective
+     """
+    def connect(self):
+        return SocketObjective(self.host, self.port)
+
+
+    """
+     Stops the subprocess.
+     """
+    def stop(self):
+        if(self.process.poll() is None):
+            self.process.terminate()
+            self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+"""
+ Builds the objective of a running SimulatorProcess, with the bounds,
+ range and goal of the objective it serves.
+
+ @param simulator:   SimulatorProcess
+ @param concurrency: Requests in flight at most
+ @param batchSize:   Coordinate vectors per request
+
+ @return: AsyncObjectiveDefinition
+ """
+def simulatedObjective(simulator, concurrency=16, batchSize=1):
+    served = simulator.objective
+    FX = served.create()
+    evaluator = AsyncEvaluator(simulator.connect(), concurrency, batchSize)
+    return AsyncObjectiveDefinition(served.name, evaluator, FX.lower, FX.upper,
+                                    served.stepRange, served.goal, served.optimum,
+                                    FX.getDimensions(), FX.wrap)
+
+
+"""
+ Serves an objective until cancelled; the SimulatorProcess side.
+
+ @param objective: Objective key
+ @param latency:   Seconds per request
+ @param host:      Interface to listen on
+ @param port:      Port (0 :: any free port)
+ """
+async def serveSimulator(objective, latency, host, port):
+    FX = getObjective(objective).create()
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                line = await reader.readline()
+                if(not line):
+                    break
+                try:
+                    positions = numpy.array(json.loads(line)["positions"], dtype=float)
+                    await asyncio.sleep(latency)
+                    reply = {"costs": FX.solveArray(positions).tolist()}
+                except (ValueError, KeyError, TypeError) as error:
+                    reply = {"error": str(error)}
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, host, port)
+    print(server.sockets[0].getsockname()[1], flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+"""
+ Command line entry point of the stand-in simulator. Prints the port
+ it listens on, then serves until terminated.
+ """
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stand-in external objective simulator")
+    parser.add_argument("--objective", default="branin")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    objective = int(args.objective) if args.objective.isdigit() else args.objective
+    try:
+        asyncio.run(serveSimulator(objective, args.latency, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,307 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Objectives import getObjective
+from Telemetry import Telemetry, GOAL, CHAIN
+from Cooling import GeometricCooling
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1A-Batch
+
+    Vectorized counterpart of the SimulatedAnnealing class. Rather than
+    annealing one particle at a time, every chain in the batch advances
+    in lock step and the positions, costs, temperatures and acceptance
+    decisions are held as NumPy arrays. The move, acceptance and
+    re-heat rules mirror SimulatedAnnealing.SA() step for step so the
+    best coordinate/cost results are interchangeable with the scalar version.
+"""
+
+class BatchSimulatedAnnealing(object):
+
+    """
+     Initialization for the BATCH SA level. Parameters mirror the
+     scalar SimulatedAnnealing constructor.
+
+     @param funcNum: Objective name, ObjectiveDefinition, or number
+         1 or (other) :: control for the Function class to be evaluated
+     @param initTemp:    Initial temperature
+     @param extIters:    External iterations
+     @param intIters:    Internal iterations
+     @param moveCont:    Alpha value // move control
+     @param localSearch: Local Search control
+     @param expand:      Re-heat // tempering mechanism
+     @param telemetry:   Telemetry receiving GOAL and CHAIN events
+     @param stopping:    StoppingCriteria for the whole batch, checked
+         once per external iteration against the batch's total moves
+         and best cost
+     @param cache:       EvaluationCache for the objective, or None
+     @param schedule:    CoolingSchedule applied to every chain
+     @param stepControl: AcceptanceStepControl, one scale per chain;
+         needs "metropolis" acceptance
+     @param acceptance:  "legacy" or "metropolis"
+     @param rng:         NumPy Generator the batch draws from (None ::
+         the global numpy.random generator)
+     @param surrogate:   RBFSurrogate screening the moves of every
+         chain before they reach the objective, or None; needs
+         "metropolis" acceptance
+     """
+    def __init__(self, funcNum, initTemp, extIters, intIters,
+                 moveCont, localSearch, expand, telemetry=None,
+                 stopping=None, cache=None, schedule=None,
+                 stepControl=None, acceptance="legacy", rng=None,
+                 surrogate=None):
+        if(stepControl is not None and acceptance != "metropolis"):
+            raise ValueError("step control needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes every move, so the ratio it "
+                             "steers is always 1" % acceptance)
+        if(surrogate is not None and acceptance != "metropolis"):
+            raise ValueError("surrogate screening needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes moves the screen would reject" % acceptance)
+        """ Parameters """
+        self.function = funcNum
+        self.objective = getObjective(funcNum)
+        self.random = numpy.random if rng is None else rng
+        self.FX = self.objective.create(rng)   # Function for Eval
+        self.range = self.objective.stepRange  # Neighborhood range
+        self.goal = self.objective.goal        # Known optimal cost
+        self.initialTemp = initTemp  # Initial temperature
+        self.external = extIters     # External Iterations for the SA Algorithm
+        self.internal = intIters     # Internal iterations for the SA Algorithm
+        self.alpha = moveCont        # Alpha value // Move control
+        self.drillBit = localSearch  # Control for local search
+        self.expansion = expand      # Re-heat
+        self.telemetry = telemetry or Telemetry()
+        self.stopping = stopping
+        self.FX.setCache(cache)
+        self.schedule = schedule or GeometricCooling()
+        self.stepControl = stepControl
+        self.acceptance = acceptance
+        self.surrogate = surrogate
+        """ Instance variables """
+        self.setVariables(numpy.empty((0, self.FX.getDimensions())))
+
+
+    """
+     The batch Simulated Annealing Algorithm. Each internal
+     iteration performs one move for every chain at once.
+     """
+    def SA(self):
+        telemetry = self.telemetry
+        stopping = self.stopping
+        if(stopping is not None):
+            stopping.start()
+        size, dimensions = self.position.shape
+        schedule = self.schedule
+        metropolis = self.acceptance == "metropolis"
+        schedule.start(self.initialTemp, self.external, self.alpha, self.currentTemp)
+        if(self.stepControl is not None):
+            self.stepControl.start(size)
+        previousSolution = numpy.full(size, numpy.inf)
+        for i in range (self.external):
+            internal = self.internal
+            if(stopping is not None and stopping.maxEvaluations is not None):
+                internal = min(internal, stopping.remaining(self.getEvaluations())//max(1, size))
+                if(internal == 0):
+                    """ fewer evaluations left than chains :: no whole move remains """
+                    stopping.starve()
+                    break
+            bestStore = self.bestSolution
+            """ random draws for the whole external iteration at once """
+            steps = self.random.uniform(-self.range, self.range,
+                                         (internal, size, dimensions))
+            randomNums = self.random.uniform(0, 1, (internal, size))
+            for j in range (internal):
+                """ saving values if needed later """
+                positionStore = self.position
+
+                evaluated = True
+                if(self.surrogate is not None):
+                    with numpy.errstate(divide='ignore'):
+                        thresholds = previousSolution - self.currentTemp*numpy.log(randomNums[j])
+                    evaluated = self.randomStep(steps[j], thresholds)
+                else:
+                    self.randomStep(steps[j])
+                current = self.currentSolution
+                improved = current < self.bestSolution
+                """ Improvements -- always accepted """
+                self.bestSolution = numpy.where(improved, current, self.bestSolution)
+                self.bestPosition = numpy.where(improved[:, numpy.newaxis], self.position,
+                                                self.bestPosition)
+                nearGoal = improved & ((self.goal - current) > -0.00005)
+                hitGoal = nearGoal & (self.movesToTarget == 0)
+                """ Non-improvements -- probabilistic acceptance """
+                with numpy.errstate(over='ignore', invalid='ignore'):
+                    if(metropolis):
+                        threshold = numpy.exp((previousSolution - current)/self.currentTemp)
+                    else:
+                        threshold = numpy.exp((current - self.bestSolution)/self.currentTemp)
+                rejected = ~improved & (randomNums[j] > threshold)
+                if(self.surrogate is not None):
+                    rejected = rejected | ~evaluated
+                self.position = numpy.where(rejected[:, numpy.newaxis], positionStore,
+                                            self.position)
+                previousSolution = numpy.where(rejected, previousSolution, current)
+                self.currentSolution = previousSolution
+                self.totalMoves += evaluated
+                self.movesAccepted += ~rejected
+                self.movesToTarget = numpy.where(hitGoal, self.movesAccepted,
+                                                 self.movesToTarget)
+                if(telemetry.active and nearGoal.any()):
+                    for chain in numpy.flatnonzero(nearGoal).tolist():
+                        telemetry.emit(GOAL, {"chain": chain,
+                                              "cost": float(current[chain]),
+                                              "goal": self.goal,
+                                              "totalMoves": int(self.totalMoves[chain])})
+            """ Temperature Updates """
+            temp = schedule.update(self.currentTemp, self.bestSolution < bestStore)
+            self.resets += temp > self.currentTemp
+            self.currentTemp = temp
+            if(self.stepControl is not None):
+                self.stepControl.update(self.totalMoves, self.movesAccepted)
+            if(stopping is not None and size > 0 and
+               stopping.update(self.getEvaluations(), self.bestSolution.min())):
+                break
+        self.stopReason = stopping.getReason() if stopping is not None else None
+        if(telemetry.active):
+            for chain in range (size):
+                telemetry.emit(CHAIN, {"chain": chain,
+                                       "bestCost": float(self.bestSolution[chain]),
+                                       "bestPosition": self.bestPosition[chain],
+                                       "totalMoves": int(self.totalMoves[chain]),
+                                       "movesAccepted": int(self.movesAccepted[chain]),
+                                       "movesToTarget": int(self.movesToTarget[chain])})
+
+
+    """
+     Random neighborhood step for every chain based off the range
+     of the neighborhood set in the SA constructor.
+
+     Sets the currentSolution array. Given the Metropolis thresholds,
+     only the moves the surrogate passes are evaluated; the others
+     cost +inf.
+
+     @param step:       (n, D) uniform draws in [-range, range]
+     @param thresholds: n costs each move must not exceed to pass the
+                         Metropolis test (None :: evaluate every move)
+
+     @return: boolean mask of the evaluated moves
+     """
+    def randomStep(self, step, thresholds=None):
+        if(self.stepControl is not None):
+            step = step*self.stepControl.scale[:, numpy.newaxis]
+        elif(self.drillBit):
+            step = step*(self.currentTemp/self.initialTemp)[:, numpy.newaxis]
+        """ Process updates """
+        self.position = self.FX.checkArray(self.position + step)
+        if(thresholds is None):
+            self.currentSolution = self.FX.evaluateArray(self.position)
+            return numpy.ones(len(self.position), dtype=bool)
+        evaluated = self.surrogate.screen(self.position, thresholds, self.random)
+        self.currentSolution = numpy.full(len(self.position), numpy.inf)
+        if(evaluated.any()):
+            self.currentSolution[evaluated] = self.FX.evaluateArray(self.position[evaluated])
+            self.surrogate.update(self.position[evaluated], self.currentSolution[evaluated])
+        return evaluated
+
+
+    """
+     Runs one batch of chains; construction only configures the
+     annealer, as for SimulatedAnnealing.run().
+
+     @param positions: (n, D) starting coord vectors (None :: carry
+         on from the current chain coords)
+
+     @return: Returns the best solution of every chain.
+     """
+    def run(self, positions=None):
+        self.reset(positions)
+        self.SA()
+        return self.bestSolution
+
+
+    """
+     Clears the counters and best values for a new batch.
+
+     @param positions: (n, D) starting coord vectors (None :: the
+         current chain coords)
+     """
+    def reset(self, positions=None):
+        if(positions is None):
+            positions = self.position
+        self.setVariables(positions)
+
+
+    """
+     Resets the instance arrays and sets the chain coords to the
+     passed parameters. One chain is created per coordinate vector.
+
+     @param positions: (n, D) array of associated coord vectors
+     """
+    def setVariables(self, positions):
+        self.position = numpy.array(positions, dtype=float)
+        size = len(self.position)
+        """ reset instance arrays """
+        self.currentTemp = numpy.full(size, float(self.initialTemp))
+        self.currentSolution = numpy.full(size, numpy.nan)
+        self.bestSolution = numpy.full(size, numpy.inf)
+        self.bestPosition = self.position.copy()
+        self.totalMoves = numpy.zeros(size, dtype=numpy.int64)
+        self.movesAccepted = numpy.zeros(size, dtype=numpy.int64)
+        self.movesToTarget = numpy.zeros(size, dtype=numpy.int64)
+        self.targetHits = numpy.zeros(size, dtype=numpy.int64)
+        self.resets = numpy.zeros(size, dtype=numpy.int64)
+        self.stopReason = None
+
+
+    """
+     Basic accessor methods. Each returns one entry per chain.
+
+     @return: currentTemp --   current chain temperatures
+     @return: bestSolution --  best known solutions
+     @return: bestPosition --  (n, D) coord vectors for best solutions
+     @return: totalMoves --    total moves attempted
+     @return: movesAccepted -- accepted moves
+     @return: movesToTarget -- moves to target value
+     @return: evaluations --   moves attempted by the whole batch
+     @return: stopReason --    why the last run stopped early, if it did
+     """
+    def getCurrentTemp(self):
+        return self.currentTemp
+
+    def getBestSolution(self):
+        return self.bestSolution
+
+    def getBestPosition(self):
+        return self.bestPosition
+
+    def getTotalMoves(self):
+        return self.totalMoves
+
+    def getMovesAccepted(self):
+        return self.movesAccepted
+
+    def getMovesToTarget(self):
+        return self.movesToTarget
+
+    def getEvaluations(self):
+        return int(self.totalMoves.sum())
+
+    def getStopReason(self):
+        return self.stopReason
+
+
+    """
+     Sets and returns the external iterations of the next runs.
+
+     @param value: New external iteration count.
+     """
+    def setExternal(self, value):
+        self.external = value
+
+    def getExternal(self):
+        return self.external
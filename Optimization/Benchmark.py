@@ -0,0 +1,370 @@
+""" Python Package Support """
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+import numpy
+
+""" Internal Package Support """
+from SimulatedAnnealing import SimulatedAnnealing
+from Hive import Hive
+from ArrayHive import ArrayHive
+from Swarm import Swarm
+from Telemetry import Telemetry, GOAL
+from Objectives import getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 4
+
+    Throughput benchmarks for the swarm/annealing hybrid. Runs
+    SimulatedAnnealing, Hive.SimAnn and Swarm.updateWithVels over a
+    matrix of objectives, population sizes, iteration counts and
+    annealing modes, and records evaluations per second, wall time per
+    swarm iteration, peak traced memory and the time and evaluations
+    needed to reach the known goal of each objective. Hive memory is
+    measured per particle for both population layouts.
+
+    Every result is printed as a JSON line; --output also writes the
+    whole suite to a file, so a later run can be compared against it
+    to catch regressions ::
+
+        python Benchmark.py --output baseline.json
+        python Benchmark.py --preset full --compare baseline.json
+"""
+
+TOLERANCE = 0.00005                     # Same reach as the SA goal check
+PSO_SETTINGS = (2.05, 2.05, 1.0, .7298) # phi1, phi2, inertia, kappa
+
+PRESETS = {
+    "quick": {"functions": [1, 2],
+              "populations": [10, 100],
+              "external": [20],
+              "internal": 50,
+              "swarmIterations": [3],
+              "modes": ["scalar", "batch"],
+              "memoryPopulations": [10000],
+              "layouts": ["particles", "arrays"]},
+    "full":  {"functions": [1, 2],
+              "populations": [10, 100, 1000],
+              "external": [100, 1000],
+              "internal": 250,
+              "swarmIterations": [5, 20],
+              "modes": ["scalar", "batch", "parallel"],
+              "memoryPopulations": [10000, 100000],
+              "layouts": ["particles", "arrays"]},
+}
+
+
+"""
+---------------------------------------
+CLASS :: GoalWatch
+---------------------------------------
+
+ Telemetry sink noting when and after how many moves the first
+ GOAL event arrived.
+ """
+class GoalWatch(object):
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.seconds = None
+        self.moves = None
+
+    def __call__(self, event, fields):
+        if(event == GOAL and self.seconds is None):
+            self.seconds = time.perf_counter() - self.start
+            self.moves = fields["totalMoves"]
+
+
+"""
+ Benchmarks one SA chain from a random start.
+
+ @param funcNum:  Objective key
+ @param extIters: External iterations
+ @param intIters: Internal iterations
+
+ @return: result dict
+ """
+def benchSimulatedAnnealing(funcNum, extIters, intIters):
+    telemetry = Telemetry()
+    sim = SimulatedAnnealing(funcNum, 100, extIters, intIters, .975,
+                             True, True, telemetry)
+    watch = telemetry.attach(GoalWatch())
+    start = time.perf_counter()
+    sim.run()
+    seconds = time.perf_counter() - start
+    return {"case": "SimulatedAnnealing",
+            "function": funcNum,
+            "external": extIters,
+            "internal": intIters,
+            "seconds": seconds,
+            "evaluations": sim.getTotalMoves(),
+            "evalsPerSecond": sim.getTotalMoves()/seconds,
+            "bestCost": sim.getBestSolution(),
+            "secondsToTarget": watch.seconds,
+            "evalsToTarget": watch.moves}
+
+
+"""
+ Benchmarks one Hive.SimAnn() call.
+
+ @param funcNum:  Objective key
+ @param popSize:  Population size
+ @param extIters: External iterations
+ @param intIters: Internal iterations
+ @param mode:     Hive annealing mode
+
+ @return: result dict
+ """
+def benchHive(funcNum, popSize, extIters, intIters, mode):
+    telemetry = Telemetry()
+    hive = Hive(popSize, funcNum, mode, seed=1, telemetry=telemetry)
+    hive.setSASettings(100, extIters, intIters, .975, True, True)
+    evaluations = hive.getEvaluations()
+    watch = telemetry.attach(GoalWatch())
+    start = time.perf_counter()
+    hive.SimAnn()
+    seconds = time.perf_counter() - start
+    hive.shutdown()
+    evaluations = hive.getEvaluations() - evaluations
+    return {"case": "Hive.SimAnn",
+            "function": funcNum,
+            "population": popSize,
+            "external": extIters,
+            "internal": intIters,
+            "mode": mode,
+            "seconds": seconds,
+            "evaluations": evaluations,
+            "evalsPerSecond": evaluations/seconds,
+            "bestCost": min(particle.getBestCost() for particle in hive.getPopulation()),
+            "secondsToTarget": watch.seconds}
+
+
+"""
+ Benchmarks a run of Swarm.updateWithVels() calls.
+
+ @param funcNum:    Objective key
+ @param popSize:    Population size
+ @param extIters:   External iterations of each SA chain
+ @param intIters:   Internal iterations of each SA chain
+ @param iterations: Swarm iterations
+ @param mode:       Hive annealing mode
+
+ @return: result dict
+ """
+def benchSwarm(funcNum, popSize, extIters, intIters, iterations, mode):
+    start = time.perf_counter()
+    swarm = Swarm(popSize, *PSO_SETTINGS, funcNum=funcNum, saMode=mode, seed=1)
+    swarm.getHive().setSASettings(100, extIters, intIters, .975, True, True)
+    secondsToTarget = None
+    evalsToTarget = None
+    iterationSeconds = list()
+    for i in range (iterations):
+        iterationStart = time.perf_counter()
+        swarm.updateWithVels()
+        iterationSeconds.append(time.perf_counter() - iterationStart)
+        if(secondsToTarget is None and
+           swarm.getBestCost() - getObjective(funcNum).goal < TOLERANCE):
+            secondsToTarget = time.perf_counter() - start
+            evalsToTarget = swarm.getEvaluations()
+    seconds = time.perf_counter() - start
+    swarm.getHive().shutdown()
+    return {"case": "Swarm.updateWithVels",
+            "function": funcNum,
+            "population": popSize,
+            "external": extIters,
+            "internal": intIters,
+            "iterations": iterations,
+            "mode": mode,
+            "seconds": seconds,
+            "secondsPerIteration": sum(iterationSeconds)/iterations,
+            "evaluations": swarm.getEvaluations(),
+            "evalsPerSecond": swarm.getEvaluations()/seconds,
+            "bestCost": swarm.getBestCost(),
+            "secondsToTarget": secondsToTarget,
+            "evalsToTarget": evalsToTarget}
+
+
+"""
+ Measures the memory a hive holds once built, and the time to build
+ and sort it.
+
+ @param funcNum: Objective key
+ @param popSize: Population size
+ @param layout:  "particles" for a Hive, "arrays" for an ArrayHive
+
+ @return: result dict
+ """
+def benchHiveMemory(funcNum, popSize, layout):
+    hive = ArrayHive if layout == "arrays" else Hive
+    tracemalloc.start()
+    try:
+        start = time.perf_counter()
+        built = hive(popSize, funcNum, "batch", seed=1)
+        built.sortListFitness()
+        seconds = time.perf_counter() - start
+        held = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del built
+    return {"case": "HiveMemory",
+            "function": funcNum,
+            "population": popSize,
+            "layout": layout,
+            "seconds": seconds,
+            "bytes": held,
+            "bytesPerParticle": held/popSize}
+
+
+"""
+ Runs a benchmark case a second time under tracemalloc, so the
+ timed run is not slowed by tracing.
+
+ @param bench: benchmark function
+ @param args:  its arguments
+
+ @return: peak traced memory in bytes
+ """
+def peakMemory(bench, *args):
+    tracemalloc.start()
+    try:
+        bench(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+"""
+ Builds the list of benchmark cases for a configuration.
+
+ @param config: preset dict
+
+ @return: list of (function, args) pairs
+ """
+def buildCases(config):
+    cases = list()
+    internal = config["internal"]
+    for funcNum in config["functions"]:
+        for extIters in config["external"]:
+            cases.append((benchSimulatedAnnealing, (funcNum, extIters, internal)))
+            for popSize in config["populations"]:
+                for mode in config["modes"]:
+                    cases.append((benchHive, (funcNum, popSize, extIters,
+                                              internal, mode)))
+                    for iterations in config["swarmIterations"]:
+                        cases.append((benchSwarm, (funcNum, popSize, extIters,
+                                                   internal, iterations, mode)))
+        for popSize in config.get("memoryPopulations", ()):
+            for layout in config["layouts"]:
+                cases.append((benchHiveMemory, (funcNum, popSize, layout)))
+    return cases
+
+
+"""
+ Runs every case of a configuration.
+
+ @param config: preset dict
+ @param memory: also record peak traced memory per case
+ @param log:    callable receiving each result as it finishes
+
+ @return: baseline dict holding metadata and results
+ """
+def runSuite(config, memory=True, log=None):
+    results = list()
+    for bench, args in buildCases(config):
+        result = bench(*args)
+        if(memory and "bytes" not in result):
+            result["peakMemory"] = peakMemory(bench, *args)
+        results.append(result)
+        if(log is not None):
+            log(result)
+    return {"meta": {"python": sys.version.split()[0],
+                     "numpy": numpy.__version__,
+                     "platform": platform.platform(),
+                     "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")},
+            "config": config,
+            "results": results}
+
+
+"""
+ Identifies a result within a baseline by its case parameters.
+ """
+def caseKey(result):
+    return tuple((name, result.get(name)) for name in
+                 ("case", "function", "population", "external",
+                  "internal", "iterations", "mode", "layout"))
+
+
+"""
+ Compares results against a baseline. Throughput falling, or time
+ per swarm iteration or memory per particle rising, by more than
+ the tolerance counts as a regression.
+
+ @param current:   baseline dict of the current run
+ @param baseline:  baseline dict to compare against
+ @param tolerance: allowed relative slowdown
+
+ @return: list of regression descriptions
+ """
+def compareBaseline(current, baseline, tolerance=0.2):
+    previous = dict((caseKey(result), result) for result in baseline["results"])
+    regressions = list()
+    for result in current["results"]:
+        old = previous.get(caseKey(result))
+        if(old is None):
+            continue
+        if("evalsPerSecond" in result and
+           result["evalsPerSecond"] < old["evalsPerSecond"]*(1 - tolerance)):
+            regressions.append("%s: %.0f evals/s, baseline %.0f" %
+                               (dict(caseKey(result)), result["evalsPerSecond"],
+                                old["evalsPerSecond"]))
+        if("secondsPerIteration" in result and
+           result["secondsPerIteration"] > old["secondsPerIteration"]*(1 + tolerance)):
+            regressions.append("%s: %.3f s/iteration, baseline %.3f" %
+                               (dict(caseKey(result)), result["secondsPerIteration"],
+                                old["secondsPerIteration"]))
+        if("bytesPerParticle" in result and
+           result["bytesPerParticle"] > old["bytesPerParticle"]*(1 + tolerance)):
+            regressions.append("%s: %.0f bytes/particle, baseline %.0f" %
+                               (dict(caseKey(result)), result["bytesPerParticle"],
+                                old["bytesPerParticle"]))
+    return regressions
+
+
+"""
+ Command line entry point.
+ """
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Swarm/annealing throughput benchmarks")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--output", default=None,
+                        help="file receiving the suite (default: results on stdout only)")
+    parser.add_argument("--compare", default=None,
+                        help="baseline file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--no-memory", action="store_true")
+    args = parser.parse_args(argv)
+
+    def log(result):
+        print(json.dumps(result))
+    suite = runSuite(PRESETS[args.preset], not args.no_memory, log)
+    if(args.output is not None):
+        with open(args.output, "w") as stream:
+            json.dump(suite, stream, indent=1)
+    if(args.compare is not None):
+        with open(args.compare) as stream:
+            regressions = compareBaseline(suite, json.load(stream), args.tolerance)
+        for regression in regressions:
+            print("REGRESSION %s" % regression)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+""" Python Package Support """
+import json
+import os
+import tempfile
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 0
+
+    Compact binary checkpoint files for long runs. A checkpoint is a
+    set of named sections, one per component, each a dict of state as
+    returned by the component's getState(). Array entries are stored
+    as raw NumPy arrays in an uncompressed .npz archive, everything
+    else goes into one JSON header, so writing even a large population
+    costs little more than copying its arrays. Files are replaced
+    atomically; an interrupted write leaves the previous checkpoint
+    intact.
+
+    The random state is saved alongside :: NumPy's global generator
+    always, and the Generator of a run given one.
+"""
+
+"""
+ Writes a checkpoint file.
+
+ @param path:     Destination file
+ @param sections: dict of section name -> state dict
+ """
+def writeCheckpoint(path, sections):
+    header = dict()
+    arrays = dict()
+    for name, state in sections.items():
+        header[name] = dict()
+        for key, value in state.items():
+            if(isinstance(value, numpy.ndarray)):
+                arrays[name + "/" + key] = value
+            else:
+                header[name][key] = value
+    arrays["header"] = numpy.array(json.dumps(header))
+    directory = os.path.dirname(os.path.abspath(path))
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as stream:
+            numpy.savez(stream, **arrays)
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+
+"""
+ Reads a checkpoint file written by writeCheckpoint().
+
+ @param path: Checkpoint file
+
+ @return: dict of section name -> state dict
+ """
+def readCheckpoint(path):
+    with numpy.load(path) as archive:
+        sections = json.loads(str(archive["header"]))
+        for entry in archive.files:
+            if(entry != "header"):
+                name, key = entry.split("/", 1)
+                sections[name][key] = archive[entry]
+    return sections
+
+
+"""
+ State of NumPy's global random generator, the source of every
+ random draw in the swarm and the SA chains.
+
+ @return: state dict
+ """
+def getRandomState():
+    algorithm, keys, position, hasGauss, gauss = numpy.random.get_state()
+    return {"algorithm": algorithm,
+            "keys": keys,
+            "position": int(position),
+            "hasGauss": int(hasGauss),
+            "gauss": float(gauss)}
+
+
+"""
+ Restores NumPy's global random generator.
+
+ @param state: state dict from getRandomState()
+ """
+def setRandomState(state):
+    numpy.random.set_state((state["algorithm"], state["keys"], state["position"],
+                            state["hasGauss"], state["gauss"]))
+
+
+"""
+ State of a NumPy Generator, for the runs given their own.
+
+ @param rng: numpy.random.Generator
+
+ @return: state dict
+ """
+def getGeneratorState(rng):
+    return {"state": rng.bit_generator.state}
+
+
+"""
+ Rebuilds a Generator saved by getGeneratorState().
+
+ @param state: state dict
+
+ @return: numpy.random.Generator
+ """
+def newGenerator(state):
+    bitGenerator = getattr(numpy.random, state["state"]["bit_generator"])()
+    bitGenerator.state = state["state"]
+    return numpy.random.Generator(bitGenerator)
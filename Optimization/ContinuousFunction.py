@@ -0,0 +1,257 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B
+
+    Shared representation of a D-dimensional Continuous Space problem.
+    The current and best coordinates are held as NumPy vectors, so the
+    bounds wrapping and the neighborhood moves are array arithmetic
+    whatever the dimension. Concrete problems supply the domain bounds
+    and the cost itself through cost() and solveArray().
+"""
+
+class ContinuousFunction(object):
+
+    lower = None                # Lower domain bound, scalar or per coordinate
+    upper = None                # Upper domain bound, scalar or per coordinate
+    initLower = None            # Lower bound for random starting values
+    initUpper = None            # Upper bound for random starting values
+    velocityLimit = None        # Swarm velocity clamp (None :: 10% of width)
+    wrap = True                 # Wrap coords around the domain, else clip
+    defaultDimensions = 2       # Dimensions when scalar bounds are given
+
+    """
+     Object initialization. Sentinel values set on bestSolution.
+     Random uniform generation for each coordinate value.
+
+     @param dimensions: Number of coordinates. Problems with per
+         coordinate bounds are fixed to the length of those bounds.
+     @param rng:        NumPy Generator for the starting values (None ::
+         the global numpy.random generator)
+     @param evaluate:   Solve at the starting values; False leaves that
+         to a caller evaluating many instances at once, see
+         setSolution()
+     """
+    def __init__(self, dimensions=None, rng=None, evaluate=True):
+        if(numpy.ndim(self.lower) == 0):
+            dimensions = dimensions or self.defaultDimensions
+        elif(dimensions is not None and dimensions != len(self.lower)):
+            raise ValueError("%s is fixed to %d dimensions" %
+                             (self.__class__.__name__, len(self.lower)))
+        else:
+            dimensions = len(self.lower)
+        self.dimensions = dimensions
+        self.lower = numpy.broadcast_to(numpy.asarray(self.lower, dtype=float),
+                                        (dimensions,)).copy()
+        self.upper = numpy.broadcast_to(numpy.asarray(self.upper, dtype=float),
+                                        (dimensions,)).copy()
+        self.width = self.upper - self.lower
+        if(self.initLower is None):
+            self.initLower = self.lower
+            self.initUpper = self.upper
+        if(self.velocityLimit is None):
+            self.velocityLimit = 0.1*self.width
+        self.velocityLimit = numpy.broadcast_to(numpy.asarray(self.velocityLimit, dtype=float),
+                                                (dimensions,)).copy()
+        """ random seed generation """
+        random = numpy.random if rng is None else rng
+        self.position = random.uniform(self.initLower, self.initUpper,
+                                       self.dimensions)
+        """ variable initialization """
+        self.currentSolution = 0
+        self.bestSolution = float("inf")
+        self.bestPosition = numpy.zeros(self.dimensions)
+        self.cache = None                    # Optional EvaluationCache
+        """ setup """
+        if(evaluate):
+            self.solve()
+
+
+    """
+     Solves the function for the current coordinate vector. Also
+     updates superlative variables.
+
+     @return: currentSolution -- current cost evaluation
+     """
+    def solve(self):
+        if(self.cache is None):
+            self.currentSolution = self.cost(self.position)
+        else:
+            self.currentSolution = self.cache.evaluate(self.position, self.cost)
+        if self.currentSolution < self.bestSolution:
+            self.bestSolution = self.currentSolution
+            self.bestPosition = self.position.copy()
+        return self.currentSolution
+
+
+    """
+     Takes the cost of the current coordinate vector, evaluated
+     elsewhere, as solve() would have set it.
+
+     @param cost: cost evaluation at the current position
+     """
+    def setSolution(self, cost):
+        self.currentSolution = cost
+        if cost < self.bestSolution:
+            self.bestSolution = cost
+            self.bestPosition = self.position.copy()
+
+
+    """
+     Cost of a single coordinate vector.
+
+     @param position: coordinate vector
+
+     @return: cost evaluation
+     """
+    def cost(self, position):
+        return float(self.solveArray(position[numpy.newaxis, :])[0])
+
+
+    """
+     Cost of a whole (n, D) array of coordinate vectors at once. Does
+     not touch the instance variables.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of n cost evaluations
+     """
+    def solveArray(self, positions):
+        raise NotImplementedError
+
+
+    """
+     Array entry point used by the annealers. Goes through the
+     evaluation cache when one is set, solveArray() otherwise.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of n cost evaluations
+     """
+    def evaluateArray(self, positions):
+        if(self.cache is None):
+            return self.solveArray(positions)
+        return self.cache.evaluateArray(positions, self.solveArray)
+
+
+    """
+     Checks the passed coordinate vector and then solves at it.
+
+     @param newPosition: New coordinate vector.
+
+     @return: currentSolution -- current cost evaluation
+     """
+    def processValues(self, newPosition):
+        self.checkSetPosition(newPosition)
+        return self.solve()
+
+
+    """
+     Verifies the passed vector lies within the domain, wrapping
+     (or, without wrap, clipping) coordinates that left it back
+     inside, and assigns it.
+
+     @param newInput: Vector to be verified and assigned.
+     """
+    def checkSetPosition(self, newInput):
+        self.position = self.checkArray(newInput)
+
+
+    """
+     Array counterpart of checkSetPosition. Works on a single vector
+     or on an (n, D) array of them; the instance variables are
+     untouched.
+
+     @param values: coordinate values to be verified
+
+     @return: wrapped coordinate values
+     """
+    def checkArray(self, values):
+        values = numpy.asarray(values, dtype=float)
+        over = values > self.upper
+        under = values < self.lower
+        if over.any() or under.any():
+            if(self.wrap):
+                values = values - self.width*over + self.width*under
+            else:
+                values = numpy.clip(values, self.lower, self.upper)
+        return values
+
+
+    """
+     Sets the coordinate vector. Used to reset values if move is NOT
+     made.
+
+     @param position: old coordinate vector
+     """
+    def setVars(self, position):
+        self.position = numpy.array(position, dtype=float)
+
+
+    """
+     Sets the coordinate vector and the superlative variables to an
+     externally found solution, e.g. an SA result.
+
+     @param position: coordinate vector of the solution
+     @param cost:     cost evaluation of the solution
+     """
+    def setBest(self, position, cost):
+        self.setVars(position)
+        self.bestPosition = self.position.copy()
+        self.bestSolution = cost
+
+
+    """
+     Sets the evaluation cache consulted by solve() and
+     evaluateArray(); None disables caching.
+
+     @param cache: EvaluationCache or None
+     """
+    def setCache(self, cache):
+        self.cache = cache
+
+
+    """
+     Prints an updated administrative report.
+     """
+    def admin(self):
+        print("<-- %s Report -->" % self.__class__.__name__)
+        print("  BestSol: %s" % self.getBestCost())
+        print("  Best:    %s" % self.getBestPosition())
+
+
+    """
+     Basic accessor methods.
+
+     @return: position -- current coordinate vector
+     @return: currentSolution -- current cost evaluation
+     @return: bestPosition -- coordinate vector for best solution
+     @return: bestSolution -- best cost evaluation
+     @return: dimensions -- number of coordinates
+     @return: cache -- evaluation cache, if any
+     """
+    def getPosition(self):
+        return self.position
+
+    def getCurrentCost(self):
+        return self.currentSolution
+
+    def getBestPosition(self):
+        return self.bestPosition
+
+    def getBestCost(self):
+        return self.bestSolution
+
+    def getDimensions(self):
+        return self.dimensions
+
+    def getCache(self):
+        return self.cache
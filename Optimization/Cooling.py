@@ -0,0 +1,250 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1A-Cooling
+
+    Cooling schedules and step size control for the SA levels. A
+    schedule is asked for the next temperature once per external
+    iteration and a step control for the next move scale, so both see
+    the chain at the same granularity as the temperature updates of
+    the original algorithm.
+
+    Every rule is written with NumPy element-wise operations, so the
+    same object drives a scalar SimulatedAnnealing chain (plain floats)
+    and a BatchSimulatedAnnealing batch (one entry per chain).
+
+    Schedules ::   GeometricCooling   -- T*alpha, reset below a floor
+                                         (the original behavior)
+                   LogarithmicCooling -- T0/(1 + c*ln(1 + k))
+                   LundyMeesCooling   -- T/(1 + beta*T)
+                   ReheatingCooling   -- any of the above, reheated
+                                         after a stagnation window
+"""
+
+class CoolingSchedule(object):
+
+    """
+     Called at the start of every SA run.
+
+     @param initialTemp: Initial temperature
+     @param external:    External iterations of the run
+     @param alpha:       The SA's move control value
+     @param temp:        Starting temperature, a float or one entry
+                          per chain
+     """
+    def start(self, initialTemp, external, alpha, temp):
+        self.initialTemp = initialTemp
+        self.external = external
+        self.alpha = alpha
+
+
+    """
+     Next temperature after an external iteration.
+
+     @param temp:     Current temperature(s)
+     @param improved: Whether the best solution improved during the
+                       iteration, per chain for a batch
+
+     @return: new temperature(s)
+     """
+    def update(self, temp, improved):
+        raise NotImplementedError
+
+
+    """
+     Re-enters the schedule at a raised temperature, for the chains
+     selected by the mask.
+
+     @param mask: True for the chains being reheated
+     @param temp: Temperature they are reheated to
+     """
+    def restart(self, mask, temp):
+        pass
+
+
+"""
+---------------------------------------
+CLASS :: GeometricCooling
+---------------------------------------
+
+ T = T*alpha, back to the initial temperature once T falls below the
+ floor. The default schedule, identical to the original SA.
+ """
+class GeometricCooling(CoolingSchedule):
+
+    """
+     @param alpha: Cooling factor (None :: the SA's move control)
+     @param floor: Temperature at which the chain resets
+     """
+    def __init__(self, alpha=None, floor=1.0):
+        self.factor = alpha
+        self.floor = floor
+
+    def update(self, temp, improved):
+        temp = temp*(self.alpha if self.factor is None else self.factor)
+        return numpy.where(temp < self.floor, self.initialTemp, temp)
+
+
+"""
+---------------------------------------
+CLASS :: LogarithmicCooling
+---------------------------------------
+
+ T = T0/(1 + c*ln(1 + k)) after k external iterations. Cools slowly
+ and never resets.
+ """
+class LogarithmicCooling(CoolingSchedule):
+
+    """
+     @param c: Cooling speed
+     """
+    def __init__(self, c=1.0):
+        self.c = c
+
+    def start(self, initialTemp, external, alpha, temp):
+        CoolingSchedule.start(self, initialTemp, external, alpha, temp)
+        self.step = numpy.zeros_like(temp, dtype=float)
+
+    def update(self, temp, improved):
+        self.step = self.step + 1
+        return self.initialTemp/(1 + self.c*numpy.log1p(self.step))
+
+    def restart(self, mask, temp):
+        step = numpy.expm1((self.initialTemp/temp - 1)/self.c)
+        self.step = numpy.where(mask, step, self.step)
+
+
+"""
+---------------------------------------
+CLASS :: LundyMeesCooling
+---------------------------------------
+
+ T = T/(1 + beta*T). Without a beta, one is chosen so the run cools
+ from the initial to the final temperature over its external
+ iterations.
+ """
+class LundyMeesCooling(CoolingSchedule):
+
+    """
+     @param beta:      Cooling speed (None :: derived from finalTemp)
+     @param finalTemp: Temperature reached on the last iteration
+     """
+    def __init__(self, beta=None, finalTemp=1.0):
+        self.beta = beta
+        self.finalTemp = finalTemp
+
+    def start(self, initialTemp, external, alpha, temp):
+        CoolingSchedule.start(self, initialTemp, external, alpha, temp)
+        self.rate = self.beta
+        if(self.rate is None):
+            self.rate = ((initialTemp - self.finalTemp) /
+                         (max(1, external)*initialTemp*self.finalTemp))
+
+    def update(self, temp, improved):
+        return temp/(1 + self.rate*temp)
+
+
+"""
+---------------------------------------
+CLASS :: ReheatingCooling
+---------------------------------------
+
+ Wraps another schedule and reheats a chain whose best solution has
+ not improved for a number of external iterations.
+ """
+class ReheatingCooling(CoolingSchedule):
+
+    """
+     @param schedule: Underlying schedule (None :: GeometricCooling)
+     @param patience: External iterations allowed without improvement
+     @param fraction: Reheat temperature, as a fraction of the initial
+                       temperature
+     """
+    def __init__(self, schedule=None, patience=10, fraction=0.5):
+        self.schedule = schedule or GeometricCooling()
+        self.patience = patience
+        self.fraction = fraction
+
+    def start(self, initialTemp, external, alpha, temp):
+        CoolingSchedule.start(self, initialTemp, external, alpha, temp)
+        self.schedule.start(initialTemp, external, alpha, temp)
+        self.stalled = numpy.zeros_like(temp, dtype=numpy.int64)
+
+    def update(self, temp, improved):
+        temp = self.schedule.update(temp, improved)
+        self.stalled = numpy.where(improved, 0, self.stalled + 1)
+        reheat = self.stalled >= self.patience
+        if(numpy.any(reheat)):
+            reheatTemp = self.fraction*self.initialTemp
+            reheat = reheat & (temp < reheatTemp)
+            self.schedule.restart(reheat, reheatTemp)
+            temp = numpy.where(reheat, reheatTemp, temp)
+            self.stalled = numpy.where(reheat, 0, self.stalled)
+        return temp
+
+
+"""
+---------------------------------------
+CLASS :: AcceptanceStepControl
+---------------------------------------
+
+ Move size control steering the acceptance ratio of each external
+ iteration, taken from the SA's totalMoves and movesAccepted
+ counters, towards a target. The scale multiplies the neighborhood
+ range and replaces the temperature scaling of local search. Only
+ the "metropolis" acceptance rejects moves, so the annealers refuse
+ it under "legacy".
+ """
+class AcceptanceStepControl(object):
+
+    """
+     @param target:   Acceptance ratio aimed for
+     @param factor:   Scale change per external iteration
+     @param minScale: Smallest scale, relative to the range
+     @param maxScale: Largest scale, relative to the range
+     """
+    def __init__(self, target=0.4, factor=1.25, minScale=1e-4, maxScale=1.0):
+        self.target = target
+        self.factor = factor
+        self.minScale = minScale
+        self.maxScale = maxScale
+
+
+    """
+     Called at the start of every SA run.
+
+     @param size: None for a scalar chain, else the number of chains
+     """
+    def start(self, size=None):
+        self.scale = self.maxScale if size is None else numpy.full(size, float(self.maxScale))
+        self.moves = 0
+        self.accepted = 0
+
+
+    """
+     Adjusts the scale after an external iteration.
+
+     @param totalMoves:    Moves attempted so far
+     @param movesAccepted: Moves accepted so far
+
+     @return: new scale(s)
+     """
+    def update(self, totalMoves, movesAccepted):
+        moves = totalMoves - self.moves
+        ratio = (movesAccepted - self.accepted)/numpy.maximum(moves, 1)
+        self.moves = totalMoves
+        self.accepted = movesAccepted
+        scale = numpy.where(ratio > self.target, self.scale*self.factor,
+                            self.scale/self.factor)
+        self.scale = numpy.clip(scale, self.minScale, self.maxScale)
+        if(numpy.ndim(self.scale) == 0):
+            self.scale = float(self.scale)
+        return self.scale
@@ -0,0 +1,315 @@
+""" Python Package Support """
+import argparse
+import concurrent.futures
+import os
+import random
+import sys
+import time
+import numpy
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Stopping import StoppingCriteria
+from Objectives import getObjective
+from Telemetry import Telemetry, JsonlSink, CsvSink, GLOBAL_BEST, CHAIN, RUN
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 4
+
+    Multi-seed ensembles of independent Swarm runs for success rate
+    reporting. Runs are spread over a process pool, each with its own
+    seed, and every run is emitted as a RUN telemetry event the moment
+    it finishes, so results stream to CSV/JSONL sinks in completion
+    order. EnsembleStats keeps the aggregate up to date as runs come
+    in ::
+
+        python Ensemble.py --function 2 --runs 50 --csv runs.csv
+"""
+
+PSO_SETTINGS = (2.05, 2.05, 1.0, .7298) # phi1, phi2, inertia, kappa
+CSV_COLUMNS = ["run", "seed", "function", "mode", "bestCost", "bestX", "bestY",
+               "evaluations", "iterations", "seconds", "success",
+               "secondsToTarget", "evalsToTarget", "movesToTarget", "stopReason"]
+
+
+class Ensemble(object):
+
+    """
+     Constructor. Every member run uses the same configuration.
+
+     @param popSize:        Swarm size
+     @param funcNum:        Objective key, see Objectives.getObjective()
+     @param iterations:     Swarm iterations per run
+     @param saMode:         Hive annealing mode of each run; "scalar",
+                             "batch" or "auto" (runs already occupy the
+                             process pool)
+     @param saSettings:     SA parameters, in Hive.setSASettings() order
+                             (None :: Hive defaults)
+     @param psoSettings:    (phi1, phi2, inertia, kappa)
+     @param maxEvaluations: Evaluation budget per run (None :: no bound)
+     @param tolerance:      Reach of the objective's goal counting as
+                             success
+     @param stopAtTarget:   End a run once it reaches the goal
+     @param workers:        Process count (None :: all cores)
+     @param telemetry:      Telemetry receiving the RUN events
+     """
+    def __init__(self, popSize, funcNum, iterations, saMode="batch",
+                 saSettings=None, psoSettings=PSO_SETTINGS, maxEvaluations=None,
+                 tolerance=0.00005, stopAtTarget=True, workers=None,
+                 telemetry=None):
+        self.settings = {"popSize": popSize,
+                         "function": funcNum,
+                         "iterations": iterations,
+                         "saMode": saMode,
+                         "saSettings": saSettings,
+                         "psoSettings": tuple(psoSettings),
+                         "maxEvaluations": maxEvaluations,
+                         "tolerance": tolerance,
+                         "stopAtTarget": stopAtTarget}
+        self.workers = workers or os.cpu_count() or 1
+        self.telemetry = telemetry or Telemetry()
+        self.stats = EnsembleStats()
+
+
+    """
+     Runs the members and yields each result as it finishes, after
+     emitting it as a RUN event and adding it to the statistics.
+
+     @param runs:  Number of member runs
+     @param seed:  Seed of the per-run seeds (None :: unseeded)
+     @param seeds: Explicit per-run seeds, overriding runs and seed
+
+     @return: generator of result dicts, in completion order
+     """
+    def iterResults(self, runs=None, seed=None, seeds=None):
+        if(seeds is None):
+            seeder = random.Random(seed)
+            seeds = [seeder.getrandbits(32) for i in range (runs)]
+        self.stats.expect(len(seeds))
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            futures = [executor.submit(runMember, self.settings, i, seeds[i])
+                       for i in range (len(seeds))]
+            for future in concurrent.futures.as_completed(futures):
+                result = future.result()
+                self.stats.add(result)
+                if(self.telemetry.active):
+                    self.telemetry.emit(RUN, result)
+                yield result
+
+
+    """
+     Runs the members to completion.
+
+     @param runs:  Number of member runs
+     @param seed:  Seed of the per-run seeds (None :: unseeded)
+     @param seeds: Explicit per-run seeds, overriding runs and seed
+
+     @return: list of result dicts ordered by run number
+     """
+    def run(self, runs=None, seed=None, seeds=None):
+        results = list(self.iterResults(runs, seed, seeds))
+        return sorted(results, key=lambda result: result["run"])
+
+
+    """
+     Returns the live aggregate statistics.
+
+     @return: Returns the EnsembleStats.
+     """
+    def getStats(self):
+        return self.stats
+
+
+"""
+---------------------------------------
+CLASS :: EnsembleStats
+---------------------------------------
+
+ Running aggregate over finished member runs. Percentiles of time
+ and evaluations to target are taken over the successful runs.
+ """
+class EnsembleStats(object):
+
+    def __init__(self):
+        self.expected = 0
+        self.results = list()
+
+
+    """
+     Adds runs still to come to the expected total.
+
+     @param runs: Number of runs launched
+     """
+    def expect(self, runs):
+        self.expected = self.expected + runs
+
+
+    """
+     Adds a finished run.
+
+     @param result: result dict of runMember()
+     """
+    def add(self, result):
+        self.results.append(result)
+
+
+    """
+     Telemetry sink entry point, so the statistics can also be fed
+     from RUN events.
+     """
+    def __call__(self, event, fields):
+        if(event == RUN):
+            self.add(fields)
+
+
+    """
+     Returns the aggregate over the runs finished so far.
+
+     @param percentiles: Percentiles reported for the time and
+         evaluations to target
+
+     @return: dict of statistics
+     """
+    def getStats(self, percentiles=(50, 90)):
+        finished = len(self.results)
+        successes = [result for result in self.results if result["success"]]
+        stats = {"finished": finished,
+                 "pending": max(0, self.expected - finished),
+                 "successes": len(successes),
+                 "successRate": len(successes)/finished if finished else None,
+                 "bestCost": min((result["bestCost"] for result in self.results),
+                                 default=None),
+                 "medianCost": float(numpy.median([result["bestCost"]
+                                                   for result in self.results]))
+                               if finished else None}
+        seconds = [result["secondsToTarget"] for result in successes]
+        evaluations = [result["evalsToTarget"] for result in successes]
+        for p in percentiles:
+            stats["secondsToTarget_p%d" % p] = float(numpy.percentile(seconds, p)) if seconds else None
+            stats["evalsToTarget_p%d" % p] = float(numpy.percentile(evaluations, p)) if evaluations else None
+        return stats
+
+
+"""
+---------------------------------------
+CLASS :: TargetWatch
+---------------------------------------
+
+ Telemetry sink of a member run noting when the swarm's global best
+ first reached the goal, and the moves the first SA chain to land on
+ the goal needed.
+ """
+class TargetWatch(object):
+
+    def __init__(self, swarm, goal, tolerance, start):
+        self.swarm = swarm
+        self.goal = goal
+        self.tolerance = tolerance
+        self.start = start
+        self.seconds = None
+        self.evaluations = None
+        self.movesToTarget = None
+        self.check(swarm.getBestCost())
+
+    def __call__(self, event, fields):
+        if(event == GLOBAL_BEST):
+            self.check(fields["bestCost"])
+        elif(event == CHAIN and self.movesToTarget is None and
+             fields.get("movesToTarget")):
+            self.movesToTarget = fields["movesToTarget"]
+
+    def check(self, cost):
+        if(self.seconds is None and cost - self.goal < self.tolerance):
+            self.seconds = time.perf_counter() - self.start
+            self.evaluations = self.swarm.getEvaluations()
+
+
+"""
+ Worker for Ensemble. Runs one Swarm on a Generator of its own seed,
+ leaving the global numpy.random state alone.
+
+ @param settings: Ensemble settings dict
+ @param runID:    Run number within the ensemble
+ @param seed:     Seed of the run
+
+ @return: result dict
+ """
+def runMember(settings, runID, seed):
+    objective = getObjective(settings["function"])
+    start = time.perf_counter()
+    telemetry = Telemetry()
+    swarm = Swarm(settings["popSize"], *settings["psoSettings"], funcNum=objective,
+                  saMode=settings["saMode"], seed=seed, telemetry=telemetry,
+                  rng=numpy.random.default_rng(seed))
+    watch = telemetry.attach(TargetWatch(swarm, objective.goal,
+                                         settings["tolerance"], start))
+    if(settings["saSettings"] is not None):
+        swarm.getHive().setSASettings(*settings["saSettings"])
+    stopping = StoppingCriteria(settings["maxEvaluations"],
+                                objective.goal if settings["stopAtTarget"] else None,
+                                settings["tolerance"])
+    swarm.run(settings["iterations"], stopping)
+    swarm.getHive().shutdown()
+    position = swarm.getBestPosition()
+    return {"run": runID,
+            "seed": seed,
+            "function": objective.name,
+            "mode": swarm.getHive().saMode,
+            "bestCost": float(swarm.getBestCost()),
+            "bestX": float(position[0]),
+            "bestY": float(position[1]) if len(position) > 1 else None,
+            "bestPosition": position.tolist(),
+            "evaluations": int(swarm.getEvaluations()),
+            "iterations": swarm.runIterations,
+            "seconds": time.perf_counter() - start,
+            "success": watch.seconds is not None,
+            "secondsToTarget": watch.seconds,
+            "evalsToTarget": watch.evaluations,
+            "movesToTarget": watch.movesToTarget,
+            "stopReason": swarm.getStopReason()}
+
+
+"""
+ Command line entry point.
+ """
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-seed swarm/annealing ensembles")
+    parser.add_argument("--function", default="2")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--population", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--mode", default="batch")
+    parser.add_argument("--max-evaluations", type=int, default=None)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--csv", default=None)
+    parser.add_argument("--jsonl", default=None)
+    args = parser.parse_args(argv)
+
+    function = int(args.function) if args.function.isdigit() else args.function
+    telemetry = Telemetry()
+    if(args.csv is not None):
+        telemetry.attach(CsvSink(args.csv, RUN, CSV_COLUMNS))
+    if(args.jsonl is not None):
+        telemetry.attach(JsonlSink(args.jsonl, 1))
+    ensemble = Ensemble(args.population, function, args.iterations, args.mode,
+                        maxEvaluations=args.max_evaluations, workers=args.workers,
+                        telemetry=telemetry)
+    try:
+        for result in ensemble.iterResults(args.runs, args.seed):
+            stats = ensemble.getStats().getStats()
+            print("run %d: cost %.6f -- %d/%d finished, success rate %.2f" %
+                  (result["run"], result["bestCost"], stats["finished"],
+                   stats["finished"] + stats["pending"], stats["successRate"]))
+    finally:
+        telemetry.close()
+    print(ensemble.getStats().getStats())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+""" Python Package Support """
+import collections
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B
+
+    Bounded LRU cache of objective evaluations. Coordinates are
+    quantized to a fixed resolution before lookup, so points closer
+    than the resolution share one entry; late-stage SA chains that
+    keep revisiting the same neighborhood are then served from the
+    cache instead of re-running the objective. Worth enabling when the
+    objective costs far more than a dictionary lookup.
+"""
+
+class EvaluationCache(object):
+
+    """
+     Constructor.
+
+     @param resolution: Quantization step applied to every coordinate
+     @param maxSize:    Entries kept before least recently used ones
+                        are evicted
+     """
+    def __init__(self, resolution=1e-6, maxSize=100000):
+        self.resolution = resolution
+        self.maxSize = maxSize
+        self.entries = collections.OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+
+    """
+     Quantized lookup key of a coordinate vector.
+
+     @param position: coordinate vector
+
+     @return: hashable key
+     """
+    def key(self, position):
+        return numpy.rint(numpy.asarray(position)/self.resolution).astype(numpy.int64).tobytes()
+
+
+    """
+     Cost of a coordinate vector, from the cache when possible.
+
+     @param position: coordinate vector
+     @param cost:     callable computing the cost on a miss
+
+     @return: cost evaluation
+     """
+    def evaluate(self, position, cost):
+        key = self.key(position)
+        value = self.entries.get(key)
+        if(value is not None):
+            self.hits = self.hits + 1
+            self.entries.move_to_end(key)
+            return value
+        self.misses = self.misses + 1
+        value = cost(position)
+        self.store(key, value)
+        return value
+
+
+    """
+     Costs of an (n, D) array of coordinate vectors, computing only
+     the rows not in the cache, in one array call. Rows sharing a key
+     are computed once; the repeats count as hits.
+
+     @param positions: (n, D) array of coordinate vectors
+     @param solveArray: callable costing an array of rows
+
+     @return: array of n cost evaluations
+     """
+    def evaluateArray(self, positions, solveArray):
+        positions = numpy.asarray(positions, dtype=float)
+        keys = [row.tobytes() for row in
+                numpy.rint(positions/self.resolution).astype(numpy.int64)]
+        costs = numpy.empty(len(keys))
+        missing = dict()                       # key -> rows waiting on it
+        for i in range (len(keys)):
+            value = self.entries.get(keys[i])
+            if(value is None):
+                missing.setdefault(keys[i], list()).append(i)
+            else:
+                self.entries.move_to_end(keys[i])
+                costs[i] = value
+        self.hits = self.hits + len(keys) - len(missing)
+        self.misses = self.misses + len(missing)
+        if(missing):
+            rows = [waiting[0] for waiting in missing.values()]
+            computed = numpy.asarray(solveArray(positions[rows]), dtype=float)
+            for (key, waiting), value in zip(missing.items(), computed.tolist()):
+                costs[waiting] = value
+                self.store(key, value)
+        return costs
+
+
+    """
+     Stores a value under a key, evicting the least recently used
+     entry once the cache is full.
+     """
+    def store(self, key, value):
+        self.entries[key] = value
+        if(len(self.entries) > self.maxSize):
+            self.entries.popitem(last=False)
+            self.evictions = self.evictions + 1
+
+
+    """
+     Adds counters gathered elsewhere, e.g. by a worker process.
+     """
+    def addCounts(self, hits, misses, evictions=0):
+        self.hits = self.hits + hits
+        self.misses = self.misses + misses
+        self.evictions = self.evictions + evictions
+
+
+    def clear(self):
+        self.entries.clear()
+
+
+    """
+     Returns the entries, least recently used first, and the counters
+     for a checkpoint.
+
+     @return: state dict
+     """
+    def getState(self):
+        keys = b"".join(self.entries.keys())
+        return {"resolution": self.resolution,
+                "maxSize": self.maxSize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "keyLength": len(next(iter(self.entries))) if self.entries else 0,
+                "keys": numpy.frombuffer(keys, dtype=numpy.uint8),
+                "values": numpy.array(list(self.entries.values()), dtype=float)}
+
+
+    """
+     Restores entries and counters saved by getState().
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        self.resolution = state["resolution"]
+        self.maxSize = state["maxSize"]
+        self.hits = state["hits"]
+        self.misses = state["misses"]
+        self.evictions = state["evictions"]
+        self.entries = collections.OrderedDict()
+        if(state["keyLength"]):
+            keys = state["keys"].reshape(-1, state["keyLength"])
+            for key, value in zip(keys, state["values"].tolist()):
+                self.entries[key.tobytes()] = value
+
+
+    """
+     Returns the counters.
+
+     @return: dict of hits, misses, evictions, size and hit rate
+     """
+    def getStats(self):
+        lookups = self.hits + self.misses
+        return {"hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self.entries),
+                "hitRate": self.hits/lookups if lookups else 0.0}
+
+    def __len__(self):
+        return len(self.entries)
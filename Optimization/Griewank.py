@@ -0,0 +1,40 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from ContinuousFunction import ContinuousFunction
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B-Zeta
+
+    Standard N-dimensional test problem for load testing the hybrid.
+
+    This is the Griewank Function, many shallow, regularly spaced
+    local minima over a wide domain.
+    Known optimum at ::   0 at (0, ..., 0)
+"""
+
+class Griewank(ContinuousFunction):
+
+    lower = -600
+    upper = 600
+    defaultDimensions = 10
+
+
+    """
+     Solves the Griewank Function for a whole (n, D) array of
+     coordinates at once. Does not touch the instance variables.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of cost evaluations
+     """
+    def solveArray(self, positions):
+        positions = numpy.asarray(positions, dtype=float)
+        scale = numpy.sqrt(numpy.arange(1, positions.shape[-1] + 1))
+        return (numpy.sum(positions*positions, axis=-1)/4000
+                - numpy.prod(numpy.cos(positions/scale), axis=-1) + 1)
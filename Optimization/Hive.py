@@ -1,10 +1,18 @@
 """ Python Package Support """
 import random
+import os
+import numpy
+import concurrent.futures
 
 """ Internal Package Support """
-from FunctionOne import FunctionOne
-from FunctionTwo import FunctionTwo
+from Objectives import getObjective
 from SimulatedAnnealing import SimulatedAnnealing
+from BatchAnnealing import BatchSimulatedAnnealing
+from Tempering import ReplicaExchange
+from Telemetry import Telemetry, CHAIN
+from Stopping import TARGET
+from EvaluationCache import EvaluationCache
+from Profiling import Profiler, ANNEALING, SORTING
 
 """
     @author:     Matthew J Swann
@@ -21,10 +29,52 @@ class Hive(object):
      population.
      
      @param popSize: Size of the hive cluster.
+     @param funcNum: Objective name, ObjectiveDefinition, or number
+         1 or (other) :: control for the Function class to be evaluated
+     @param saMode:  "scalar" anneals particles one at a time,
+         "batch" anneals the whole hive as one vectorized batch,
+         "parallel" spreads the scalar runs over a process pool,
+         "tempering" anneals the whole hive as one batch of replica
+         exchange ladders (see setTempering()),
+         "auto" picks one from the objective's capabilities
+     @param workers: Process count for "parallel" (None :: all cores)
+     @param seed:    Seed for the per-particle SA seeds in "parallel"
+     @param telemetry: Telemetry receiving the SA events
+     @param stopping: StoppingCriteria bounding SimAnn(); see
+         setStopping()
+     @param cache:   EvaluationCache shared by the SA chains, or None.
+         In "parallel" each worker process keeps its own cache with
+         the same settings and reports its counters back.
+     @param rng:     NumPy Generator the hive and its SA chains draw
+         from (None :: the global numpy.random generator). In
+         "parallel" every chain gets its own stream spawned from it,
+         so the results do not depend on the worker count.
      """
-    def __init__(self, popSize, funcNum):
-        self.function = funcNum
+    def __init__(self, popSize, funcNum, saMode="scalar", workers=None,
+                 seed=None, telemetry=None, stopping=None, cache=None,
+                 rng=None):
+        self.objective = getObjective(funcNum)
+        self.function = self.objective
         self.populationSize = popSize
+        self.workers = workers or os.cpu_count() or 1
+        self.saMode = saMode
+        if(saMode == "auto"):
+            self.saMode = self.autoMode()
+        self.seeder = random.Random(seed)   # Source of per-particle SA seeds
+        self.executor = None                # Lazily created process pool
+        self.telemetry = telemetry or Telemetry()
+        self.saSettings = (100, 1000, 250, .975, True, True)
+        self.saOptions = dict()             # Schedule, step control, acceptance
+        self.annealer = None                # SA reused across SimAnn() calls
+        self.batchSize = None               # Chains per "batch" run (None :: all)
+        self.tempering = {"replicas": 8, "minTemp": 1e-3, "swapEvery": 10}
+        self.policy = None                  # AnnealingPolicy (None :: every particle)
+        self.plannedChains = 0              # Chains planned by the last SimAnn()
+        self.evaluations = 0                # Objective evaluations spent
+        self.stopping = stopping
+        self.cache = cache
+        self.profiler = Profiler(active=False)
+        self.rng = rng
         self.population = list()
         """ Initialization """
         self.setup()
@@ -34,42 +84,433 @@ class Hive(object):
     """
      Initializes the hive cluster with particles containing
      random starting values. Best values are set within the
-     appropriate values for the hive cluster itself.
+     appropriate values for the hive cluster itself. An objective
+     evaluating arrays solves every starting value in one call.
      """
     def setup(self):
+        batch = self.objective.batch
         for i in range (self.populationSize):
-            particle = Particle(self.function)
+            particle = Particle(self.function, self.rng, not batch)
             particle.setID(i)
             self.population.append(particle)
+        if(batch and self.population):
+            FX = self.population[0].FX
+            costs = FX.solveArray(numpy.array([particle.FX.position
+                                               for particle in self.population]))
+            for particle, cost in zip(self.population, numpy.asarray(costs).tolist()):
+                particle.FX.setSolution(cost)
+        self.evaluations = self.evaluations + self.populationSize
     
     
     """
-     Sorts the population based off fitness.
+     Annealing mode suited to the objective: the vectorized batch when
+     it evaluates arrays, else the process pool when it is safe to run
+     in workers and there is more than one, else the scalar loop.
+
+     @return: "batch", "parallel" or "scalar"
+     """
+    def autoMode(self):
+        if(self.objective.batch):
+            return "batch"
+        if(self.objective.parallel and self.workers > 1):
+            return "parallel"
+        return "scalar"
+
+
+    """
+     Sorts the population based off fitness, best first. A stable
+     argsort over the best cost array, O(n log n).
      """
     def sortListFitness(self):
-        for i in range (len(self.population)):
-            for j in range (len(self.population)):
-                if (self.population[i].getBestCost()) < (self.population[j].getBestCost()):
-                    swap = self.population.pop(i)
-                    self.population.insert(j, swap)
+        costs = self.getBestCosts()
+        order = numpy.argsort(costs, kind="stable").tolist()
+        self.population[:] = [self.population[i] for i in order]
                     
 
     """
-     Runs an SA on each particle.
+     Runs an SA on each particle, or on those the annealing policy
+     picks.
      """
     def SimAnn(self):
-        sim = SimulatedAnnealing(self.function, 100, 1000, 250, 
-                                 .975, True, True)
-        for i in range (len(self.population)):
-            #print(sim.FX.getX())
-            sim.setVariables(self.population[i].FX.getX(), self.population[i].FX.getY())
-            sim.SA()
-            self.population[i].FX.setVars(sim.getBestX(), sim.getBestY())
-            self.population[i].FX.bestSolution = sim.bestSolution
-            #print(self.population[i].FX.getX())
-        self.sortListFitness()
-        self.hiveAdmin()
-        
+        self.plannedChains = 0
+        if(self.stopping is None or not self.stopping.exhausted(self.evaluations)):
+            with self.profiler.phase(ANNEALING):
+                indices, externals = self.planChains()
+                self.plannedChains = len(indices)
+                if(len(indices) == 0):
+                    pass
+                elif(self.saMode in ("batch", "tempering")):
+                    self.batchSimAnn(indices, externals)
+                elif(self.saMode == "parallel"):
+                    self.parallelSimAnn(indices, externals)
+                else:
+                    self.scalarSimAnn(indices, externals)
+        with self.profiler.phase(SORTING):
+            self.sortListFitness()
+
+
+    """
+     Chains of the next SimAnn() :: the annealing policy's plan, or a
+     full chain for every particle without one.
+
+     @return: indices --   population indices to anneal
+     @return: externals -- external iterations of each chain
+     """
+    def planChains(self):
+        external, internal = self.saSettings[1], self.saSettings[2]
+        setup = 0
+        if(self.saMode == "tempering"):
+            setup = self.tempering["replicas"]
+            internal = internal*setup
+        if(self.policy is None):
+            return numpy.arange(self.populationSize), numpy.full(self.populationSize, external)
+        indices, externals = self.policy.plan(self.getIDs(), self.getBestCosts(),
+                                              external, internal, setup)
+        return numpy.asarray(indices, dtype=numpy.int64), numpy.asarray(externals, dtype=numpy.int64)
+
+
+    """
+     Runs the scalar SA on the planned particles in turn, with the
+     one reused annealer.
+
+     @param indices:   Population indices to anneal
+     @param externals: External iterations of each chain
+     """
+    def scalarSimAnn(self, indices, externals):
+        sim = self.getAnnealer()
+        sim.setStopping(None)
+        positions = self.getPositions()
+        particles = self.getIDs() if self.profiler.active else None
+        indices = indices.tolist()
+        for i in range (len(indices)):
+            index = indices[i]
+            if(self.stopping is not None):
+                if(self.stopping.exhausted(self.evaluations)):
+                    break
+                sim.setStopping(self.chainStopping(len(indices) - i))
+            sim.setExternal(int(externals[i]))
+            sim.run(positions[index])
+            if(sim.getTotalMoves() == 0):
+                """ its share of the budget paid for no move """
+                continue
+            self.evaluations = self.evaluations + sim.getTotalMoves()
+            self.setResult(index, sim.getBestPosition(), sim.bestSolution)
+            if(particles is not None):
+                self.profiler.countEvaluations(particles[index], sim.getTotalMoves())
+            if(sim.getStopReason() == TARGET):
+                break
+        sim.setExternal(self.saSettings[1])
+
+
+    """
+     Runs the SA on the planned particles at once through the batch
+     (or replica exchange) annealer, batchSize chains at a time; chains
+     of different lengths go in separate batches. Results are written
+     back exactly as the scalar loop writes them.
+
+     @param indices:   Population indices to anneal
+     @param externals: External iterations of each chain
+     """
+    def batchSimAnn(self, indices, externals):
+        sim = self.getAnnealer()
+        positions = self.getPositions()
+        particles = self.getIDs() if self.profiler.active else None
+        size = self.batchSize or max(1, len(indices))
+        batches = list()
+        for external in dict.fromkeys(externals.tolist()):
+            group = indices[externals == external]
+            for start in range (0, len(group), size):
+                batches.append((external, group[start:start+size]))
+        for b in range (len(batches)):
+            external, batch = batches[b]
+            sim.stopping = None
+            if(self.stopping is not None):
+                if(self.stopping.exhausted(self.evaluations)):
+                    break
+                sim.stopping = self.chainStopping(len(batches) - b)
+            sim.setExternal(external)
+            sim.run(positions[batch])
+            if(sim.getEvaluations() == 0):
+                break
+            self.evaluations = self.evaluations + sim.getEvaluations()
+            self.setResults(batch, sim.getBestPosition(), sim.getBestSolution())
+            if(particles is not None):
+                self.profiler.countEvaluations(particles[batch], sim.getTotalMoves())
+            if(sim.getStopReason() == TARGET):
+                break
+        sim.setExternal(self.saSettings[1])
+
+
+    """
+     Returns the annealer of the "scalar", "batch" or "tempering"
+     mode, built on first use and then reused by every SimAnn() call
+     and particle until the SA settings or options change. Building
+     it leaves the random generators untouched, so a run draws the
+     same numbers whenever the annealer happens to be built.
+
+     @return: SimulatedAnnealing, BatchSimulatedAnnealing or
+         ReplicaExchange
+     """
+    def getAnnealer(self):
+        if(self.annealer is None):
+            annealer = SimulatedAnnealing
+            options = self.saOptions
+            if(self.saMode == "batch"):
+                annealer = BatchSimulatedAnnealing
+            elif(self.saMode == "tempering"):
+                annealer = ReplicaExchange
+                options = dict(self.saOptions, **self.tempering)
+            randomState = numpy.random.get_state()
+            if(self.rng is not None):
+                generatorState = self.rng.bit_generator.state
+            self.annealer = annealer(self.function, *self.saSettings,
+                                     telemetry=self.telemetry, cache=self.cache,
+                                     rng=self.rng, **options)
+            numpy.random.set_state(randomState)
+            if(self.rng is not None):
+                self.rng.bit_generator.state = generatorState
+            self.profiler.instrument(self.annealer.FX)
+        return self.annealer
+
+
+    """
+     Builds the criteria for the next SA chain out of the hive's
+     criteria: the same target and deadline, an even share of the
+     remaining evaluation budget, and the hive's stagnation window
+     counted in the chain's external iterations.
+
+     @param shares: number of chains still to share the budget
+
+     @return: StoppingCriteria for the chain
+     """
+    def chainStopping(self, shares):
+        return self.stopping.child(self.evaluations, shares, self.stopping.stagnation)
+
+
+    """
+     Runs the scalar SA on every particle across a process pool.
+     Each particle's chain is seeded from the hive's seeder, or draws
+     from its own stream spawned from the hive's Generator, so a
+     seeded hive reproduces the same results whatever the worker
+     count. Results are merged back before sorting.
+
+     @param indices:   Population indices to anneal
+     @param externals: External iterations of each chain
+     """
+    def parallelSimAnn(self, indices, externals):
+        if(self.executor is None):
+            self.executor = concurrent.futures.ProcessPoolExecutor(self.workers)
+        stopping = None
+        if(self.stopping is not None):
+            stopping = self.chainStopping(len(indices))
+        positions = self.getPositions()[indices]
+        if(self.rng is None):
+            seeds = [self.seeder.getrandbits(32) for i in range (len(positions))]
+        else:
+            seeds = numpy.random.SeedSequence(int(self.rng.integers(2**63))).spawn(len(positions))
+        tasks = list(zip(positions, seeds, externals.tolist()))
+        chunkSize = max(1, -(-len(tasks)//(4*self.workers)))
+        chunks = [tasks[i:i+chunkSize] for i in range (0, len(tasks), chunkSize)]
+        results = list()
+        cacheSettings = None
+        if(self.cache is not None):
+            cacheSettings = (self.cache.resolution, self.cache.maxSize)
+        for chunk, moves, counts in self.executor.map(annealChunk, [self.function]*len(chunks),
+                                                      [self.saSettings]*len(chunks),
+                                                      [self.saOptions]*len(chunks),
+                                                      [stopping]*len(chunks),
+                                                      [cacheSettings]*len(chunks), chunks):
+            results.extend(chunk)
+            self.evaluations = self.evaluations + moves
+            if(counts is not None):
+                self.cache.addCounts(*counts)
+        indices = indices.tolist()
+        for i in range (len(results)):
+            if(results[i][2]):
+                self.setResult(indices[i], results[i][0], results[i][1])
+        if(self.profiler.active):
+            self.profiler.countEvaluations(self.getIDs()[indices[:len(results)]],
+                                           [result[2] for result in results])
+        if(self.telemetry.active):
+            particles = self.getIDs().tolist()
+            for i in range (len(results)):
+                if(not results[i][2]):
+                    continue
+                self.telemetry.emit(CHAIN, {"chain": particles[indices[i]],
+                                            "bestCost": results[i][1],
+                                            "bestPosition": results[i][0]})
+
+
+    """
+     Releases the process pool used by the "parallel" mode.
+     """
+    def shutdown(self):
+        if(self.executor is not None):
+            self.executor.shutdown()
+            self.executor = None
+
+
+    """
+     Sets the SA parameters used by SimAnn(), in the order of the
+     SimulatedAnnealing constructor.
+
+     @param initTemp:    Initial temperature
+     @param extIters:    External iterations
+     @param intIters:    Internal iterations
+     @param moveCont:    Alpha value // move control
+     @param localSearch: Local Search control
+     @param expand:      Re-heat // tempering mechanism
+     """
+    def setSASettings(self, initTemp, extIters, intIters, moveCont,
+                      localSearch, expand):
+        self.saSettings = (initTemp, extIters, intIters, moveCont,
+                           localSearch, expand)
+        self.annealer = None
+
+
+    """
+     Sets the SA options beyond the constructor parameters; see the
+     SimulatedAnnealing constructor. Each option object is shared by
+     the chains one after another, or copied to each worker process.
+
+     @param schedule:    CoolingSchedule (None :: GeometricCooling)
+     @param stepControl: AcceptanceStepControl, or None; needs
+         "metropolis" acceptance
+     @param acceptance:  "legacy" or "metropolis"
+     @param surrogate:   RBFSurrogate screening the SA moves, or None;
+         needs "metropolis" acceptance. "tempering" evaluates every
+         replica and ignores it, and in "parallel" mode its statistics
+         stay with the workers' copies
+     """
+    def setSAOptions(self, schedule=None, stepControl=None, acceptance="legacy",
+                     surrogate=None):
+        if(stepControl is not None and acceptance != "metropolis"):
+            raise ValueError("step control needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes every move, so the ratio it "
+                             "steers is always 1" % acceptance)
+        if(surrogate is not None and acceptance != "metropolis"):
+            raise ValueError("surrogate screening needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes moves the screen would reject" % acceptance)
+        self.saOptions = {"schedule": schedule,
+                          "stepControl": stepControl,
+                          "acceptance": acceptance,
+                          "surrogate": surrogate}
+        self.annealer = None
+
+
+    """
+     Sets the Profiler timing the annealing and sorting phases and
+     counting the evaluations per particle. In "parallel" mode the
+     objective calls happen in the workers and are not timed on
+     their own. The annealer is rebuilt on next use, so its objective
+     reports to this profiler only.
+
+     @param profiler: Profiler (None :: an inactive one)
+     """
+    def setProfiler(self, profiler):
+        self.profiler = profiler or Profiler(active=False)
+        self.annealer = None
+
+
+    """
+     Sets the replica ladder of the "tempering" mode. The SA settings
+     give the hot end (initTemp), the sweeps (extIters) and the moves
+     per replica and sweep (intIters); each chain costs R times the
+     evaluations of a "batch" chain with the same settings.
+
+     @param replicas:  Replicas per chain (R)
+     @param minTemp:   Temperature of the cold end
+     @param swapEvery: Moves between exchange rounds
+     """
+    def setTempering(self, replicas=8, minTemp=1e-3, swapEvery=10):
+        self.tempering = {"replicas": replicas,
+                          "minTemp": minTemp,
+                          "swapEvery": swapEvery}
+        self.annealer = None
+
+
+    """
+     Sets the policy choosing which particles SimAnn() anneals and
+     for how many external iterations; see Scheduling.
+
+     @param policy: AnnealingPolicy (None :: a full chain for every
+         particle)
+     """
+    def setAnnealingPolicy(self, policy):
+        self.policy = policy
+
+
+    """
+     Returns the annealing policy, if any.
+
+     @return: Returns the AnnealingPolicy or None.
+     """
+    def getAnnealingPolicy(self):
+        return self.policy
+
+
+    """
+     Sets the criteria bounding SimAnn(). The evaluation budget is
+     counted against getEvaluations() and shared out across the SA
+     chains; the target and deadline apply to every chain, and the
+     stagnation window applies to each chain on its own, counted in
+     external iterations. None lifts every bound.
+
+     @param criteria: StoppingCriteria or None
+     """
+    def setStopping(self, criteria):
+        self.stopping = criteria
+
+
+    """
+     Returns the hive for a checkpoint: the particles in their current
+     (sorted) order, the SA settings, the evaluation count, the state
+     of the seeder behind the "parallel" chains and what the annealing
+     policy learned, if one is attached. The SA chains themselves hold
+     no state between SimAnn() calls.
+
+     @return: state dict
+     """
+    def getState(self):
+        return {"saMode": self.saMode,
+                "saSettings": list(self.saSettings),
+                "batchSize": self.batchSize,
+                "tempering": dict(self.tempering),
+                "evaluations": int(self.evaluations),
+                "particles": self.getIDs(),
+                "positions": self.getPositions(),
+                "currentCosts": self.getCurrentCosts(),
+                "bestPositions": self.getBestPositions(),
+                "bestCosts": self.getBestCosts(),
+                "velocities": self.getVelocities(),
+                "seeder": numpy.array(self.seeder.getstate()[1], dtype=numpy.int64),
+                "policy": None if self.policy is None else self.policy.getState()}
+
+
+    """
+     Restores a hive saved by getState() onto this hive's particles.
+     The state holds what the annealing policy learned, not the policy
+     itself; a policy attached beforehand takes that state over.
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        if(len(state["particles"]) != self.populationSize):
+            raise ValueError("checkpoint holds %d particles, hive has %d" %
+                             (len(state["particles"]), self.populationSize))
+        self.saMode = state["saMode"]
+        self.saSettings = tuple(state["saSettings"])
+        self.batchSize = state["batchSize"]
+        self.tempering = dict(state.get("tempering", self.tempering))
+        self.annealer = None
+        self.evaluations = state["evaluations"]
+        self.setArrays(state["particles"], state["positions"], state["currentCosts"],
+                       state["bestPositions"], state["bestCosts"], state["velocities"])
+        self.seeder.setstate((3, tuple(state["seeder"].tolist()), None))
+        if(self.policy is not None and state.get("policy") is not None):
+            self.policy.setState(state["policy"])
+
+
     """
      Returns the population list.
      
@@ -78,14 +519,226 @@ class Hive(object):
     def getPopulation(self):
         return self.population
 
+
+    """
+     Population arrays, one row per particle in population order
+     (best first after a sort). Each call builds new arrays.
+
+     @return: positions -- (n, D) current coord vectors
+     @return: bestPositions -- (n, D) personal best coord vectors
+     @return: velocities -- (n, D) velocities
+     @return: currentCosts -- current cost evaluations
+     @return: bestCosts -- personal best costs
+     @return: IDs -- particle ID numbers
+     """
+    def getPositions(self):
+        return numpy.array([particle.FX.position for particle in self.population])
+
+    def getBestPositions(self):
+        return numpy.array([particle.FX.bestPosition for particle in self.population])
+
+    def getVelocities(self):
+        return numpy.array([particle.velocity for particle in self.population])
+
+    def getCurrentCosts(self):
+        return numpy.fromiter((particle.FX.currentSolution for particle in self.population),
+                              dtype=float, count=len(self.population))
+
+    def getBestCosts(self):
+        return numpy.fromiter((particle.FX.bestSolution for particle in self.population),
+                              dtype=float, count=len(self.population))
+
+    def getIDs(self):
+        return numpy.fromiter((particle.getID() for particle in self.population),
+                              dtype=numpy.int64, count=len(self.population))
+
+
+    """
+     Personal best coord vector of the particle at a population
+     index, without building the whole array.
+
+     @param index: Population index
+
+     @return: coord vector
+     """
+    def getBestPosition(self, index):
+        return self.population[index].FX.bestPosition
+
+
+    """
+     Returns a Function instance of the hive's objective, for its
+     bounds and velocity limit.
+
+     @return: ContinuousFunction instance
+     """
+    def getFunction(self):
+        return self.population[0].FX
+
+
+    """
+     Moves every particle, in population order.
+
+     @param positions:  (n, D) new coord vectors
+     @param velocities: (n, D) velocities that led there
+     """
+    def moveTo(self, positions, velocities):
+        for i in range (len(self.population)):
+            self.population[i].setVelocity(velocities[i])
+            self.population[i].FX.setVars(positions[i])
+
+
+    """
+     Writes SA results back as the particles' positions and personal
+     bests.
+
+     @param index:     Population index (of the first result), or
+                       for setResults() an array of indices
+     @param position:  Best coord vector(s) of the chain(s)
+     @param cost:      Best cost(s) of the chain(s)
+     """
+    def setResult(self, index, position, cost):
+        self.population[index].FX.setBest(position, cost)
+
+    def setResults(self, index, positions, costs):
+        costs = numpy.asarray(costs).tolist()
+        if(numpy.ndim(index) == 0):
+            indices = range(index, index + len(costs))
+        else:
+            indices = numpy.asarray(index).tolist()
+        for i in range (len(costs)):
+            self.population[indices[i]].FX.setBest(positions[i], costs[i])
+
+
+    """
+     Overwrites the whole population, e.g. from a checkpoint. Arrays
+     are in population order, as returned by the getters above.
+     """
+    def setArrays(self, particles, positions, currentCosts, bestPositions,
+                  bestCosts, velocities):
+        particles = numpy.asarray(particles).tolist()
+        currentCosts = numpy.asarray(currentCosts).tolist()
+        bestCosts = numpy.asarray(bestCosts).tolist()
+        for i in range (len(self.population)):
+            particle = self.population[i]
+            particle.setID(particles[i])
+            particle.FX.position = numpy.array(positions[i], dtype=float)
+            particle.FX.currentSolution = currentCosts[i]
+            particle.FX.bestPosition = numpy.array(bestPositions[i], dtype=float)
+            particle.FX.bestSolution = bestCosts[i]
+            particle.setVelocity(numpy.array(velocities[i], dtype=float))
+
+
+    """
+     Sets the number of chains the "batch" mode anneals at once, to
+     bound the memory of its per-iteration random draws.
+
+     @param size: Chains per batch (None :: the whole population)
+     """
+    def setBatchSize(self, size):
+        self.batchSize = size
+
+
+    """
+     Returns the objective evaluations spent so far, initialization
+     and every SA chain included.
+
+     @return: Returns the evaluation count.
+     """
+    def getEvaluations(self):
+        return self.evaluations
+
+
+    """
+     Returns the number of SA chains the last SimAnn() planned, 0 if
+     the budget was spent or the policy picked no particle.
+
+     @return: Returns the chain count.
+     """
+    def getPlannedChains(self):
+        return self.plannedChains
+
+
+    """
+     Returns the objective definition.
+
+     @return: Returns the ObjectiveDefinition.
+     """
+    def getObjective(self):
+        return self.objective
+
+
+    """
+     Returns the evaluation cache, if any.
+
+     @return: Returns the EvaluationCache or None.
+     """
+    def getCache(self):
+        return self.cache
+
     
     """
-     Calls particleAdmin() for each particle.
+     Calls particleAdmin() for each particle. Prints on demand only;
+     SimAnn() reports through the telemetry hooks instead.
      """
     def hiveAdmin(self):
         for i in range (len(self.population)):
             self.population[i].particleAdmin()
 
+"""
+ Worker for Hive.parallelSimAnn(). Anneals a chunk of particles in
+ a child process with one annealer, reseeding the random generator
+ before each chain.
+
+ @param funcNum:    ObjectiveDefinition (or key) of the Function
+     class to be evaluated
+ @param saSettings: SimulatedAnnealing constructor parameters
+ @param saOptions:  SimulatedAnnealing keyword options
+ @param stopping:   StoppingCriteria for each chain, or None
+ @param cacheSettings: (resolution, maxSize) of the worker's evaluation
+     cache, or None
+ @param tasks:      List of (position, seed, external) per particle;
+     the seed is an int for the global generator or a SeedSequence of
+     the chain's own Generator, and external the chain's external
+     iterations
+
+ @return: List of (bestPosition, bestSolution, moves) per particle, the
+     evaluations spent and the cache counters gathered (or None)
+ """
+def annealChunk(funcNum, saSettings, saOptions, stopping, cacheSettings, tasks):
+    streams = isinstance(tasks[0][1], numpy.random.SeedSequence)
+    if(not streams):
+        numpy.random.seed(tasks[0][1])
+    sim = SimulatedAnnealing(funcNum, *saSettings, **saOptions,
+                             rng=numpy.random.default_rng(tasks[0][1]) if streams else None)
+    sim.setStopping(stopping)
+    cache = None
+    if(cacheSettings is not None):
+        objective = sim.objective
+        cache = workerCaches.setdefault((objective.name, objective.dimensions) + cacheSettings,
+                                        EvaluationCache(*cacheSettings))
+        counts = (cache.hits, cache.misses, cache.evictions)
+        sim.FX.setCache(cache)
+    moves = 0
+    results = list()
+    for position, seed, external in tasks:
+        if(streams):
+            sim.setRandom(numpy.random.default_rng(seed))
+        else:
+            numpy.random.seed(seed)
+        sim.setExternal(external)
+        sim.run(position)
+        moves = moves + sim.getTotalMoves()
+        results.append((sim.getBestPosition(), sim.bestSolution, sim.getTotalMoves()))
+    if(cache is not None):
+        return results, moves, (cache.hits - counts[0], cache.misses - counts[1],
+                                cache.evictions - counts[2])
+    return results, moves, None
+
+
+""" Per-process evaluation caches of the "parallel" workers """
+workerCaches = dict()
+
+
 """
 ---------------------------------------
 CLASS :: Particle
@@ -99,14 +752,20 @@ class Particle(object):
      Constructor setting sentinel values. Also, calls
      for setup() generating random starting values and
      self evaluation. 
+
+     @param funcNum:  Objective key of the Function class
+     @param rng:      NumPy Generator for the starting values (None ::
+         the global numpy.random generator)
+     @param evaluate: Solve at the starting values; False leaves it to
+         the Hive
      """
-    def __init__(self, funcNum):
+    def __init__(self, funcNum, rng=None, evaluate=True):
         self.function = funcNum
+        self.rng = rng
+        self.evaluate = evaluate
         self.bestCost = 10000
         self.particleID = None
         self.velocity = None
-        self.xVelocity = 0
-        self.yVelocity = 0
         """ Initialization """
         self.setup()
         
@@ -117,46 +776,26 @@ class Particle(object):
      initial solved values for as the currently best values.
      """
     def setup(self):
-        if(self.function == 1):
-            self.FX = FunctionOne()
-        else:
-            self.FX = FunctionTwo()
+        self.FX = getObjective(self.function).create(self.rng, self.evaluate)
+        self.velocity = numpy.zeros(self.FX.getDimensions())
 
     
     """
-     Sets x velocity value.    
+     Sets the velocity vector.
 
-     @param vel: X Velocity
+     @param vel: Velocity, one entry per coordinate
      """
-    def setXVelocity(self, vel):
-        self.xVelocity = vel
+    def setVelocity(self, vel):
+        self.velocity = vel
 
 
     """
-     Sets y velocity value.    
+     Returns the velocity vector.
 
-     @param vel: Y Velocity
-     """
-    def setYVelocity(self, vel):
-        self.yVelocity = vel
-    
-    
-    """
-     Returns x velocity.
-     
-     @return: Returns the x velocity
-     """
-    def getXVelocity(self):
-        return self.xVelocity
-    
-    
-    """
-     Returns y velocity.
-     
-     @return: Returns the y velocity
+     @return: Returns the velocity, one entry per coordinate
      """
-    def getYVelocity(self):
-        return self.yVelocity
+    def getVelocity(self):
+        return self.velocity
     
         
     """
@@ -182,14 +821,15 @@ class Particle(object):
      """
     def particleAdmin(self):
         print("*** Particle Printout Start: %s -->" % self.particleID)
-        print(self.FX.admin())
+        self.FX.admin()
     
     """
-     Returns bestCost, X and Y.
+     Returns bestCost and the coordinates.
      
      @return: Best cost.
-     @return: Best X
-     @return: Best Y
+     @return: Current cost.
+     @return: Current coord vector
+     @return: Best coord vector
      """
     def getBestCost(self):
         return self.FX.getBestCost()
@@ -197,9 +837,9 @@ class Particle(object):
     def getCurrentCost(self):
         return self.FX.getCurrentCost()
     
-    def getBestX(self):
-        return self.FX.getBestX()
+    def getPosition(self):
+        return self.FX.getPosition()
     
-    def getBestY(self):
-        return self.FX.getBestY()
+    def getBestPosition(self):
+        return self.FX.getBestPosition()
         
\ No newline at end of file
@@ -0,0 +1,360 @@
+""" Python Package Support """
+import multiprocessing
+import traceback
+import numpy
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Stopping import StoppingCriteria, TARGET
+from Objectives import getObjective
+from Telemetry import Telemetry, GLOBAL_BEST, MIGRATION
+from SharedBoard import SharedBestBoard
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 4-Islands
+
+    Island model of the swarm/annealing hybrid. Every island is a
+    Swarm with its own Hive, evolving on its own in a dedicated
+    process. The islands advance in epochs of a fixed number of swarm
+    iterations; after each epoch the best particles of every island
+    migrate along the topology and replace the worst particles of the
+    islands they reach ::
+
+        ring -- island i receives from island i-1
+        full -- every island receives from every other island
+
+    The processes only meet at the epoch boundary, where the small
+    migrant arrays cross the pipes, so the islands run without
+    synchronization for the rest of the epoch. Epochs are in lock
+    step, and a seeded model gives the same result on any machine.
+
+    With shareBest the islands also share their global best through a
+    SharedBestBoard after every iteration, without waiting for the
+    epoch. The islands then follow one another's progress as it
+    happens, which trades the reproducibility of a seeded model for
+    fresher information.
+"""
+
+PSO_SETTINGS = (2.05, 2.05, 1.0, .7298) # phi1, phi2, inertia, kappa
+TOPOLOGIES = ("ring", "full")
+
+
+class IslandModel(object):
+
+    """
+     Constructor. Every island uses the same configuration.
+
+     @param islands:     Number of islands, one process each
+     @param popSize:     Swarm size of each island
+     @param funcNum:     Objective key, see Objectives.getObjective()
+     @param interval:    Swarm iterations between migrations
+     @param topology:    "ring" or "full"
+     @param migrants:    Particles received by an island per migration
+     @param psoSettings: (phi1, phi2, inertia, kappa)
+     @param saMode:      Hive annealing mode of each island; "scalar",
+                          "batch" or "auto" (the islands already
+                          occupy the cores)
+     @param saSettings:  SA parameters, in Hive.setSASettings() order
+                          (None :: Hive defaults)
+     @param layout:      Swarm layout, "particles" or "arrays"
+     @param telemetry:   Telemetry receiving the GLOBAL_BEST and
+                          MIGRATION events of the model
+     @param shareBest:   Share the islands' global best through shared
+                          memory after every iteration
+     """
+    def __init__(self, islands, popSize, funcNum, interval=5, topology="ring",
+                 migrants=2, psoSettings=PSO_SETTINGS, saMode="batch",
+                 saSettings=None, layout="particles", telemetry=None,
+                 shareBest=False):
+        if(topology not in TOPOLOGIES):
+            raise ValueError("Unknown topology %r; use %s" % (topology, ", ".join(TOPOLOGIES)))
+        self.islands = islands
+        self.interval = interval
+        self.topology = topology
+        self.migrants = migrants
+        self.objective = getObjective(funcNum)
+        self.settings = {"popSize": popSize,
+                         "function": self.objective,
+                         "psoSettings": tuple(psoSettings),
+                         "saMode": saMode,
+                         "saSettings": saSettings,
+                         "layout": layout,
+                         "migrants": migrants}
+        self.telemetry = telemetry or Telemetry()
+        self.shareBest = shareBest
+        self.bestCost = float("inf")
+        self.bestPosition = None
+        self.bestIsland = None
+        self.evaluations = 0
+        self.epochs = 0
+        self.stopReason = None
+        self.reports = list()
+
+
+    """
+     Runs the islands until a stopping criterion is met. The criteria
+     are checked at the migration epochs, their stagnation window
+     counting epochs; the evaluations of the islands' initial
+     populations are charged first, then each island receives an even
+     share of the remaining evaluation budget per epoch, and the
+     target and deadline, so it stops within an epoch as well.
+
+     @param maxIterations: Swarm iterations per island (None :: no
+                            bound)
+     @param stopping:      StoppingCriteria (None :: iterations only)
+     @param seed:          Seed of the SeedSequence the islands'
+                            random streams are spawned from (None ::
+                            unseeded)
+
+     @return: Returns the best cost found.
+     """
+    def run(self, maxIterations=None, stopping=None, seed=None):
+        if(stopping is None):
+            stopping = StoppingCriteria()
+        stopping.start()
+        self.bestCost = float("inf")
+        self.bestPosition = None
+        self.bestIsland = None
+        self.evaluations = 0
+        self.epochs = 0
+        self.stopReason = None
+        seeds = numpy.random.SeedSequence(seed).spawn(self.islands)
+        routes = migrationRoutes(self.topology, self.islands)
+        connections = list()
+        processes = list()
+        board = None
+        if(self.shareBest):
+            board = SharedBestBoard(self.objective.getDimensions())
+        try:
+            for i in range (self.islands):
+                local, remote = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=islandWorker,
+                                                  args=(remote, self.settings, i, seeds[i], board),
+                                                  daemon=True)
+                process.start()
+                remote.close()
+                connections.append(local)
+                processes.append(process)
+            """ the islands' initial populations come out of the budget first """
+            self.evaluations = sum(receive(connection)["evaluations"]
+                                   for connection in connections)
+            immigrants = [None]*self.islands
+            iterations = 0
+            finished = False
+            while((maxIterations is None or iterations < maxIterations) and
+                  not stopping.exhausted(self.evaluations)):
+                epoch = self.interval
+                if(maxIterations is not None):
+                    epoch = min(epoch, maxIterations - iterations)
+                limits = stopping.child(self.evaluations, self.islands)
+                for i in range (self.islands):
+                    connections[i].send(("epoch", immigrants[i], epoch, limits))
+                self.reports = [receive(connection) for connection in connections]
+                iterations = iterations + epoch
+                self.epochs = self.epochs + 1
+                spent = self.evaluations
+                self.evaluations = sum(report["evaluations"] for report in self.reports)
+                self.collect()
+                immigrants = self.migrate(routes)
+                reason = stopping.update(self.evaluations, self.bestCost)
+                if(not reason and any(report["stopReason"] == TARGET
+                                      for report in self.reports)):
+                    reason = stopping.reason = TARGET
+                if(not reason and self.evaluations == spent):
+                    """ the islands' shares paid for no move :: no progress is left """
+                    reason = stopping.starve()
+                if(reason):
+                    break
+            for connection in connections:
+                connection.send(("stop",))
+            finished = True
+        finally:
+            for connection in connections:
+                connection.close()
+            for process in processes:
+                if(finished):
+                    process.join(5)
+                if(process.is_alive()):
+                    process.terminate()
+                    process.join()
+            if(board is not None):
+                board.unlink()
+            self.stopReason = stopping.getReason()
+        return self.bestCost
+
+
+    """
+     Folds the island reports of an epoch into the model's best and
+     reports the epoch to the telemetry hooks.
+     """
+    def collect(self):
+        for report in self.reports:
+            if(report["bestCost"] < self.bestCost):
+                self.bestCost = report["bestCost"]
+                self.bestPosition = report["bestPosition"]
+                self.bestIsland = report["island"]
+                if(self.telemetry.active):
+                    self.telemetry.emit(GLOBAL_BEST, {"iteration": self.epochs,
+                                                      "bestCost": self.bestCost,
+                                                      "bestParticle": self.bestIsland,
+                                                      "bestPosition": self.bestPosition})
+        if(self.telemetry.active):
+            self.telemetry.emit(MIGRATION, {"epoch": self.epochs,
+                                            "bestCost": self.bestCost,
+                                            "bestIsland": self.bestIsland,
+                                            "islandCosts": [report["bestCost"]
+                                                            for report in self.reports],
+                                            "evaluations": self.evaluations})
+
+
+    """
+     Picks the immigrants of every island from the emigrants of the
+     islands routed to it: the best migrants of them all.
+
+     @param routes: list of source islands per island
+
+     @return: list of (costs, positions) per island
+     """
+    def migrate(self, routes):
+        immigrants = list()
+        for sources in routes:
+            if(not sources):
+                immigrants.append(None)
+                continue
+            costs = numpy.concatenate([self.reports[j]["emigrants"][0] for j in sources])
+            positions = numpy.concatenate([self.reports[j]["emigrants"][1] for j in sources])
+            best = numpy.argsort(costs, kind="stable")[:self.migrants]
+            immigrants.append((costs[best], positions[best]))
+        return immigrants
+
+
+    """
+     Returns the last epoch report of every island.
+
+     @return: list of dicts with island, bestCost, bestPosition,
+         evaluations, iterations and stopReason
+     """
+    def getIslandReports(self):
+        return [{key: value for key, value in report.items() if key != "emigrants"}
+                for report in self.reports]
+
+
+    """
+     Basic accessor methods.
+
+     @return: bestCost - best cost over all islands
+     @return: bestPosition - coord vector for bestCost
+     @return: bestIsland - island that found bestCost
+     @return: evaluations - evaluations spent by all islands
+     @return: epochs - migration epochs run
+     @return: stopReason - why the last run() stopped, if early
+     """
+    def getBestCost(self):
+        return self.bestCost
+
+    def getBestPosition(self):
+        return self.bestPosition
+
+    def getBestIsland(self):
+        return self.bestIsland
+
+    def getEvaluations(self):
+        return self.evaluations
+
+    def getEpochs(self):
+        return self.epochs
+
+    def getStopReason(self):
+        return self.stopReason
+
+
+"""
+ Source islands of every island's immigrants.
+
+ @param topology: "ring" or "full"
+ @param islands:  Number of islands
+
+ @return: list of source island lists, one per island
+ """
+def migrationRoutes(topology, islands):
+    if(islands < 2):
+        return [[] for i in range (islands)]
+    if(topology == "ring"):
+        return [[(i - 1) % islands] for i in range (islands)]
+    return [[j for j in range (islands) if j != i] for i in range (islands)]
+
+
+"""
+ Receives an island report, raising the island's error if it failed.
+
+ @param connection: Pipe end of the island
+
+ @return: report dict
+ """
+def receive(connection):
+    kind, payload = connection.recv()
+    if(kind == "error"):
+        raise RuntimeError("Island failed:\n%s" % payload)
+    return payload
+
+
+"""
+ Island process. Builds the island's Swarm and reports the
+ evaluations that took, then runs one epoch per message until told
+ to stop, sending a report with its emigrants after each. Exits on its own once the model's process is gone.
+
+ @param connection: Pipe end to the IslandModel
+ @param settings:   IslandModel settings dict
+ @param island:     Island number
+ @param seed:       SeedSequence of the island's Generator
+ @param board:      SharedBestBoard of the islands, or None
+ """
+def islandWorker(connection, settings, island, seed, board=None):
+    swarm = None
+    try:
+        swarm = Swarm(settings["popSize"], *settings["psoSettings"],
+                      funcNum=settings["function"], saMode=settings["saMode"],
+                      layout=settings["layout"], rng=numpy.random.default_rng(seed))
+        if(settings["saSettings"] is not None):
+            swarm.getHive().setSASettings(*settings["saSettings"])
+        if(board is not None):
+            swarm.setBoard(board, island)
+        connection.send(("ready", {"evaluations": int(swarm.getEvaluations())}))
+        iterations = 0
+        parent = multiprocessing.parent_process()
+        while True:
+            while(not connection.poll(1.0)):
+                if(parent is not None and not parent.is_alive()):
+                    """ orphaned :: the model was killed """
+                    return
+            message = connection.recv()
+            if(message[0] == "stop"):
+                break
+            kind, immigrants, epoch, limits = message
+            if(immigrants is not None and len(immigrants[0])):
+                swarm.immigrate(*immigrants)
+            if(limits.maxEvaluations is not None):
+                limits.maxEvaluations = limits.maxEvaluations + swarm.getEvaluations()
+            swarm.run(epoch, limits)
+            iterations = iterations + swarm.runIterations
+            connection.send(("report", {"island": island,
+                                        "bestCost": float(swarm.getBestCost()),
+                                        "bestPosition": numpy.array(swarm.getBestPosition()),
+                                        "evaluations": int(swarm.getEvaluations()),
+                                        "iterations": iterations,
+                                        "stopReason": swarm.getStopReason(),
+                                        "emigrants": swarm.getEmigrants(settings["migrants"])}))
+    except (EOFError, BrokenPipeError, ConnectionResetError, KeyboardInterrupt):
+        pass
+    except Exception:
+        connection.send(("error", traceback.format_exc()))
+    finally:
+        if(swarm is not None):
+            swarm.getHive().shutdown()
+        if(board is not None):
+            board.close()
+        connection.close()
@@ -0,0 +1,171 @@
+""" Python Package Support """
+import heapq
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 3
+
+    Incrementally maintained global best and top-k board for the
+    swarm. Entries are the best solutions ever reported, at most one
+    per particle, kept in a bounded max-heap on cost so the worst
+    entry -- the admission threshold -- is always at the root. An
+    offer costs O(log k) amortized and candidates at or above the
+    threshold are turned away in O(1), so callers walking a
+    cost-sorted population can stop at the first rejection.
+
+    A particle improving on its listed entry pushes a new heap entry
+    and leaves the old one behind. Stale entries are dropped once they
+    reach the root, where they would misstate the threshold, and the
+    heap is rebuilt from the live entries when stale ones make up half
+    of it.
+"""
+
+class Leaderboard(object):
+
+    """
+     Constructor.
+
+     @param size: Number of entries kept (k)
+     """
+    def __init__(self, size=10):
+        self.size = size
+        self.heap = list()                 # (-cost, particleID) max-heap, stale entries included
+        self.entries = dict()              # particleID -> (cost, position)
+        self.bestCost = float("inf")
+        self.bestParticle = None
+        self.bestPosition = None
+
+
+    """
+     Cost a new entry has to beat to get on the board.
+
+     @return: Returns the admission threshold.
+     """
+    def threshold(self):
+        if(len(self.entries) < self.size):
+            return float("inf")
+        return -self.heap[0][0]
+
+
+    """
+     Offers a particle's best solution to the board.
+
+     @param cost:       Best cost of the particle
+     @param particleID: Particle ID
+     @param position:   Coord vector of the best cost
+
+     @return: True if the offer is a new global best
+     """
+    def offer(self, cost, particleID, position):
+        entry = self.entries.get(particleID)
+        if(entry is not None):
+            if(cost >= entry[0]):
+                return False
+            """ Particle already listed -- the old entry goes stale """
+            heapq.heappush(self.heap, (-cost, particleID))
+        elif(len(self.entries) < self.size):
+            heapq.heappush(self.heap, (-cost, particleID))
+        elif(cost < self.threshold()):
+            worst = heapq.heapreplace(self.heap, (-cost, particleID))
+            del self.entries[worst[1]]
+        else:
+            return False
+        self.entries[particleID] = (cost, numpy.array(position, copy=True))
+        self.prune()
+        if(cost < self.bestCost):
+            self.bestCost = cost
+            self.bestParticle = particleID
+            self.bestPosition = self.entries[particleID][1]
+            return True
+        return False
+
+
+    """
+     Drops stale entries from the root, and rebuilds the heap once
+     they make up half of it.
+     """
+    def prune(self):
+        heap = self.heap
+        if(len(heap) > 2*max(self.size, 1)):
+            self.heap = heap = [(-cost, particleID) for particleID, (cost, position)
+                                in self.entries.items()]
+            heapq.heapify(heap)
+        while(heap):
+            entry = self.entries.get(heap[0][1])
+            if(entry is not None and entry[0] == -heap[0][0]):
+                break
+            heapq.heappop(heap)
+
+
+    """
+     Returns the board ordered from best to worst.
+
+     @return: list of (cost, particleID, position)
+     """
+    def getTop(self):
+        return sorted((cost, particleID, position) for particleID, (cost, position)
+                      in self.entries.items())
+
+
+    """
+     Returns the board for a checkpoint.
+
+     @return: state dict
+     """
+    def getState(self):
+        top = self.getTop()
+        return {"size": self.size,
+                "costs": numpy.array([entry[0] for entry in top]),
+                "particles": numpy.array([entry[1] for entry in top], dtype=numpy.int64),
+                "positions": numpy.array([entry[2] for entry in top]),
+                "bestCost": self.bestCost,
+                "bestParticle": self.bestParticle}
+
+
+    """
+     Restores a board saved by getState().
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        self.size = state["size"]
+        self.entries = dict()
+        for cost, particleID, position in zip(state["costs"].tolist(),
+                                              state["particles"].tolist(),
+                                              state["positions"]):
+            self.entries[particleID] = (cost, position.copy())
+        self.heap = [(-cost, particleID) for particleID, (cost, position)
+                     in self.entries.items()]
+        heapq.heapify(self.heap)
+        self.bestCost = state["bestCost"]
+        self.bestParticle = state["bestParticle"]
+        self.bestPosition = None
+        if(self.bestParticle is not None):
+            self.bestPosition = self.entries[self.bestParticle][1]
+
+
+    """
+     Basic accessor methods.
+
+     @return: bestCost -- best cost ever offered
+     @return: bestParticle -- particle ID of the best cost
+     @return: bestPosition -- coord vector of the best cost
+     """
+    def getBestCost(self):
+        return self.bestCost
+
+    def getBestParticle(self):
+        return self.bestParticle
+
+    def getBestPosition(self):
+        return self.bestPosition
+
+    def __len__(self):
+        return len(self.entries)
@@ -0,0 +1,167 @@
+""" Python Package Support """
+import numbers
+import numpy
+
+""" Internal Package Support """
+from FunctionOne import FunctionOne
+from FunctionTwo import FunctionTwo
+from Rastrigin import Rastrigin
+from Rosenbrock import Rosenbrock
+from Ackley import Ackley
+from Griewank import Griewank
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1C
+
+    Registry of the objectives the hybrid can be run against. Each
+    ObjectiveDefinition carries the Function class, its dimensions and
+    domain bounds, the wrap behavior, the SA neighborhood range, the
+    known goal and optimum, and what the objective supports (array
+    evaluation, running in worker processes) so the engines can pick
+    their evaluation path from the objective instead of hard-coded
+    classes.
+
+    The historical funcNum values still resolve :: 1 is the Six Hump
+    Camelback Function, any other number the Branin Function.
+"""
+
+class ObjectiveDefinition(object):
+
+    """
+     Constructor.
+
+     @param name:          Registry name
+     @param functionClass: ContinuousFunction subclass
+     @param stepRange:     SA neighborhood range
+     @param goal:          Known optimal cost
+     @param optimum:       A known optimal coord vector (None :: unknown)
+     @param dimensions:    Number of coordinates (None :: class default)
+     @param batch:         Supports solveArray() evaluation
+     @param parallel:      Safe to evaluate in worker processes
+
+     The domain bounds and the wrap behavior are read off the Function
+     class, so no Function has to be built to know them.
+     """
+    def __init__(self, name, functionClass, stepRange, goal, optimum=None,
+                 dimensions=None, batch=True, parallel=True):
+        self.name = name
+        self.functionClass = functionClass
+        self.stepRange = stepRange
+        self.goal = goal
+        self.optimum = optimum
+        self.dimensions = dimensions
+        self.batch = batch
+        self.parallel = parallel
+        self.lower = functionClass.lower       # Lower bound, scalar or per coordinate
+        self.upper = functionClass.upper       # Upper bound, scalar or per coordinate
+        self.wrap = functionClass.wrap         # Wrap coords around the domain, else clip
+
+
+    """
+     Builds a new Function instance at a random starting point.
+
+     @param rng:      NumPy Generator for the starting point (None ::
+         the global numpy.random generator)
+     @param evaluate: Solve at the starting point; see
+         ContinuousFunction
+
+     @return: ContinuousFunction instance
+     """
+    def create(self, rng=None, evaluate=True):
+        return self.functionClass(self.dimensions, rng=rng, evaluate=evaluate)
+
+
+    """
+     Same objective with another number of coordinates. Only for
+     objectives whose bounds are given as scalars.
+
+     @param dimensions: Number of coordinates
+
+     @return: new ObjectiveDefinition
+     """
+    def withDimensions(self, dimensions):
+        optimum = self.optimum
+        if(optimum is not None):
+            optimum = numpy.full(dimensions, optimum[0])
+        return ObjectiveDefinition(self.name, self.functionClass, self.stepRange,
+                                   self.goal, optimum, dimensions, self.batch,
+                                   self.parallel)
+
+
+    """
+     Number of coordinates of the Functions create() builds.
+
+     @return: Returns the dimensions.
+     """
+    def getDimensions(self):
+        if(numpy.ndim(self.lower) > 0):
+            return len(self.lower)
+        return self.dimensions or self.functionClass.defaultDimensions
+
+
+    def __repr__(self):
+        return "ObjectiveDefinition(%r, dimensions=%r)" % (self.name, self.dimensions)
+
+
+""" Registered objectives by name and alias """
+registry = dict()
+
+
+"""
+ Registers an objective under its name and any aliases.
+
+ @param definition: ObjectiveDefinition
+ @param aliases:    Additional keys, e.g. historical funcNum values
+ """
+def registerObjective(definition, *aliases):
+    registry[definition.name] = definition
+    for alias in aliases:
+        registry[alias] = definition
+
+
+"""
+ Resolves an objective. Accepts a registered name or alias, an
+ ObjectiveDefinition (returned as is), or a historical funcNum.
+
+ @param key: objective key
+
+ @return: ObjectiveDefinition
+ """
+def getObjective(key):
+    if(isinstance(key, ObjectiveDefinition)):
+        return key
+    if(isinstance(key, numbers.Integral)):
+        key = int(key)
+    if(key in registry):
+        return registry[key]
+    if(isinstance(key, int)):
+        return registry[2]
+    raise KeyError("Unknown objective %r; registered: %s" %
+                   (key, ", ".join(listObjectives())))
+
+
+"""
+ Returns the registered objective names.
+ """
+def listObjectives():
+    return sorted(name for name in registry if isinstance(name, str))
+
+
+registerObjective(ObjectiveDefinition("camelback", FunctionOne, 0.5,
+                                      -1.031628453488552,
+                                      numpy.array([0.089842, -0.712656])), 1)
+registerObjective(ObjectiveDefinition("branin", FunctionTwo, 1.5,
+                                      0.39788735775266204,
+                                      numpy.array([numpy.pi, 2.275])), 2)
+registerObjective(ObjectiveDefinition("rastrigin", Rastrigin, 0.5, 0.0,
+                                      numpy.zeros(10)))
+registerObjective(ObjectiveDefinition("rosenbrock", Rosenbrock, 0.5, 0.0,
+                                      numpy.ones(10)))
+registerObjective(ObjectiveDefinition("ackley", Ackley, 2.0, 0.0,
+                                      numpy.zeros(10)))
+registerObjective(ObjectiveDefinition("griewank", Griewank, 30.0, 0.0,
+                                      numpy.zeros(10)))
@@ -0,0 +1,306 @@
+""" Python Package Support """
+import contextlib
+import cProfile
+import io
+import pstats
+import time
+import tracemalloc
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 0
+
+    Run-time instrumentation for the swarm/annealing hybrid. A
+    Profiler keeps the cumulative wall time and call count of every
+    phase of a swarm iteration, the objective evaluations spent on
+    each particle, and, on request, a cProfile and a tracemalloc
+    capture around Swarm.updateWithVels(). Attach one with
+    Swarm.setProfiler() and query it with getStats() at any point of
+    the run.
+
+    Phases ::    ITERATION   -- a whole Swarm.updateWithVels()
+                 VELOCITY    -- velocity update and move
+                 ANNEALING   -- the SA chains of Hive.SimAnn()
+                 SORTING     -- Hive.sortListFitness()
+                 ADMIN       -- global best, leaderboard and telemetry
+                 EVALUATION  -- objective calls of the SA chains in
+                                this process (inside ANNEALING)
+
+    Phase timing costs two clock reads per phase and iteration; the
+    objective calls are only wrapped once a profiler is attached.
+    Swarms and hives hold an inactive profiler by default, whose
+    phases do nothing.
+"""
+
+ITERATION = "iteration"
+VELOCITY = "velocity"
+ANNEALING = "annealing"
+SORTING = "sorting"
+ADMIN = "admin"
+EVALUATION = "evaluation"
+
+NO_PHASE = contextlib.nullcontext()
+
+
+class Profiler(object):
+
+    """
+     Constructor.
+
+     @param profile:      Capture a cProfile of updateWithVels()
+     @param memory:       Capture tracemalloc snapshots around
+                           updateWithVels()
+     @param memoryFrames: Stack frames kept per traced allocation
+     @param active:       False builds the do-nothing profiler
+     """
+    def __init__(self, profile=False, memory=False, memoryFrames=1, active=True):
+        self.active = active
+        self.profile = cProfile.Profile() if (active and profile) else None
+        self.memory = active and memory
+        self.memoryFrames = memoryFrames
+        self.startedTracing = False
+        self.firstSnapshot = None
+        self.lastSnapshot = None
+        self.reset()
+
+
+    """
+     Clears the timers and counters. Captures already taken are kept.
+     """
+    def reset(self):
+        self.phases = dict()                   # name -> PhaseTimer
+        self.particleEvaluations = numpy.zeros(0, dtype=numpy.int64)
+
+
+    """
+     Timer of a phase, used as a context manager ::
+
+        with profiler.phase(SORTING):
+            ...
+
+     @param name: Phase name
+
+     @return: PhaseTimer, or a null context when inactive
+     """
+    def phase(self, name):
+        if(not self.active):
+            return NO_PHASE
+        timer = self.phases.get(name)
+        if(timer is None):
+            timer = self.phases[name] = PhaseTimer()
+        return timer
+
+
+    """
+     Wraps a Function's evaluation entry points, cost() and
+     solveArray(), so their calls are timed under EVALUATION. Calls
+     nested in one another are timed once. A Function is wrapped at
+     most once per profiler.
+
+     @param FX: ContinuousFunction instance
+
+     @return: the Function
+     """
+    def instrument(self, FX):
+        if(not self.active or getattr(FX, "profiler", None) is self):
+            return FX
+        timer = self.phase(EVALUATION)
+        cost = FX.cost
+        solveArray = FX.solveArray
+
+        def timedCost(position):
+            if(timer.depth):
+                return cost(position)
+            with timer:
+                timer.evaluations = timer.evaluations + 1
+                return cost(position)
+
+        def timedSolveArray(positions):
+            if(timer.depth):
+                return solveArray(positions)
+            with timer:
+                timer.evaluations = timer.evaluations + len(positions)
+                return solveArray(positions)
+
+        FX.cost = timedCost
+        FX.solveArray = timedSolveArray
+        FX.profiler = self
+        return FX
+
+
+    """
+     Adds evaluations spent on particles.
+
+     @param particles:   Particle ID(s)
+     @param evaluations: Evaluations per particle, or one count for all
+     """
+    def countEvaluations(self, particles, evaluations):
+        if(not self.active):
+            return
+        particles = numpy.atleast_1d(numpy.asarray(particles, dtype=numpy.int64))
+        if(len(particles) == 0):
+            return
+        size = int(particles.max()) + 1
+        if(size > len(self.particleEvaluations)):
+            grown = numpy.zeros(max(size, 2*len(self.particleEvaluations)), dtype=numpy.int64)
+            grown[:len(self.particleEvaluations)] = self.particleEvaluations
+            self.particleEvaluations = grown
+        numpy.add.at(self.particleEvaluations, particles,
+                     numpy.asarray(evaluations, dtype=numpy.int64))
+
+
+    """
+     Context of the optional cProfile and tracemalloc captures, wrapped
+     around Swarm.updateWithVels().
+
+     @return: context manager
+     """
+    def capture(self):
+        if(self.profile is None and not self.memory):
+            return NO_PHASE
+        return self.captureContext()
+
+    @contextlib.contextmanager
+    def captureContext(self):
+        if(self.memory and not tracemalloc.is_tracing()):
+            tracemalloc.start(self.memoryFrames)
+            self.startedTracing = True
+        if(self.memory and self.firstSnapshot is None):
+            self.firstSnapshot = tracemalloc.take_snapshot()
+        if(self.profile is not None):
+            self.profile.enable()
+        try:
+            yield
+        finally:
+            if(self.profile is not None):
+                self.profile.disable()
+            if(self.memory and tracemalloc.is_tracing()):
+                self.lastSnapshot = tracemalloc.take_snapshot()
+
+
+    """
+     Stops tracemalloc if this profiler started it.
+     """
+    def close(self):
+        if(self.startedTracing and tracemalloc.is_tracing()):
+            tracemalloc.stop()
+        self.startedTracing = False
+
+
+    """
+     Timers by phase.
+
+     @return: dict of phase -> {"seconds", "calls", "mean"} (and
+         "evaluations" for EVALUATION)
+     """
+    def getStats(self):
+        stats = dict()
+        for name, timer in self.phases.items():
+            stats[name] = {"seconds": timer.seconds,
+                           "calls": timer.calls,
+                           "mean": timer.seconds/timer.calls if timer.calls else 0.0}
+            if(name == EVALUATION):
+                stats[name]["evaluations"] = timer.evaluations
+        return stats
+
+
+    """
+     Evaluations spent on each particle, indexed by particle ID.
+
+     @return: array of counts
+     """
+    def getParticleEvaluations(self):
+        return self.particleEvaluations.copy()
+
+
+    """
+     cProfile report of the captured iterations.
+
+     @param sort:  pstats sort key
+     @param limit: Number of functions listed
+
+     @return: report text, or None without a cProfile capture
+     """
+    def getProfileStats(self, sort="cumulative", limit=20):
+        if(self.profile is None):
+            return None
+        stream = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=stream)
+        stats.sort_stats(sort).print_stats(limit)
+        return stream.getvalue()
+
+
+    """
+     Memory growth over the captured iterations, from the snapshots
+     taken before the first and after the last of them.
+
+     @param limit: Number of allocation sites listed
+
+     @return: dict with current and peak traced bytes and the top
+         sites as (location, size difference, count difference), or
+         None without a tracemalloc capture
+     """
+    def getMemoryStats(self, limit=10):
+        if(self.lastSnapshot is None):
+            return None
+        current, peak = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (None, None)
+        top = self.lastSnapshot.compare_to(self.firstSnapshot, "lineno")[:limit]
+        return {"current": current,
+                "peak": peak,
+                "top": [(str(entry.traceback), entry.size_diff, entry.count_diff)
+                        for entry in top]}
+
+
+    """
+     Prints the phase timers. On demand only.
+     """
+    def report(self):
+        print("Profiler Report -->>")
+        for name, stats in sorted(self.getStats().items(),
+                                  key=lambda item: -item[1]["seconds"]):
+            print("  %-12s %10.4f s  %8d calls  %10.6f s/call" %
+                  (name, stats["seconds"], stats["calls"], stats["mean"]))
+        evaluations = self.particleEvaluations
+        if(evaluations.any()):
+            print("  Evaluations per particle :: min %d, mean %.1f, max %d" %
+                  (evaluations.min(), evaluations.mean(), evaluations.max()))
+
+
+"""
+---------------------------------------
+CLASS :: PhaseTimer
+---------------------------------------
+
+ Cumulative wall time and calls of one phase; a reusable context
+ manager.
+ """
+class PhaseTimer(object):
+
+    __slots__ = ("seconds", "calls", "evaluations", "depth", "start")
+
+    def __init__(self):
+        self.seconds = 0.0
+        self.calls = 0
+        self.evaluations = 0
+        self.depth = 0
+        self.start = 0.0
+
+    def __enter__(self):
+        self.depth = self.depth + 1
+        if(self.depth == 1):
+            self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.depth = self.depth - 1
+        if(self.depth == 0):
+            self.seconds = self.seconds + time.perf_counter() - self.start
+            self.calls = self.calls + 1
+        return False
@@ -0,0 +1,39 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from ContinuousFunction import ContinuousFunction
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B-Gamma
+
+    Standard N-dimensional test problem for load testing the hybrid.
+
+    This is the Rastrigin Function, a regular grid of local minima
+    around a single global minimum.
+    Known optimum at ::   0 at (0, ..., 0)
+"""
+
+class Rastrigin(ContinuousFunction):
+
+    lower = -5.12
+    upper = 5.12
+    defaultDimensions = 10
+
+
+    """
+     Solves the Rastrigin Function for a whole (n, D) array of
+     coordinates at once. Does not touch the instance variables.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of cost evaluations
+     """
+    def solveArray(self, positions):
+        positions = numpy.asarray(positions, dtype=float)
+        return (10*positions.shape[-1] +
+                numpy.sum(positions*positions - 10*numpy.cos(2*numpy.pi*positions), axis=-1))
@@ -0,0 +1,40 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from ContinuousFunction import ContinuousFunction
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B-Delta
+
+    Standard N-dimensional test problem for load testing the hybrid.
+
+    This is the Rosenbrock Function, whose minimum lies at the end of
+    a long, narrow, curved valley.
+    Known optimum at ::   0 at (1, ..., 1)
+"""
+
+class Rosenbrock(ContinuousFunction):
+
+    lower = -5
+    upper = 10
+    defaultDimensions = 10
+
+
+    """
+     Solves the Rosenbrock Function for a whole (n, D) array of
+     coordinates at once. Does not touch the instance variables.
+
+     @param positions: (n, D) array of coordinate vectors
+
+     @return: array of cost evaluations
+     """
+    def solveArray(self, positions):
+        positions = numpy.asarray(positions, dtype=float)
+        head = positions[..., :-1]
+        tail = positions[..., 1:]
+        return numpy.sum(100*numpy.square(tail - head*head) + numpy.square(1 - head), axis=-1)
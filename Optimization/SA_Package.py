@@ -1,21 +1,42 @@
 """ Python Package Support """
+import argparse
+import concurrent.futures
+import os
 import random
 import math
 import abc
+import sys
+import numpy
 
 """ Internal Package Support """
 from SimulatedAnnealing import SimulatedAnnealing as SimAnn
+from Swarm import Swarm
+from Stopping import StoppingCriteria, TARGET
+from Objectives import getObjective
 
 
 """
     @author:     Matthew J Swann
-    @version:    1.0, Last Update: 2012-11-20
+    @version:    1.0, Last Update: 2026-10-18
     
     Program:     Reflective Optimization
     Integration: Tier 2
     
     Optimization classes to be run upon the SA Algorithm
     itself.  
+
+    RacingTuner is the reflective optimizer of the hybrid's own
+    settings :: the PSO constants, the SA temperature and move
+    control, and the iteration counts. Candidates are drawn at random
+    from a ParameterSpace and raced by successive halving; every rung
+    runs the surviving candidates on the same seeds with an
+    evaluation budget eta times the last one and keeps the best
+    1/eta of them. Candidates are scored by their penalized
+    evaluations to the goal (PAR2 :: a run that misses the goal
+    counts twice the budget), so a candidate that only loses on
+    partial results is dropped before the large budgets are spent ::
+
+        python SA_Package.py --function 1 --candidates 27 --workers 4
 """
 
 class SA_Omega(object):
@@ -35,7 +56,7 @@ class SA_Omega(object):
      """
     def __init__(self, funcNum, initTemp, extIters, intIters,
                  moveCont, localSearch, expand):
-        """ SA Initialization """
+        """ SA Configuration -- no chain runs until SA.run() """
         self.SA = SimAnn(funcNum, initTemp, extIters,
                  intIters, moveCont, localSearch, expand)
         """ Instance variables """
@@ -98,4 +119,250 @@ class SA_Alpha(SA_Omega):
     def getBestMoves(self):
         return self.bestMoves
         
-        
\ No newline at end of file
+        
+
+
+""" Tuned parameters :: (low, high, kind); kind is "float", "log" or "int" """
+PARAMETER_SPACE = {"phiOne": (1.5, 2.5, "float"),
+                   "phiTwo": (1.5, 2.5, "float"),
+                   "inertia": (0.4, 1.0, "float"),
+                   "constant": (0.5, 1.0, "float"),
+                   "initTemp": (1.0, 1000.0, "log"),
+                   "alpha": (0.8, 0.999, "float"),
+                   "extIters": (5, 200, "int"),
+                   "intIters": (5, 250, "int")}
+
+
+"""
+---------------------------------------
+CLASS :: ParameterSpace
+---------------------------------------
+
+ Ranges the tuner draws candidate configurations from.
+ """
+class ParameterSpace(object):
+
+    """
+     @param ranges: dict of name -> (low, high, kind) (None ::
+                     PARAMETER_SPACE); "int" ranges are drawn on a log
+                     scale, as iteration counts are
+     @param fixed:  dict of name -> value held constant
+     """
+    def __init__(self, ranges=None, fixed=None):
+        self.ranges = dict(PARAMETER_SPACE if ranges is None else ranges)
+        self.fixed = dict(fixed or dict())
+        for name in self.fixed:
+            self.ranges.pop(name, None)
+
+
+    """
+     Draws a configuration.
+
+     @param rng: numpy.random.Generator
+
+     @return: dict of name -> value
+     """
+    def sample(self, rng):
+        configuration = dict(self.fixed)
+        for name, (low, high, kind) in self.ranges.items():
+            if(kind == "float"):
+                configuration[name] = float(rng.uniform(low, high))
+            else:
+                value = math.exp(rng.uniform(math.log(low), math.log(high)))
+                configuration[name] = int(round(value)) if kind == "int" else float(value)
+        return configuration
+
+
+"""
+---------------------------------------
+CLASS :: RacingTuner
+---------------------------------------
+
+ Random search and successive halving over swarm/annealing settings,
+ minimizing evaluations to the objective's goal. Trials run across a
+ process pool.
+ """
+class RacingTuner(object):
+
+    """
+     Constructor.
+
+     @param funcNum:    Objective key, see Objectives.getObjective()
+     @param popSize:    Swarm size of every trial
+     @param space:      ParameterSpace (None :: the default ranges)
+     @param trials:     Seeds every candidate is run on per rung
+     @param eta:        Halving rate; each rung keeps 1/eta of the
+                         candidates and multiplies the budget by eta
+     @param minBudget:  Evaluation budget per trial of the first rung
+     @param maxBudget:  Largest budget per trial
+     @param saMode:     Hive annealing mode of the trials
+     @param tolerance:  Distance to the goal that counts as reaching it
+     @param workers:    Process count (None :: all cores)
+     @param seed:       Seed of the candidate draws and trial seeds
+     """
+    def __init__(self, funcNum, popSize=20, space=None, trials=3, eta=3,
+                 minBudget=20000, maxBudget=1000000, saMode="batch",
+                 tolerance=0.00005, workers=None, seed=None):
+        self.objective = getObjective(funcNum)
+        self.popSize = popSize
+        self.space = space or ParameterSpace()
+        self.trials = trials
+        self.eta = max(2, int(eta))
+        self.minBudget = minBudget
+        self.maxBudget = maxBudget
+        self.saMode = saMode
+        self.tolerance = tolerance
+        self.workers = workers or os.cpu_count() or 1
+        self.rng = numpy.random.default_rng(seed)
+        self.seeds = [int(value) for value in self.rng.integers(0, 2**32, trials)]
+        self.history = list()                  # One record per candidate and rung
+
+
+    """
+     Successive halving from a set of random candidates.
+
+     @param candidates: Number of configurations drawn
+
+     @return: Returns the record of the winning configuration.
+     """
+    def tune(self, candidates=27):
+        population = [self.space.sample(self.rng) for i in range (candidates)]
+        budget = self.minBudget
+        rung = 0
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            while True:
+                records = self.race(executor, population, budget, rung)
+                keep = max(1, len(records)//self.eta)
+                if(len(records) == 1 or budget >= self.maxBudget):
+                    return records[0]
+                population = [record["configuration"] for record in records[:keep]]
+                budget = min(self.maxBudget, budget*self.eta)
+                rung = rung + 1
+
+
+    """
+     Plain random search :: every candidate at one budget.
+
+     @param candidates: Number of configurations drawn
+     @param budget:     Evaluation budget per trial (None :: maxBudget)
+
+     @return: Returns the record of the best configuration.
+     """
+    def randomSearch(self, candidates=20, budget=None):
+        population = [self.space.sample(self.rng) for i in range (candidates)]
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            return self.race(executor, population, budget or self.maxBudget, 0)[0]
+
+
+    """
+     Runs every candidate on every seed at one budget and ranks them.
+
+     @param executor:   Process pool
+     @param population: Candidate configurations
+     @param budget:     Evaluation budget per trial
+     @param rung:       Rung number, for the history
+
+     @return: list of records, best first
+     """
+    def race(self, executor, population, budget, rung):
+        tasks = [(configuration, seed) for configuration in population
+                 for seed in self.seeds]
+        results = list(executor.map(runTrial, [self.objective]*len(tasks),
+                                    [self.popSize]*len(tasks), [self.saMode]*len(tasks),
+                                    [task[0] for task in tasks], [task[1] for task in tasks],
+                                    [budget]*len(tasks), [self.tolerance]*len(tasks)))
+        records = list()
+        for i in range (len(population)):
+            runs = results[i*len(self.seeds):(i + 1)*len(self.seeds)]
+            penalized = [run["evaluations"] if run["success"] else 2*budget for run in runs]
+            records.append({"rung": rung,
+                            "budget": budget,
+                            "configuration": population[i],
+                            "score": float(numpy.mean(penalized)),
+                            "successes": sum(run["success"] for run in runs),
+                            "meanCost": float(numpy.mean([run["bestCost"] for run in runs]))})
+        records.sort(key=lambda record: (record["score"], record["meanCost"]))
+        self.history.extend(records)
+        return records
+
+
+    """
+     Returns every record so far, in race order.
+
+     @return: list of records
+     """
+    def getHistory(self):
+        return self.history
+
+
+"""
+ Worker for RacingTuner. One Swarm run with a candidate configuration,
+ capped at one swarm iteration per evaluation of the budget so a trial
+ always ends.
+
+ @param funcNum:       Objective key
+ @param popSize:       Swarm size
+ @param saMode:        Hive annealing mode
+ @param configuration: dict of tuned parameters
+ @param seed:          Seed of the run's Generator
+ @param budget:        Evaluation budget
+ @param tolerance:     Distance to the goal that counts as reaching it
+
+ @return: dict with success, evaluations and bestCost
+ """
+def runTrial(funcNum, popSize, saMode, configuration, seed, budget, tolerance=0.00005):
+    objective = getObjective(funcNum)
+    swarm = Swarm(popSize, configuration["phiOne"], configuration["phiTwo"],
+                  configuration["inertia"], configuration["constant"], objective,
+                  saMode=saMode, rng=numpy.random.default_rng(seed))
+    swarm.getHive().setSASettings(configuration["initTemp"], configuration["extIters"],
+                                  configuration["intIters"], configuration["alpha"],
+                                  True, True)
+    try:
+        """ an iteration spending anything spends an evaluation :: budget bounds them """
+        swarm.run(budget, StoppingCriteria(budget, objective.goal, tolerance))
+    finally:
+        swarm.getHive().shutdown()
+    return {"success": swarm.getStopReason() == TARGET,
+            "evaluations": int(swarm.getEvaluations()),
+            "bestCost": float(swarm.getBestCost())}
+
+
+"""
+ Command line entry point.
+ """
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Racing tuner for the swarm/annealing settings")
+    parser.add_argument("--function", default="2")
+    parser.add_argument("--population", type=int, default=20)
+    parser.add_argument("--candidates", type=int, default=27)
+    parser.add_argument("--trials", type=int, default=3)
+    parser.add_argument("--eta", type=int, default=3)
+    parser.add_argument("--min-budget", type=int, default=20000)
+    parser.add_argument("--max-budget", type=int, default=1000000)
+    parser.add_argument("--mode", default="batch")
+    parser.add_argument("--tolerance", type=float, default=0.00005)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--random-search", action="store_true")
+    args = parser.parse_args(argv)
+
+    function = int(args.function) if args.function.isdigit() else args.function
+    tuner = RacingTuner(function, args.population, trials=args.trials, eta=args.eta,
+                        minBudget=args.min_budget, maxBudget=args.max_budget,
+                        saMode=args.mode, tolerance=args.tolerance,
+                        workers=args.workers, seed=args.seed)
+    if(args.random_search):
+        best = tuner.randomSearch(args.candidates)
+    else:
+        best = tuner.tune(args.candidates)
+    for record in tuner.getHistory():
+        print("rung %d budget %d: score %.0f, %d/%d at goal" %
+              (record["rung"], record["budget"], record["score"],
+               record["successes"], args.trials))
+    print(best)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,259 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 2A-Scheduling
+
+    Policies deciding which particles Hive.SimAnn() anneals on a swarm
+    iteration and how long each chain runs. Without a policy every
+    particle gets a full chain, leader and straggler alike; a policy
+    spends the annealing budget where it is likely to move bestCost.
+
+    A policy is asked for a plan once per SimAnn() call, with the
+    particles' IDs and personal best costs in population order, and
+    answers with the population indices to anneal and the external
+    iterations of each chain; a chain costs about setup +
+    external*internal evaluations, internal counting every replica and
+    setup the replicas' first evaluation in the "tempering" mode. Attach one with Hive.setAnnealingPolicy().
+
+    A policy that learns across plans saves what it learned with
+    getState(); a checkpoint keeps it when the policy is attached, and
+    resumeSwarm(..., policy=) restores it onto a new policy object.
+
+    Policies ::  AllParticles       -- every particle, full chains
+                                       (the original behavior)
+                 TopK               -- the k best particles only
+                 Stagnating         -- particles whose personal best
+                                       has not improved for a while
+                 RankProportional   -- every particle, chains shorter
+                                       down the ranking
+                 FixedBudget        -- a total evaluation budget per
+                                       iteration split across the
+                                       particles another policy picks
+"""
+
+class AnnealingPolicy(object):
+
+    """
+     Particles to anneal and their chain lengths.
+
+     @param ids:       Particle IDs, in population order
+     @param costs:     Personal best costs, in population order
+     @param external:  External iterations of a full chain
+     @param internal:  Evaluations per external iteration of a chain
+     @param setup:     Evaluations a chain spends before its first
+                        external iteration, the replicas' first
+                        evaluation in the "tempering" mode
+
+     @return: indices --   population indices to anneal
+     @return: externals -- external iterations of each of their chains
+     """
+    def plan(self, ids, costs, external, internal, setup=0):
+        raise NotImplementedError
+
+
+    """
+     Clears whatever the policy learned about the particles.
+     """
+    def reset(self):
+        pass
+
+
+    """
+     Returns what the policy learned, for a checkpoint.
+
+     @return: state dict
+     """
+    def getState(self):
+        return dict()
+
+
+    """
+     Restores what getState() saved.
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        pass
+
+
+    """
+     Population indices by rank, best personal best first.
+
+     @param costs: Personal best costs, in population order
+
+     @return: array of indices
+     """
+    def ranking(self, costs):
+        return numpy.argsort(costs, kind="stable")
+
+
+"""
+---------------------------------------
+CLASS :: AllParticles
+---------------------------------------
+
+ Every particle gets a full chain.
+ """
+class AllParticles(AnnealingPolicy):
+
+    def plan(self, ids, costs, external, internal, setup=0):
+        return numpy.arange(len(costs)), numpy.full(len(costs), external)
+
+
+"""
+---------------------------------------
+CLASS :: TopK
+---------------------------------------
+
+ Full chains for the k best particles only.
+ """
+class TopK(AnnealingPolicy):
+
+    """
+     @param k: Particles annealed per iteration
+     """
+    def __init__(self, k=1):
+        self.k = k
+
+    def plan(self, ids, costs, external, internal, setup=0):
+        indices = self.ranking(costs)[:self.k]
+        return indices, numpy.full(len(indices), external)
+
+
+"""
+---------------------------------------
+CLASS :: Stagnating
+---------------------------------------
+
+ Full chains for the particles whose personal best has not improved
+ for patience plans in a row, so the annealing acts as the escape of
+ particles the swarm update no longer moves forward. A particle is
+ annealed again only once it stagnates again.
+ """
+class Stagnating(AnnealingPolicy):
+
+    """
+     @param patience: Plans without improvement before a particle is
+                       annealed
+     @param limit:    Most particles annealed per iteration, the
+                       best ranked first (None :: no limit)
+     """
+    def __init__(self, patience=3, limit=None):
+        self.patience = patience
+        self.limit = limit
+        self.reset()
+
+    def reset(self):
+        self.bestCosts = dict()                # ID -> personal best at the last plan
+        self.ages = dict()                     # ID -> plans without improvement
+
+    def getState(self):
+        particles = sorted(self.bestCosts)
+        return {"particles": particles,
+                "bestCosts": [self.bestCosts[particle] for particle in particles],
+                "ages": [self.ages[particle] for particle in particles]}
+
+    def setState(self, state):
+        self.bestCosts = dict(zip(state["particles"], state["bestCosts"]))
+        self.ages = dict(zip(state["particles"], state["ages"]))
+
+    def plan(self, ids, costs, external, internal, setup=0):
+        stagnant = list()
+        for index in self.ranking(costs).tolist():
+            particle = int(ids[index])
+            cost = float(costs[index])
+            if(cost < self.bestCosts.get(particle, float("inf"))):
+                self.ages[particle] = 0
+            else:
+                self.ages[particle] = self.ages.get(particle, 0) + 1
+            self.bestCosts[particle] = cost
+            if(self.ages[particle] >= self.patience):
+                stagnant.append(index)
+        if(self.limit is not None):
+            stagnant = stagnant[:self.limit]
+        for index in stagnant:
+            self.ages[int(ids[index])] = 0
+        indices = numpy.array(stagnant, dtype=numpy.int64)
+        return indices, numpy.full(len(indices), external)
+
+
+"""
+---------------------------------------
+CLASS :: RankProportional
+---------------------------------------
+
+ Every particle, with chain lengths falling linearly from a full
+ chain for the best ranked particle to minShare of one for the
+ worst.
+ """
+class RankProportional(AnnealingPolicy):
+
+    """
+     @param minShare: Share of a full chain left to the worst particle
+     """
+    def __init__(self, minShare=0.1):
+        self.minShare = minShare
+
+    def plan(self, ids, costs, external, internal, setup=0):
+        size = len(costs)
+        indices = self.ranking(costs)
+        shares = 1 - (1 - self.minShare)*numpy.arange(size)/max(1, size - 1)
+        return indices, numpy.maximum(1, numpy.rint(shares*external)).astype(numpy.int64)
+
+
+"""
+---------------------------------------
+CLASS :: FixedBudget
+---------------------------------------
+
+ A fixed number of evaluations per swarm iteration, split across the
+ particles another policy selects, evenly or in proportion to their
+ chain lengths under that policy. No chain runs longer than the
+ policy's own plan allows, and none is annealed when the budget is
+ below a single external iteration.
+ """
+class FixedBudget(AnnealingPolicy):
+
+    """
+     @param evaluations: Evaluations per swarm iteration
+     @param policy:      Policy selecting the particles and weighting
+                          their shares (None :: AllParticles)
+     @param weighted:    Split in proportion to the policy's chain
+                          lengths instead of evenly
+     """
+    def __init__(self, evaluations, policy=None, weighted=False):
+        self.evaluations = evaluations
+        self.policy = policy or AllParticles()
+        self.weighted = weighted
+
+    def reset(self):
+        self.policy.reset()
+
+    def getState(self):
+        return self.policy.getState()
+
+    def setState(self, state):
+        self.policy.setState(state)
+
+    def plan(self, ids, costs, external, internal, setup=0):
+        indices, externals = self.policy.plan(ids, costs, external, internal, setup)
+        if(len(indices) == 0):
+            return indices, externals
+        weights = externals if self.weighted else numpy.ones(len(indices))
+        shares = self.evaluations*weights/weights.sum()
+        externals = numpy.minimum(externals, numpy.floor((shares - setup)/max(1, internal)))
+        keep = externals > 0
+        if(not keep.any()):
+            """ budget below one external iteration each :: the best ranked first """
+            count = int(self.evaluations//max(1, internal + setup))
+            ranked = indices[numpy.argsort(numpy.asarray(costs)[indices], kind="stable")]
+            return ranked[:count], numpy.ones(min(count, len(indices)), dtype=numpy.int64)
+        return indices[keep], externals[keep].astype(numpy.int64)
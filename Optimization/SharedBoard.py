@@ -0,0 +1,237 @@
+""" Python Package Support """
+import multiprocessing
+from multiprocessing import shared_memory
+import time
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 0-Shared
+
+    Global best board in shared memory for processes working on one
+    optimization. The board holds the best cost, its coord vector and
+    the ID of its owner in a multiprocessing.shared_memory block that
+    every process maps, so reading the current best is a few loads
+    from memory instead of a round trip through a pipe.
+
+    Readers never lock. The entry is guarded by a sequence counter
+    (a seqlock): a writer makes it odd before touching the entry and
+    even again afterwards, and a reader retries until it saw the same
+    even count before and after its copy. A reader gives up with a
+    RuntimeError once the count stayed odd past its timeout, which
+    means a writer died mid-update. Writers compare first
+    without the lock and only take it to publish an actual
+    improvement, comparing again under it, so offers that do not beat
+    the board cost nothing but a load.
+
+    The board can also carry population arrays (positions, personal
+    bests and their costs) in the same block; see getArrays() and
+    ArrayHive.shareArrays().
+
+    A board is handed to a worker as a Process argument (or through a
+    pool initializer); passed that way the worker maps the same block.
+    The creating process calls unlink() once every process is done.
+"""
+
+HEADER = 4                              # int64 words :: seq, owner, updates, spare
+
+
+class SharedBestBoard(object):
+
+    """
+     Constructor. Creates a new board.
+
+     @param dimensions:     Length of the coord vectors
+     @param populationSize: Rows of the population arrays (None :: no
+                             arrays)
+     @param lock:           multiprocessing Lock for the writers (None
+                             :: a new one)
+     """
+    def __init__(self, dimensions, populationSize=None, lock=None):
+        self.dimensions = dimensions
+        self.populationSize = populationSize
+        self.lock = lock or multiprocessing.Lock()
+        self.memory = shared_memory.SharedMemory(create=True, size=self.getSize())
+        self.owner = True
+        self.mapArrays()
+        self.header[:] = 0
+        self.header[1] = -1
+        self.entry[0] = float("inf")
+        self.entry[1:] = 0.0
+        if(populationSize is not None):
+            self.bestCosts[:] = float("inf")
+
+
+    """
+     Bytes needed for the board.
+
+     @return: Returns the block size.
+     """
+    def getSize(self):
+        words = HEADER + 1 + self.dimensions
+        if(self.populationSize is not None):
+            words = words + self.populationSize*(2*self.dimensions + 1)
+        return 8*words
+
+
+    """
+     Builds the NumPy views over the shared block.
+     """
+    def mapArrays(self):
+        buffer = self.memory.buf
+        self.header = numpy.ndarray((HEADER,), dtype=numpy.int64, buffer=buffer)
+        self.entry = numpy.ndarray((1 + self.dimensions,), dtype=float,
+                                   buffer=buffer, offset=8*HEADER)
+        self.positions = self.bestPositions = self.bestCosts = None
+        if(self.populationSize is not None):
+            offset = 8*(HEADER + 1 + self.dimensions)
+            shape = (self.populationSize, self.dimensions)
+            self.positions = numpy.ndarray(shape, dtype=float, buffer=buffer,
+                                           offset=offset)
+            offset = offset + self.positions.nbytes
+            self.bestPositions = numpy.ndarray(shape, dtype=float, buffer=buffer,
+                                               offset=offset)
+            offset = offset + self.bestPositions.nbytes
+            self.bestCosts = numpy.ndarray((self.populationSize,), dtype=float,
+                                           buffer=buffer, offset=offset)
+
+
+    """
+     Pickling support; an unpickled board maps the same block.
+     """
+    def __getstate__(self):
+        return {"dimensions": self.dimensions,
+                "populationSize": self.populationSize,
+                "lock": self.lock,
+                "name": self.memory.name}
+
+    def __setstate__(self, state):
+        self.dimensions = state["dimensions"]
+        self.populationSize = state["populationSize"]
+        self.lock = state["lock"]
+        self.memory = shared_memory.SharedMemory(name=state["name"])
+        self.owner = False
+        self.mapArrays()
+
+
+    """
+     Best cost on the board, read without the lock. A single aligned
+     word, so never torn.
+
+     @return: Returns the best cost.
+     """
+    def getBestCost(self):
+        return float(self.entry[0])
+
+
+    """
+     Consistent copy of the board's entry.
+
+     @param timeout: Seconds to retry while a write is in progress
+
+     @return: (bestCost, bestPosition, owner, updates)
+     """
+    def read(self, timeout=1.0):
+        deadline = None
+        while True:
+            sequence = int(self.header[0])
+            if(not sequence & 1):
+                entry = self.entry.copy()
+                owner = int(self.header[1])
+                updates = int(self.header[2])
+                if(int(self.header[0]) == sequence):
+                    return float(entry[0]), entry[1:], owner, updates
+            if(deadline is None):
+                deadline = time.monotonic() + timeout
+            elif(time.monotonic() > deadline):
+                raise RuntimeError("board entry stayed mid-update for %gs; "
+                                   "a writer died while publishing" % timeout)
+
+
+    """
+     Compare-and-update :: publishes a solution if it beats the board.
+
+     @param cost:     Cost of the solution
+     @param position: Coord vector of the solution
+     @param owner:    ID of the publisher, e.g. an island or particle
+
+     @return: True if the board was updated
+     """
+    def offer(self, cost, position, owner=0):
+        if(not cost < self.entry[0]):
+            return False
+        with self.lock:
+            """ another writer may have published since the first check """
+            if(not cost < self.entry[0]):
+                return False
+            self.header[0] = self.header[0] + 1
+            self.entry[1:] = position
+            self.entry[0] = cost
+            self.header[1] = owner
+            self.header[2] = self.header[2] + 1
+            self.header[0] = self.header[0] + 1
+        return True
+
+
+    """
+     Updates published so far; cheap to poll for news.
+
+     @return: Returns the update count.
+     """
+    def getUpdates(self):
+        return int(self.header[2])
+
+
+    """
+     Shared population arrays, written in place by whoever owns the
+     population and read zero-copy by the others.
+
+     @return: (positions, bestPositions, bestCosts) views, or None
+         without a population
+     """
+    def getArrays(self):
+        if(self.populationSize is None):
+            return None
+        return self.positions, self.bestPositions, self.bestCosts
+
+
+    """
+     Unmaps the block in this process. The views above become
+     invalid.
+     """
+    def close(self):
+        self.header = self.entry = None
+        self.positions = self.bestPositions = self.bestCosts = None
+        self.memory.close()
+
+
+    """
+     Closes the board and frees the block. Creating process only.
+     """
+    def unlink(self):
+        self.close()
+        if(self.owner):
+            self.memory.unlink()
+
+
+    """
+     Basic accessor methods.
+
+     @return: dimensions -- length of the coord vectors
+     @return: populationSize -- rows of the population arrays
+     @return: name -- name of the shared memory block
+     """
+    def getDimensions(self):
+        return self.dimensions
+
+    def getPopulationSize(self):
+        return self.populationSize
+
+    def getName(self):
+        return self.memory.name
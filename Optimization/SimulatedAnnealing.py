@@ -1,11 +1,12 @@
 """ Python Package Support """
-import random
 import math
-import sys
+import time
+import numpy
 
 """ Internal Package Support """
-from FunctionOne import FunctionOne
-from FunctionTwo import FunctionTwo
+from Objectives import getObjective
+from Telemetry import Telemetry, GOAL, CHAIN
+from Cooling import GeometricCooling
 
 
 """
@@ -25,146 +26,228 @@ class SimulatedAnnealing(object):
     """
      Initialization for the BASIC SA level
      
-     @param funcNum: Number 1 or (other) :: control for the Function
-         class to be evaluated
+     @param funcNum: Objective name, ObjectiveDefinition, or number
+         1 or (other) :: control for the Function class to be evaluated
      @param initTemp:    Initial temperature
      @param extIters:    External iterations
      @param intIters:    Internal iterations
      @param moveCont:    Alpha value // move control
      @param localSearch: Local Search control
      @param expand:      Re-heat // tempering mechanism
+     @param telemetry:   Telemetry receiving GOAL and CHAIN events
+     @param stopping:    StoppingCriteria checked once per external
+         iteration, and on every improvement for the target
+     @param cache:       EvaluationCache for the objective, or None
+     @param schedule:    CoolingSchedule (None :: GeometricCooling, the
+         original T*alpha with a reset below 1)
+     @param stepControl: AcceptanceStepControl sizing the moves, or
+         None for the range scaled by T/T0 under local search; needs
+         "metropolis" acceptance
+     @param acceptance:  "legacy" tests a worse move against the best
+         solution, as the original did; "metropolis" tests it against
+         the current solution with exp(-delta/T)
+     @param rng:         NumPy Generator the chain draws from (None ::
+         the global numpy.random generator)
+     @param surrogate:   RBFSurrogate screening the moves before they
+         reach the objective, or None; needs "metropolis" acceptance
      """
     def __init__(self, funcNum, initTemp, extIters, intIters, 
-                 moveCont, localSearch, expand):
+                 moveCont, localSearch, expand, telemetry=None,
+                 stopping=None, cache=None, schedule=None,
+                 stepControl=None, acceptance="legacy", rng=None,
+                 surrogate=None):
+        if(stepControl is not None and acceptance != "metropolis"):
+            raise ValueError("step control needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes every move, so the ratio it "
+                             "steers is always 1" % acceptance)
+        if(surrogate is not None and acceptance != "metropolis"):
+            raise ValueError("surrogate screening needs acceptance=\"metropolis\"; "
+                             "%r acceptance takes moves the screen would reject" % acceptance)
         """ Parameters """
-        if(funcNum == 1):
-            self.FX = FunctionOne()  # Six Hump Camelback Function for Eval
-            self.range = 0.5
-            self.goal = -1.031628453488552
-        else:
-            self.FX = FunctionTwo()  # Branin Function for Eval
-            self.range = 1.5
-            self.goal = 0.39788735775266204
+        self.objective = getObjective(funcNum)
+        self.random = numpy.random if rng is None else rng
+        self.FX = self.objective.create(rng)   # Function for Eval
+        self.range = self.objective.stepRange  # Neighborhood range
+        self.goal = self.objective.goal        # Known optimal cost
         self.initialTemp = initTemp  # Initial temperature
         self.external = extIters     # External Iterations for the SA Algorithm
         self.internal = intIters     # Internal iterations for the SA Algorithm
         self.alpha = moveCont        # Alpha value // Move control
         self.drillBit = localSearch  # Control for local search
         self.expansion = expand      # Re-heat
+        self.telemetry = telemetry or Telemetry()
+        self.stopping = stopping
+        self.FX.setCache(cache)
+        self.schedule = schedule or GeometricCooling()
+        self.stepControl = stepControl
+        self.acceptance = acceptance
+        self.surrogate = surrogate
         """ Instance variables """
         self.currentTemp = self.initialTemp    # Current temperature tracking
         self.currentSolution = None            # Current solution
-        self.bestSolution = 9999               # Best solution found
-        self.bestX = None                      # X coord for best solution
-        self.bestY = None                      # Y coord for best solution
+        self.bestSolution = float("inf")       # Best solution found
+        self.bestPosition = None               # Coord vector for best solution
         self.totalMoves = 0                    # Attempted moves
         self.movesAccepted = 0                 # Accepted moves
         self.movesToTarget = 0                 # Moves to goal value
         self.targetHits = 0                    # Times landed on target
         self.resets = 0                        # Temperature resets
-        self.SA()    
+        self.stopReason = None                 # Why the last run stopped early
+
+    """
+     Runs one chain. Construction only configures the annealer, so
+     one instance serves any number of chains, each started here or
+     through reset() and SA().
+
+     @param position: Starting coord vector (None :: carry on from
+         the current FX coords)
+
+     @return: Returns the best solution of the chain.
+     """
+    def run(self, position=None):
+        self.reset(position)
+        self.SA()
+        return self.bestSolution
+
+
+    """
+     Clears the counters and best values for a new chain.
+
+     @param position: Starting coord vector (None :: the current FX
+         coords)
+     """
+    def reset(self, position=None):
+        if(position is None):
+            position = self.FX.getPosition()
+        self.setVariables(position)
+
 
     """
      The Simulated Annealing Algorithm itself.
      """
     def SA(self):
-        import time
-        time.clock()
+        startTime = time.perf_counter()
+        telemetry = self.telemetry
+        stopping = self.stopping
+        if(stopping is not None):
+            stopping.start()
+        dimensions = self.FX.getDimensions()
+        schedule = self.schedule
+        stepControl = self.stepControl
+        surrogate = self.surrogate
+        metropolis = self.acceptance == "metropolis"
+        schedule.start(self.initialTemp, self.external, self.alpha, self.currentTemp)
+        if(stepControl is not None):
+            stepControl.start()
+        previousSolution = float("inf")
         for i in range (self.external):
-            for j in range (self.internal):
+            internal = self.internal
+            if(stopping is not None and stopping.maxEvaluations is not None):
+                internal = min(internal, stopping.remaining(self.totalMoves))
+            bestStore = self.bestSolution
+            """ random draws for the whole external iteration at once """
+            steps = self.random.uniform(-self.range, self.range,
+                                         (internal, dimensions))
+            if(stepControl is not None):
+                steps *= stepControl.scale
+            elif(self.drillBit):
+                steps *= self.currentTemp/self.initialTemp
+            randomNums = self.random.uniform(0, 1, internal).tolist()
+            for j in range (internal):
                 """ saving values if needed later """
-                xStore = self.FX.getX()
-                yStore = self.FX.getY() 
+                positionStore = self.FX.getPosition()
                 
-                self.randomStep()
+                if(surrogate is not None):
+                    """ moves the surrogate rejects cost no evaluation """
+                    candidate = self.FX.checkArray(positionStore + steps[j])
+                    threshold = previousSolution - self.currentTemp*math.log(max(randomNums[j], 1e-300))
+                    if(not surrogate.screen(candidate, threshold, self.random)[0]):
+                        continue
+                    self.randomStep(steps[j])
+                    surrogate.update(self.FX.getPosition(), self.currentSolution)
+                else:
+                    self.randomStep(steps[j])
                 if(self.currentSolution < self.bestSolution):
                     self.bestSolution = self.currentSolution
-                    self.bestX = self.FX.getX()
-                    self.bestY = self.FX.getY()
+                    self.bestPosition = self.FX.getPosition()
                     self.totalMoves = self.totalMoves + 1
                     self.movesAccepted = self.movesAccepted + 1
                     if ((self.goal - self.currentSolution) > -0.00005):
-                        print("<------GOAL------->")
-                        print(self.goal-self.currentSolution)
+                        if(telemetry.active):
+                            telemetry.emit(GOAL, {"cost": self.currentSolution,
+                                                  "goal": self.goal,
+                                                  "totalMoves": self.totalMoves})
                         if(self.movesToTarget == 0):
                             self.movesToTarget = self.movesAccepted            
+                    if(stopping is not None and stopping.reached(self.currentSolution)):
+                        break
                 else:
-                    randomNum = random.uniform(0, 1)
-                    if(randomNum > math.exp((self.currentSolution-self.bestSolution)/self.currentTemp)):
-                        self.FX.setVars(xStore, yStore)
+                    randomNum = randomNums[j]
+                    if(metropolis):
+                        delta = previousSolution - self.currentSolution
+                    else:
+                        delta = self.currentSolution - self.bestSolution
+                    if(randomNum > math.exp(min(delta/self.currentTemp, 709))):
+                        self.FX.setVars(positionStore)
+                        self.currentSolution = previousSolution
                         self.totalMoves = self.totalMoves + 1
                     else:
                         self.totalMoves = self.totalMoves + 1
                         self.movesAccepted = self.movesAccepted + 1                        
+                previousSolution = self.currentSolution
             """ Temperature Updates """           
-            self.currentTemp = self.currentTemp*self.alpha
-            if(self.currentTemp < 1):
-                self.currentTemp = self.initialTemp
+            temp = float(schedule.update(self.currentTemp, self.bestSolution < bestStore))
+            if(temp > self.currentTemp):
                 self.resets = self.resets + 1
-        print("-----------------------")
-        print("best solution: %s" % self.bestSolution)
-        print("time:")
-        print(time.clock())
-        
-        if ('time' in sys.modules.keys()):
-            del(sys.modules['time'])
+            self.currentTemp = temp
+            if(stepControl is not None):
+                stepControl.update(self.totalMoves, self.movesAccepted)
+            if(stopping is not None and stopping.update(self.totalMoves, self.bestSolution)):
+                break
+        self.stopReason = stopping.getReason() if stopping is not None else None
+        if(telemetry.active):
+            telemetry.emit(CHAIN, {"bestCost": self.bestSolution,
+                                   "bestPosition": self.bestPosition,
+                                   "totalMoves": self.totalMoves,
+                                   "movesAccepted": self.movesAccepted,
+                                   "movesToTarget": self.movesToTarget,
+                                   "stopReason": self.stopReason,
+                                   "seconds": time.perf_counter() - startTime})
 
     """
      Random neighborhood step based off the range of the neighborhood
-     set in the SA constructor.
+     set in the SA constructor. Every coordinate moves at once.
      
      Sets the currentSolution variable.
+
+     @param step: uniform draws in [-range, range], one per coordinate,
+         already scaled by the temperature when drilling
      """
-    def randomStep(self):
-        """ X update """
-        x = self.FX.getX()
-        if random.randint(0, 1) == 1:
-            if(self.drillBit):
-                x = (x - random.uniform(0, self.range)*self.currentTemp/self.initialTemp)
-            else:
-                x = (x - random.uniform(0, self.range))
-        else:
-            if(self.drillBit):
-                x = (x + random.uniform(0, self.range)*self.currentTemp/self.initialTemp)
-            else:
-                x = (x + random.uniform(0, self.range))
-        """ Y update """
-        y = self.FX.getY()
-        if random.randint(0, 1) == 1:
-            if(self.drillBit):
-                y = (y - random.uniform(0, self.range)*self.currentTemp/self.initialTemp)
-            else:
-                y = (y - random.uniform(0, self.range))
-        else:
-            if(self.drillBit):
-                y = (y + random.uniform(0, self.range)*self.currentTemp/self.initialTemp)
-            else:
-                y = (y + random.uniform(0, self.range))
+    def randomStep(self, step):
         """ Process updates """
-        self.currentSolution = self.FX.processValues(x, y)
+        self.currentSolution = self.FX.processValues(self.FX.getPosition() + step)
 
 
     """
      Resets the instance variables and sets the FX coords to the
      pass parameters.
      
-     @param xCoord: associated x coord
-     @param yCoord: associated y coord
+     @param position: associated coord vector
      """
-    def setVariables(self, xCoord, yCoord):
+    def setVariables(self, position):
         """ reset instance variables """
         self.currentTemp = self.initialTemp    # Current temperature tracking
         self.currentSolution = None            # Current solution
-        self.bestSolution = 9999               # Best solution found
-        self.bestX = None                      # X coord for best solution
-        self.bestY = None                      # Y coord for best solution
+        self.bestSolution = float("inf")       # Best solution found
+        self.bestPosition = None               # Coord vector for best solution
         self.totalMoves = 0                    # Attempted moves
         self.movesAccepted = 0                 # Accepted moves
         self.movesToTarget = 0                 # Moves to goal value
         self.targetHits = 0                    # Times landed on target
         self.resets = 0                        # Temperature resets
+        self.stopReason = None                 # Why the last run stopped early
         """ set Function coords """
-        self.FX.setVars(xCoord, yCoord)
+        self.FX.setVars(position)
 
 
     """
@@ -186,6 +269,12 @@ class SimulatedAnnealing(object):
     def setInternal(self, value):
         self.internal = value
         
+    def setStopping(self, criteria):
+        self.stopping = criteria
+
+    def setRandom(self, rng):
+        self.random = numpy.random if rng is None else rng
+        
     """
      Returns algorithmic values
      
@@ -208,11 +297,11 @@ class SimulatedAnnealing(object):
      
      @return: currentTemp --   current system temperature
      @return: bestSolution --  best known solution
-     @return: bestX --         x coord for best solution
-     @return: bestY --         y coord for best solution
+     @return: bestPosition --  coord vector for best solution
      @return: totalMoves --    total moves attempted
      @return: movesAccepted -- accepted moves
      @return: movesToTarget -- moves to target value
+     @return: stopReason --    why the last run stopped early, if it did
      """
     def getCurrentTemp(self):
         return self.currentTemp
@@ -220,11 +309,8 @@ class SimulatedAnnealing(object):
     def getBestSolution(self):
         return self.bestSolution
     
-    def getBestX(self):
-        return self.bestX
-    
-    def getBestY(self):
-        return self.bestY
+    def getBestPosition(self):
+        return self.bestPosition
     
     def getTotalMoves(self):
         return self.totalMoves
@@ -234,3 +320,6 @@ class SimulatedAnnealing(object):
     
     def getMovesToTarget(self):
         return self.movesToTarget
+    
+    def getStopReason(self):
+        return self.stopReason
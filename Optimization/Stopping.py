@@ -0,0 +1,216 @@
+""" Python Package Support """
+import time
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 0
+
+    Stopping rules shared by the SA, Hive and Swarm levels. A single
+    StoppingCriteria combines an objective evaluation budget, a target
+    cost with a tolerance, a no-improvement stagnation window and a
+    wall-clock deadline. Each level calls update() at its own natural
+    checkpoint (SA external iteration, swarm iteration) and stops as
+    soon as it reports a reason; the best-so-far is kept as usual.
+
+    Deadlines are held against time.monotonic(), which is shared by
+    every process on the machine, so criteria handed to worker
+    processes honour the same deadline.
+"""
+
+EVALUATIONS = "evaluations"
+TARGET = "target"
+STAGNATION = "stagnation"
+DEADLINE = "deadline"
+
+
+class StoppingCriteria(object):
+
+    """
+     Constructor. Every criterion is optional; None disables it.
+
+     @param maxEvaluations: Objective evaluation budget
+     @param target:         Target cost
+     @param tolerance:      Reach of the target cost
+     @param stagnation:     Checkpoints allowed without improvement
+     @param deadline:       Wall-clock seconds allowed from start()
+     """
+    def __init__(self, maxEvaluations=None, target=None, tolerance=0.00005,
+                 stagnation=None, deadline=None):
+        self.maxEvaluations = maxEvaluations
+        self.target = target
+        self.tolerance = tolerance
+        self.stagnation = stagnation
+        self.deadline = deadline
+        self.endTime = None
+        self.start()
+
+
+    """
+     Starts the clock and clears the stagnation tracking.
+     """
+    def start(self):
+        if(self.deadline is not None):
+            self.endTime = time.monotonic() + self.deadline
+        self.bestSeen = float("inf")
+        self.sinceImprovement = 0
+        self.reason = None
+
+
+    """
+     Checks whether a cost lies within reach of the target.
+
+     @param cost: cost evaluation
+
+     @return: True if the target has been reached
+     """
+    def reached(self, cost):
+        return self.target is not None and cost - self.target < self.tolerance
+
+
+    """
+     Checks the budget and the deadline only.
+
+     @param evaluations: evaluations spent so far
+
+     @return: stop reason, or None to carry on
+     """
+    def exhausted(self, evaluations):
+        if(self.maxEvaluations is not None and evaluations >= self.maxEvaluations):
+            self.reason = EVALUATIONS
+        elif(self.endTime is not None and time.monotonic() >= self.endTime):
+            self.reason = DEADLINE
+        return self.reason
+
+
+    """
+     Stops on the evaluations once the level below can spend none of
+     them, e.g. when fewer are left than the chains of a batch.
+
+     @return: stop reason
+     """
+    def starve(self):
+        self.reason = EVALUATIONS
+        return self.reason
+
+
+    """
+     Checkpoint update for every criterion.
+
+     @param evaluations: evaluations spent so far
+     @param bestCost:    best cost found so far
+
+     @return: stop reason, or None to carry on
+     """
+    def update(self, evaluations, bestCost):
+        if(bestCost < self.bestSeen):
+            self.bestSeen = bestCost
+            self.sinceImprovement = 0
+        else:
+            self.sinceImprovement = self.sinceImprovement + 1
+        if(self.reached(bestCost)):
+            self.reason = TARGET
+        elif(self.stagnation is not None and self.sinceImprovement >= self.stagnation):
+            self.reason = STAGNATION
+        else:
+            self.exhausted(evaluations)
+        return self.reason
+
+
+    """
+     Evaluations left in the budget.
+
+     @param evaluations: evaluations spent so far
+
+     @return: remaining evaluations, or None if unbudgeted
+     """
+    def remaining(self, evaluations):
+        if(self.maxEvaluations is None):
+            return None
+        return max(0, self.maxEvaluations - evaluations)
+
+
+    """
+     Builds criteria for a lower level that inherit this target and
+     deadline and receive part of the remaining budget.
+
+     @param evaluations: evaluations spent so far at this level
+     @param shares:      number of parts the remaining budget is
+                         split into
+     @param stagnation:  stagnation window of the lower level
+
+     @return: new StoppingCriteria
+     """
+    def child(self, evaluations, shares=1, stagnation=None):
+        budget = self.remaining(evaluations)
+        if(budget is not None):
+            budget = budget//max(1, shares)
+        child = StoppingCriteria(budget, self.target, self.tolerance, stagnation)
+        child.endTime = self.endTime
+        return child
+
+
+    """
+     Copy sharing this budget, target and deadline but without the
+     stagnation window, for a lower level counting the same
+     evaluations.
+
+     @return: new StoppingCriteria
+     """
+    def limits(self):
+        limits = StoppingCriteria(self.maxEvaluations, self.target, self.tolerance)
+        limits.endTime = self.endTime
+        return limits
+
+
+    """
+     Returns the criteria and their progress for a checkpoint. The
+     deadline is kept as the time left on it.
+
+     @return: state dict
+     """
+    def getState(self):
+        remainingTime = None
+        if(self.endTime is not None):
+            remainingTime = self.endTime - time.monotonic()
+        return {"maxEvaluations": self.maxEvaluations,
+                "target": self.target,
+                "tolerance": self.tolerance,
+                "stagnation": self.stagnation,
+                "deadline": self.deadline,
+                "remainingTime": remainingTime,
+                "bestSeen": self.bestSeen,
+                "sinceImprovement": self.sinceImprovement,
+                "reason": self.reason}
+
+
+    """
+     Restores criteria saved by getState(); the time left on the
+     deadline starts running again now.
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        self.maxEvaluations = state["maxEvaluations"]
+        self.target = state["target"]
+        self.tolerance = state["tolerance"]
+        self.stagnation = state["stagnation"]
+        self.deadline = state["deadline"]
+        self.endTime = None
+        if(state["remainingTime"] is not None):
+            self.endTime = time.monotonic() + state["remainingTime"]
+        self.bestSeen = state["bestSeen"]
+        self.sinceImprovement = state["sinceImprovement"]
+        self.reason = state["reason"]
+
+
+    """
+     Returns the reason of the last stop, None while running.
+     """
+    def getReason(self):
+        return self.reason
@@ -0,0 +1,329 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1B-Surrogate
+
+    Surrogate pre-screening of SA moves for expensive objectives. An
+    RBFSurrogate interpolates the points the annealer has already
+    evaluated (cubic radial basis with a linear tail) and predicts
+    the cost of every proposed move before the objective is called.
+    A move is sent to the objective only if its prediction, less a
+    margin of the model's running error, would pass the Metropolis
+    test against the chain's current solution with the move's own
+    uniform draw ::
+
+        predicted - margin*rmse <= current - T*ln(u)
+
+    Every other move is rejected on the spot and costs nothing; a
+    small share of them is passed anyway so the model keeps learning
+    where it is wrong. Moves screened out are not counted as moves of
+    the chain, so totalMoves stays the number of objective calls.
+
+    The model is refit incrementally. It keeps the inverse of the
+    interpolation system; a new point borders it with one row and
+    column and the oldest point of a full window is eliminated from it,
+    both in O(n^2), and the weights are one product with the inverse,
+    taken when a prediction is asked for after new points came in. A
+    full O(n^3) inversion runs for the first fit, every refitEvery
+    updates to bound the rounding drift, and whenever an update would
+    be ill-conditioned. Screening relies on the Metropolis test, so
+    the annealer must use acceptance="metropolis". Pass one to a
+    SimulatedAnnealing or BatchSimulatedAnnealing as surrogate=, or to
+    Hive.setSAOptions(); a shared surrogate learns from every chain.
+"""
+
+class RBFSurrogate(object):
+
+    """
+     Constructor.
+
+     @param maxPoints: Most recent points the model interpolates
+     @param minPoints: Points needed before moves are screened (None
+                        :: 2*D + 2)
+     @param margin:    Running prediction errors subtracted from a
+                        prediction before the test; larger screens
+                        out fewer moves
+     @param explore:   Share of the screened out moves evaluated
+                        anyway
+     @param ridge:     Regularization added to the kernel diagonal
+     @param decay:     Weight of the newest errors in the running
+                        error; the model improves as points arrive, so
+                        old errors fade
+     @param refitEvery: Incremental updates between full inversions
+                        (None :: maxPoints)
+     """
+    def __init__(self, maxPoints=200, minPoints=None, margin=1.0, explore=0.05,
+                 ridge=1e-10, decay=0.05, refitEvery=None):
+        self.maxPoints = maxPoints
+        self.minPoints = minPoints
+        self.margin = margin
+        self.explore = explore
+        self.ridge = ridge
+        self.decay = decay
+        self.refitEvery = refitEvery if refitEvery is not None else maxPoints
+        self.reset()
+
+
+    """
+     Forgets every point and clears the statistics.
+     """
+    def reset(self):
+        self.points = None                     # (n, D) archive
+        self.costs = numpy.zeros(0)
+        self.kernel = numpy.zeros((0, 0))      # cubic kernel of the archive
+        self.inverse = None                    # inverse of [[0, P'], [P, K]]
+        self.weights = None                    # linear tail and RBF weights
+        self.dirty = False
+        self.lastPredictions = None            # predictions of the last passed moves
+        self.lastThresholds = None
+        self.squaredError = None               # running mean squared error
+        self.screened = 0                      # moves seen by screen()
+        self.evaluated = 0                     # moves sent to the objective
+        self.explored = 0                      # of those, passed by explore
+        self.hits = 0                          # evaluated moves that passed
+        self.predicted = 0                     # evaluated moves with a prediction
+        self.fits = 0                          # full inversions
+        self.updates = 0                       # bordered inverse updates
+        self.stale = 0                         # updates since the last inversion
+
+
+    """
+     Decides which proposed moves reach the objective.
+
+     @param positions:  (n, D) proposed coord vectors
+     @param thresholds: n costs a move must not exceed to pass the
+                         Metropolis test, current - T*ln(u)
+     @param rng:        Generator or numpy.random module for the
+                         exploration draws
+
+     @return: boolean mask of the moves to evaluate
+     """
+    def screen(self, positions, thresholds, rng=numpy.random):
+        positions = numpy.atleast_2d(positions)
+        thresholds = numpy.broadcast_to(numpy.asarray(thresholds, dtype=float),
+                                        (len(positions),))
+        self.screened = self.screened + len(positions)
+        self.lastPredictions = None
+        if(not self.ready(positions.shape[1])):
+            self.evaluated = self.evaluated + len(positions)
+            return numpy.ones(len(positions), dtype=bool)
+        predictions = self.predict(positions)
+        with numpy.errstate(invalid='ignore'):
+            promising = ~(predictions - self.margin*self.getRMSE() > thresholds)
+        explored = ~promising & (rng.uniform(0, 1, len(positions)) < self.explore)
+        passed = promising | explored
+        self.lastPredictions = predictions[passed]
+        self.lastThresholds = thresholds[passed]
+        self.evaluated = self.evaluated + int(passed.sum())
+        self.explored = self.explored + int(explored.sum())
+        return passed
+
+
+    """
+     Adds evaluated points to the model. Points passed by the last
+     screen() also update the error and hit statistics.
+
+     @param positions: (n, D) evaluated coord vectors, in the order
+                        of the last screen()'s passed moves
+     @param costs:     n cost evaluations
+     """
+    def update(self, positions, costs):
+        positions = numpy.atleast_2d(numpy.asarray(positions, dtype=float))
+        costs = numpy.atleast_1d(numpy.asarray(costs, dtype=float))
+        if(self.lastPredictions is not None and
+           len(self.lastPredictions) == len(costs)):
+            finite = numpy.isfinite(costs) & numpy.isfinite(self.lastPredictions)
+            errors = (costs - self.lastPredictions)[finite]
+            for error in errors.tolist():
+                if(self.squaredError is None):
+                    self.squaredError = error**2
+                else:
+                    self.squaredError = (1 - self.decay)*self.squaredError + self.decay*error**2
+            if(len(errors)):
+                self.predicted = self.predicted + len(errors)
+                self.hits = self.hits + int(numpy.sum(costs[finite] <= self.lastThresholds[finite]))
+        self.lastPredictions = None
+        keep = numpy.isfinite(costs)
+        for position, cost in zip(positions[keep], costs[keep]):
+            self.add(position, cost)
+
+
+    """
+     Appends one point, growing the kernel matrix by a row and a
+     column and dropping the oldest point of a full window. Once the
+     model is fit, the inverse follows both changes.
+
+     @param position: coord vector
+     @param cost:     cost evaluation
+     """
+    def add(self, position, cost):
+        if(self.points is None):
+            self.points = numpy.zeros((0, len(position)))
+        if(len(self.points) >= self.maxPoints):
+            self.points = self.points[1:]
+            self.costs = self.costs[1:]
+            self.kernel = self.kernel[1:, 1:]
+            if(self.inverse is not None):
+                self.dropOldest()
+        row = numpy.linalg.norm(self.points - position, axis=1)**3
+        size = len(self.points)
+        kernel = numpy.empty((size + 1, size + 1))
+        kernel[:size, :size] = self.kernel
+        kernel[size, :size] = kernel[:size, size] = row
+        kernel[size, size] = 0.0
+        self.kernel = kernel
+        self.points = numpy.vstack((self.points, position))
+        self.costs = numpy.append(self.costs, cost)
+        if(self.inverse is not None):
+            self.border(numpy.concatenate(([1.0], position, row)))
+        self.dirty = True
+
+
+    """
+     Borders the inverse with the newest point's row and column,
+     [[M, b], [b', ridge]], through the Schur complement
+     s = ridge - b' M^-1 b.
+
+     @param column: the point's tail entries and kernel row
+     """
+    def border(self, column):
+        if(self.stale >= self.refitEvery):
+            self.inverse = None
+            return
+        product = self.inverse @ column
+        complement = self.ridge - column @ product
+        if(not numpy.isfinite(complement) or
+           abs(complement) <= 1e-12*max(1.0, column @ column)):
+            self.inverse = None
+            return
+        size = len(column)
+        inverse = numpy.empty((size + 1, size + 1))
+        scaled = product/complement
+        numpy.multiply.outer(product, scaled, out=inverse[:size, :size])
+        inverse[:size, :size] += self.inverse
+        inverse[size, :size] = inverse[:size, size] = -scaled
+        inverse[size, size] = 1/complement
+        self.inverse = inverse
+        self.updates = self.updates + 1
+        self.stale = self.stale + 1
+
+
+    """
+     Eliminates the oldest point, the first after the tail, from the
+     inverse: B' = B[-k, -k] - B[-k, k] B[k, -k]/B[k, k].
+     """
+    def dropOldest(self):
+        index = self.points.shape[1] + 1
+        pivot = self.inverse[index, index]
+        if(not numpy.isfinite(pivot) or abs(pivot) <= 1e-300):
+            self.inverse = None
+            return
+        column = self.inverse[:, index]/pivot
+        self.inverse -= numpy.multiply.outer(column, self.inverse[index])
+        self.inverse = numpy.delete(numpy.delete(self.inverse, index, 0), index, 1)
+
+
+    """
+     Inverts the interpolation system
+     [[0, P'], [P, K]] [c; w] = [0; f] with P = [1, x] in full.
+     """
+    def fit(self):
+        size, dimensions = self.points.shape
+        tail = numpy.hstack((numpy.ones((size, 1)), self.points))
+        system = numpy.zeros((size + dimensions + 1, size + dimensions + 1))
+        system[dimensions + 1:, dimensions + 1:] = self.kernel + self.ridge*numpy.eye(size)
+        system[dimensions + 1:, :dimensions + 1] = tail
+        system[:dimensions + 1, dimensions + 1:] = tail.T
+        try:
+            self.inverse = numpy.linalg.inv(system)
+        except numpy.linalg.LinAlgError:
+            self.inverse = None
+            values = numpy.concatenate((numpy.zeros(dimensions + 1), self.costs))
+            self.weights = numpy.linalg.lstsq(system, values, rcond=None)[0]
+        self.stale = 0
+        self.fits = self.fits + 1
+
+
+    """
+     Predicted costs.
+
+     @param positions: (n, D) coord vectors
+
+     @return: array of n predictions
+     """
+    def predict(self, positions):
+        positions = numpy.atleast_2d(positions)
+        tail = positions.shape[1] + 1
+        if(self.inverse is None and (self.dirty or self.weights is None)):
+            self.fit()
+        if(self.inverse is not None and (self.dirty or self.weights is None)):
+            self.weights = self.inverse[:, tail:] @ self.costs
+        self.dirty = False
+        distances = numpy.linalg.norm(positions[:, numpy.newaxis, :] - self.points,
+                                      axis=2)
+        return (distances**3 @ self.weights[tail:] + self.weights[0] +
+                positions @ self.weights[1:tail])
+
+
+    """
+     Whether the model holds enough points to screen.
+
+     @param dimensions: Length of the coord vectors
+
+     @return: True once minPoints points are in
+     """
+    def ready(self, dimensions):
+        minPoints = self.minPoints if self.minPoints is not None else 2*dimensions + 2
+        return len(self.costs) >= max(minPoints, dimensions + 2)
+
+
+    """
+     Running root mean squared error of the predictions, weighted
+     towards the recent ones.
+
+     @return: Returns the error, 0 before any check.
+     """
+    def getRMSE(self):
+        return 0.0 if self.squaredError is None else self.squaredError**0.5
+
+
+    """
+     Screening statistics.
+
+     @return: dict with the moves screened, evaluated and saved, the
+         hit rate (share of the evaluated moves, among those screened
+         by the model, that did pass the Metropolis test), the
+         running RMSE, the points held, and the full inversions and
+         incremental updates of the model
+     """
+    def getStats(self):
+        return {"screened": self.screened,
+                "evaluated": self.evaluated,
+                "saved": self.screened - self.evaluated,
+                "explored": self.explored,
+                "hitRate": self.hits/self.predicted if self.predicted else 0.0,
+                "rmse": self.getRMSE(),
+                "points": len(self.costs),
+                "fits": self.fits,
+                "updates": self.updates}
+
+
+    """
+     Basic accessor methods.
+
+     @return: points -- (n, D) archive of evaluated coord vectors
+     @return: costs --  their cost evaluations
+     """
+    def getPoints(self):
+        return self.points
+
+    def getCosts(self):
+        return self.costs
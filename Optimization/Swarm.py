@@ -1,8 +1,17 @@
 """ Python Package Support """
-import random
+import numpy
 
 """ Internal Package Support """
 from Hive import Hive
+from ArrayHive import ArrayHive
+from Telemetry import Telemetry, ITERATION, GLOBAL_BEST
+from Stopping import StoppingCriteria
+from Leaderboard import Leaderboard
+from Objectives import getObjective
+from EvaluationCache import EvaluationCache
+from Profiling import Profiler, ITERATION as ITERATION_PHASE, VELOCITY, ADMIN
+from Checkpoint import (writeCheckpoint, readCheckpoint, getRandomState, setRandomState,
+                        getGeneratorState, newGenerator)
 
 """
     @author:     Matthew J Swann
@@ -25,25 +34,56 @@ class Swarm(object):
      @param phi_Two:        Phi2 multiplier
      @param inertia_value:  Omega dampening multiplier
      @param constant_value: Kappa value
+     @param funcNum:        Objective name, ObjectiveDefinition, or
+                             number 1 or (other) :: control for the
+                             Function class to be evaluated
+     @param saMode:         Hive annealing mode, "scalar", "batch",
+                             "parallel", "tempering" or "auto"
+     @param workers:        Process count for the "parallel" mode
+     @param seed:           Seed for the "parallel" mode SA chains
+     @param telemetry:      Telemetry receiving the swarm and SA
+                             events (None :: silent)
+     @param topK:           Size of the best-particle leaderboard
+     @param cache:          EvaluationCache for the Hive's SA chains
+     @param layout:         "particles" keeps a Particle object per
+                             particle, "arrays" an ArrayHive of
+                             contiguous arrays for large populations
+     @param rng:            NumPy Generator the swarm, its hive and SA
+                             chains draw from (None :: the global
+                             numpy.random generator)
      """
     def __init__(self, popSize, phi_One, phi_Two, inertia_value,
-                 constant_value, funcNum):
+                 constant_value, funcNum, saMode="scalar", workers=None,
+                 seed=None, telemetry=None, topK=10, cache=None,
+                 layout="particles", rng=None):
         """ Constructor Parameters """
         self.populationSize = popSize
         self.phiOne = phi_One
         self.phiTwo = phi_Two
         self.intertia = inertia_value
         self.constant = constant_value
-        """ Best Values """
-        self.bestX = 5000
-        self.bestY = 5000
-        self.bestCost = 5000
-        self.bestParticle = 0
+        self.telemetry = telemetry or Telemetry()
+        self.rng = rng
+        self.random = numpy.random if rng is None else rng
         """ Function Variable """
         self.iterations = 1
-        self.theHive = Hive(popSize, funcNum)
+        self.layout = layout
+        hive = ArrayHive if layout == "arrays" else Hive
+        self.theHive = hive(popSize, funcNum, saMode, workers, seed,
+                            self.telemetry, cache=cache, rng=rng)
         self.theHive.sortListFitness()
-        self.population = self.theHive.getPopulation()
+        FX = self.theHive.getFunction()
+        self.velocityLimit = numpy.asarray(FX.velocityLimit, dtype=float)
+        """ Best Values """
+        self.bestPosition = numpy.full(FX.getDimensions(), 5000.0)
+        self.bestCost = float("inf")
+        self.bestParticle = 0
+        self.leaderboard = Leaderboard(topK)
+        self.stopReason = None
+        self.runIterations = 0                 # Iterations of the current run()
+        self.board = None                      # Optional SharedBestBoard
+        self.boardOwner = 0
+        self.profiler = Profiler(active=False)
         self.adminUpdate()
 
 
@@ -52,93 +92,302 @@ class Swarm(object):
      Finally, sorts based on fitness
      """
     def updateWithVels(self):
-        self.iterations = self.iterations + 1
-        for i in range (len(self.population)):
-            newx = self.calcXVelocity(self.population[i])
-            newx = self.population[i].FX.getBestX()+newx
-            newy = self.calcYVelocity(self.population[i])
-            newy = self.population[i].FX.getBestY()+newy
-            self.population[i].FX.setVars(newx, newy)
-        self.theHive.population = self.population
-        self.theHive.SimAnn()
-        self.theHive.sortListFitness()
-        self.population = self.theHive.getPopulation()
-        self.adminUpdate()
+        profiler = self.profiler
+        with profiler.capture(), profiler.phase(ITERATION_PHASE):
+            self.iterations = self.iterations + 1
+            hive = self.theHive
+            with profiler.phase(VELOCITY):
+                bests = hive.getBestPositions()
+                velocities = self.calcVelocities(hive.getPositions(), bests,
+                                                 hive.getVelocities())
+                hive.moveTo(bests + velocities, velocities)
+            hive.SimAnn()
+            with profiler.phase(ADMIN):
+                self.adminUpdate()
+                if(self.board is not None):
+                    self.syncBoard()
 
         
 
     """
-     Calculates the current velocity for X based on global statistics.
+     Runs updateWithVels() until a stopping criterion is met. The
+     criteria's stagnation window counts swarm iterations; the budget,
+     target and deadline are also handed to the Hive so an iteration
+     in progress stops its SA chains early and keeps the best-so-far.
      
-     @param particle: The particle to be evaluated.
+     @param maxIterations:   Upper bound on swarm iterations of the
+                              run (None :: no bound)
+     @param stopping:        StoppingCriteria (None :: iterations only)
+     @param checkpoint:      File written by saveCheckpoint() every
+                              checkpointEvery iterations (None :: off)
+     @param checkpointEvery: Iterations between checkpoints
+     @param resume:          Continue the run restored by resumeSwarm()
+                              instead of starting a new one
      
-     @return: Returns the new velocity for X.
-     """
-    def calcXVelocity(self, particle):
-        Xbest = particle.FX.getBestX()
-        Xcurrent = particle.FX.getX()
-        Xvel = particle.FX.getXVelocity()
-        velocity  = (self.constant*((self.intertia)*Xvel + 
-                     self.phiOne*random.uniform(0, 1)*(self.bestX - Xcurrent) + 
-                     self.phiTwo*random.uniform(0, 1)*(Xbest - Xcurrent)))
-        if(velocity < -.15):
-            velocity = -.15
-        if(velocity > .15):
-            velocity = .15
-        return velocity
+     @return: Returns the best cost found.
+     """
+    def run(self, maxIterations=None, stopping=None, checkpoint=None,
+            checkpointEvery=1, resume=False):
+        for snapshot in self.iterate(maxIterations, stopping, checkpoint,
+                                     checkpointEvery, resume):
+            pass
+        return self.bestCost
+
 
-    
     """
-     Calculates the current velocity for Y based on global statistics.
+     Generator form of run(), taking the same parameters. Yields a
+     SwarmSnapshot after every swarm iteration; the consumer may stop
+     at any point simply by no longer iterating (or calling close()),
+     which ends the run cleanly with the swarm left as it stood after
+     the last yielded iteration.
      
-     @param particle: The particle to be evaluated.
+     @return: generator of SwarmSnapshot
+     """
+    def iterate(self, maxIterations=None, stopping=None, checkpoint=None,
+                checkpointEvery=1, resume=False):
+        if(stopping is None):
+            stopping = StoppingCriteria()
+        if(not resume):
+            stopping.start()
+            self.stopReason = None
+            self.runIterations = 0
+        try:
+            while((maxIterations is None or self.runIterations < maxIterations) and
+                  not stopping.exhausted(self.getEvaluations())):
+                previous = self.bestCost
+                spent = self.getEvaluations()
+                self.theHive.setStopping(stopping.limits())
+                self.updateWithVels()
+                self.runIterations = self.runIterations + 1
+                reason = stopping.update(self.getEvaluations(), self.bestCost)
+                if(not reason and self.getEvaluations() == spent and
+                   self.theHive.getPlannedChains()):
+                    """ the chains spent nothing :: carrying on cannot progress """
+                    reason = stopping.starve()
+                if(checkpoint is not None and self.runIterations % checkpointEvery == 0):
+                    self.saveCheckpoint(checkpoint, stopping)
+                yield SwarmSnapshot(self, previous - self.bestCost, reason)
+                if(reason):
+                    break
+        finally:
+            self.theHive.setStopping(None)
+            self.stopReason = stopping.getReason()
+
+
+    """
+     Calculates the current velocities of the whole population based
+     on global statistics. Each row is clamped per coordinate to the
+     velocity limit of the Function class.
      
-     @return: Returns the new velocity for Y.
-     """
-    def calcYVelocity(self, particle):
-        Ybest = particle.FX.getBestY()
-        Ycurrent = particle.FX.getY()
-        Yvel = particle.FX.getYVelocity()
-        velocity  = (self.constant*((self.intertia)*Yvel + 
-                     self.phiOne*random.uniform(0, 1)*(self.bestY - Ycurrent) + 
-                     self.phiTwo*random.uniform(0, 1)*(Ybest - Ycurrent)))
-        if(velocity < -1):
-            velocity = -1
-        if(velocity > 1):
-            velocity = 1
-        return velocity
+     @param positions:  (n, D) current coord vectors
+     @param bests:      (n, D) personal best coord vectors
+     @param velocities: (n, D) previous velocities
+     
+     @return: Returns the (n, D) new velocities.
+     """
+    def calcVelocities(self, positions, bests, velocities):
+        velocities = (self.constant*((self.intertia)*velocities + 
+                      self.phiOne*self.random.uniform(0, 1, positions.shape)*(self.bestPosition - positions) + 
+                      self.phiTwo*self.random.uniform(0, 1, positions.shape)*(bests - positions)))
+        return numpy.clip(velocities, -self.velocityLimit, self.velocityLimit)
     
     """
-     Updates the best and second best variables.
+     Updates the leaderboard and best variables and reports the
+     iteration to the telemetry hooks. The population is kept sorted
+     best first by the Hive, so the walk stops at the first particle
+     the leaderboard turns away.
      """
     def adminUpdate(self):
-        for i in range (len(self.population)):
-            self.checkSetBest(self.population[i].FX.getBestCost(), 
-                              self.population[i].FX.getBestX(),
-                              self.population[i].FX.getBestY(), 
-                              self.population[i].FX.getID())
-        self.swarmAdmin()
+        costs = self.theHive.getBestCosts()
+        particles = self.theHive.getIDs()
+        for i in range (len(costs)):
+            cost = float(costs[i])
+            if(cost >= self.leaderboard.threshold()):
+                break
+            self.leaderboard.offer(cost, int(particles[i]), self.theHive.getBestPosition(i))
+        self.checkSetBest(self.leaderboard.getBestCost(),
+                          self.leaderboard.getBestPosition(),
+                          self.leaderboard.getBestParticle())
+        if(self.telemetry.active):
+            self.telemetry.emit(ITERATION, {"iteration": self.iterations,
+                                            "bestCost": self.bestCost,
+                                            "bestParticle": self.bestParticle,
+                                            "bestPosition": self.bestPosition})
         
     """
      Checks and sets best values.
      
-     @param value:  Current cost value.
-     @param Xval:   X coord associated with current cost.
-     @param Yval:   Y coord associated with current cost.
-     @param pardId: Particle ID for tracking and selfless 
-                     swarm option.
+     @param value:    Current cost value.
+     @param position: Coord vector associated with current cost.
+     @param pardId:   Particle ID for tracking and selfless 
+                       swarm option.
      """
-    def checkSetBest(self, value, Xval, Yval, partId):
+    def checkSetBest(self, value, position, partId):
         if(value < self.bestCost):
             """ Update Best Set """
             self.bestCost = value
             self.bestParticle = partId
-            self.bestX = Xval
-            self.bestY = Yval
+            self.bestPosition = position
+            if(self.telemetry.active):
+                self.telemetry.emit(GLOBAL_BEST, {"iteration": self.iterations,
+                                                  "bestCost": value,
+                                                  "bestParticle": partId,
+                                                  "bestPosition": position})
         else:
             """ Do nothing """
             pass
 
+    """
+     Attaches a Profiler to the swarm and its hive; see Profiling.
+     None detaches it.
+
+     @param profiler: Profiler, or None
+     """
+    def setProfiler(self, profiler):
+        self.profiler = profiler or Profiler(active=False)
+        self.theHive.setProfiler(profiler)
+
+
+    """
+     Returns the attached Profiler.
+
+     @return: Returns the Profiler (inactive unless one was attached).
+     """
+    def getProfiler(self):
+        return self.profiler
+
+
+    """
+     Shares the global best with other processes through a
+     SharedBestBoard. After every iteration the swarm publishes its
+     best to the board and adopts the board's best when that is
+     better, so the velocities of the next iteration are drawn towards
+     the best found by any process. An adopted best has particle ID
+     -1. None detaches the board.
+
+     @param board: SharedBestBoard, or None
+     @param owner: ID the swarm publishes under
+     """
+    def setBoard(self, board, owner=0):
+        self.board = board
+        self.boardOwner = owner
+
+
+    """
+     Publishes the global best to the board and adopts the board's
+     best if it is better.
+     """
+    def syncBoard(self):
+        self.board.offer(self.bestCost, self.bestPosition, self.boardOwner)
+        if(self.board.getBestCost() < self.bestCost):
+            cost, position, owner, updates = self.board.read()
+            self.checkSetBest(cost, position, -1)
+
+
+    """
+     Personal bests of the best particles, to send to another swarm.
+
+     @param count: Number of particles
+
+     @return: (costs, (count, D) coord vectors), best first
+     """
+    def getEmigrants(self, count):
+        return (self.theHive.getBestCosts()[:count].copy(),
+                self.theHive.getBestPositions()[:count].copy())
+
+
+    """
+     Takes in solutions found by another swarm. Each immigrant, best
+     first, replaces the personal best of one of the worst particles,
+     worst first, where it improves on it; the global best is updated
+     as after an iteration.
+
+     @param costs:     Immigrant costs
+     @param positions: (m, D) immigrant coord vectors
+
+     @return: Returns the number of immigrants taken in.
+     """
+    def immigrate(self, costs, positions):
+        hive = self.theHive
+        order = numpy.argsort(costs, kind="stable")
+        worst = hive.getBestCosts()
+        placed = 0
+        for j in range (min(len(order), len(worst))):
+            index = len(worst) - 1 - j
+            if(costs[order[j]] < worst[index]):
+                hive.setResult(index, positions[order[j]], float(costs[order[j]]))
+                placed = placed + 1
+        if(placed):
+            hive.sortListFitness()
+            self.adminUpdate()
+        return placed
+
+
+    """
+     Writes the full optimizer state to a checkpoint file: the swarm,
+     the hive and its particles, the leaderboard, the evaluation
+     cache, the random generator and, when given, the run's stopping
+     criteria. resumeSwarm() continues from it exactly as this swarm
+     would have continued. In "parallel" mode the worker processes'
+     own evaluation caches are not part of the checkpoint, and SA
+     options given through Hive.setSAOptions() are set again on the
+     resumed hive.
+
+     @param path:     Checkpoint file
+     @param stopping: StoppingCriteria of the run in progress, or None
+     """
+    def saveCheckpoint(self, path, stopping=None):
+        sections = {"swarm": self.getState(),
+                    "hive": self.theHive.getState(),
+                    "leaderboard": self.leaderboard.getState(),
+                    "random": getRandomState()}
+        if(self.rng is not None):
+            sections["generator"] = getGeneratorState(self.rng)
+        if(self.theHive.getCache() is not None):
+            sections["cache"] = self.theHive.getCache().getState()
+        if(stopping is not None):
+            sections["stopping"] = stopping.getState()
+        writeCheckpoint(path, sections)
+
+
+    """
+     Returns the swarm's own settings and progress for a checkpoint.
+
+     @return: state dict
+     """
+    def getState(self):
+        objective = self.theHive.getObjective()
+        return {"populationSize": self.populationSize,
+                "phiOne": self.phiOne,
+                "phiTwo": self.phiTwo,
+                "inertia": self.intertia,
+                "constant": self.constant,
+                "objective": objective.name,
+                "dimensions": objective.dimensions,
+                "workers": self.theHive.workers,
+                "layout": self.layout,
+                "iterations": self.iterations,
+                "runIterations": self.runIterations,
+                "bestCost": self.bestCost,
+                "bestParticle": self.bestParticle,
+                "bestPosition": numpy.asarray(self.bestPosition, dtype=float),
+                "stopReason": self.stopReason}
+
+
+    """
+     Restores the progress saved by getState().
+
+     @param state: state dict
+     """
+    def setState(self, state):
+        self.iterations = state["iterations"]
+        self.runIterations = state["runIterations"]
+        self.bestCost = state["bestCost"]
+        self.bestParticle = state["bestParticle"]
+        self.bestPosition = state["bestPosition"].copy()
+        self.stopReason = state["stopReason"]
+
+
     """
      Returns the Hive object.
      
@@ -146,17 +395,35 @@ class Swarm(object):
      """
     def getHive(self):
         return self.theHive
+
+
+    """
+     Returns the leaderboard of the best particles found so far.
+     
+     @return: Returns the Leaderboard.
+     """
+    def getLeaderboard(self):
+        return self.leaderboard
+
+
+    """
+     Returns the objective evaluations spent by the swarm so far.
+
+     @return: Returns the evaluation count.
+     """
+    def getEvaluations(self):
+        return self.theHive.getEvaluations()
     
     """
-     Outstream of important swarm statistics
+     Outstream of important swarm statistics. Prints on demand only;
+     attach a Telemetry.ConsoleSink for a report every iteration.
      """
     def swarmAdmin(self):
         print("Swarm Admin -->>")
         print("        Iterations :: %s" % self.iterations)
         print("Best Sol: %s" % self.getBestCost())
         print("Best ID:  %s" % self.getBestParticle())
-        print("Best X:   %s" % self.getBestX())
-        print("Best Y:   %s" % self.getBestY())
+        print("Best:     %s" % self.getBestPosition())
  
        
     """
@@ -164,6 +431,8 @@ class Swarm(object):
      
      @return: bestCost - best known cost
      @return: bestPart - best known particle ID
+     @return: stopReason - why the last run() stopped, if early
+     @return: bestPosition - coord vector for bestCost
      @return: bestX    - x coord for bestCost
      @return: bestY    - y coord or bestCost
      """
@@ -173,8 +442,103 @@ class Swarm(object):
     def getBestParticle(self):
         return self.bestParticle
     
+    def getStopReason(self):
+        return self.stopReason
+    
+    def getBestPosition(self):
+        return self.bestPosition
+    
     def getBestX(self):
-        return self.bestX
+        return self.bestPosition[0]
     
     def getBestY(self):
-        return self.bestY
+        return self.bestPosition[1]
+
+
+"""
+---------------------------------------
+CLASS :: SwarmSnapshot
+---------------------------------------
+
+ Progress of one Swarm.iterate() step. Holds only scalars and a
+ read-only view of the global best coord vector, never a copy of the
+ population; the view stays valid after the swarm moves on, since a
+ new global best is stored in a new array.
+ """
+class SwarmSnapshot(object):
+
+    __slots__ = ("iteration", "runIteration", "bestCost", "bestParticle",
+                 "bestPosition", "improvement", "evaluations", "stopReason")
+
+    """
+     @param swarm:       Swarm the snapshot is taken of
+     @param improvement: Drop in the global best cost this iteration
+     @param stopReason:  Reason the run stops after this iteration, or
+                          None
+     """
+    def __init__(self, swarm, improvement, stopReason):
+        self.iteration = swarm.iterations
+        self.runIteration = swarm.runIterations
+        self.bestCost = swarm.bestCost
+        self.bestParticle = swarm.bestParticle
+        self.bestPosition = swarm.bestPosition.view()
+        self.bestPosition.flags.writeable = False
+        self.improvement = improvement
+        self.evaluations = swarm.getEvaluations()
+        self.stopReason = stopReason
+
+    def __repr__(self):
+        return ("SwarmSnapshot(iteration=%d, bestCost=%r, improvement=%r, evaluations=%d)" %
+                (self.iteration, self.bestCost, self.improvement, self.evaluations))
+
+
+"""
+ Rebuilds a swarm from a checkpoint written by Swarm.saveCheckpoint().
+ Continue it with run(..., stopping, resume=True) to carry on the run
+ the checkpoint was taken in.
+
+ @param path:      Checkpoint file
+ @param telemetry: Telemetry for the restored swarm (None :: silent)
+ @param objective: ObjectiveDefinition to use when the checkpointed
+                    one is not in the registry
+ @param policy:    AnnealingPolicy of the checkpointed run, restored
+                    to the state it had (None :: every particle)
+
+ @return: (Swarm, StoppingCriteria or None)
+ """
+def resumeSwarm(path, telemetry=None, objective=None, policy=None):
+    sections = readCheckpoint(path)
+    state = sections["swarm"]
+    if(objective is None):
+        objective = getObjective(state["objective"])
+        if(state["dimensions"] != objective.dimensions):
+            objective = objective.withDimensions(state["dimensions"])
+    rng = None
+    if("generator" in sections):
+        rng = newGenerator(sections["generator"])
+    cache = None
+    if("cache" in sections):
+        cache = EvaluationCache(sections["cache"]["resolution"],
+                                sections["cache"]["maxSize"])
+    swarm = Swarm(state["populationSize"], state["phiOne"], state["phiTwo"],
+                  state["inertia"], state["constant"], objective,
+                  sections["hive"]["saMode"], state["workers"],
+                  topK=sections["leaderboard"]["size"], cache=cache,
+                  layout=state["layout"], rng=rng)
+    if(telemetry is not None):
+        swarm.telemetry = telemetry
+        swarm.getHive().telemetry = telemetry
+    swarm.setState(state)
+    swarm.getHive().setAnnealingPolicy(policy)
+    swarm.getHive().setState(sections["hive"])
+    swarm.getLeaderboard().setState(sections["leaderboard"])
+    if(cache is not None):
+        cache.setState(sections["cache"])
+    stopping = None
+    if("stopping" in sections):
+        stopping = StoppingCriteria()
+        stopping.setState(sections["stopping"])
+    setRandomState(sections["random"])
+    if(rng is not None):
+        rng.bit_generator.state = sections["generator"]["state"]
+    return swarm, stopping
@@ -0,0 +1,239 @@
+""" Python Package Support """
+import csv
+import json
+import numpy
+
+""" Internal Package Support """
+#Not Applicable
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 0
+
+    Event hooks for the swarm/annealing hybrid. Components emit
+    structured events to a Telemetry object which hands them to any
+    attached sinks. Without sinks nothing is built or written; the
+    emitting code checks Telemetry.active before assembling an event.
+
+    Events ::    ITERATION     -- swarm iteration finished
+                 GLOBAL_BEST   -- new swarm global best
+                 GOAL          -- SA chain landed within reach of goal
+                 CHAIN         -- SA chain finished
+                 RUN           -- ensemble member run finished
+                 MIGRATION     -- island model migration epoch finished
+"""
+
+ITERATION = "iteration"
+GLOBAL_BEST = "globalBest"
+GOAL = "goal"
+CHAIN = "chainFinished"
+RUN = "runFinished"
+MIGRATION = "migration"
+
+
+class Telemetry(object):
+
+    """
+     Constructor. Starts silent, with no sinks attached.
+     """
+    def __init__(self):
+        self.sinks = list()
+        self.active = False
+
+
+    """
+     Attaches a sink. A sink is any callable taking the event name
+     and a dict of event fields.
+
+     @param sink: Sink to be attached.
+
+     @return: the sink, for chaining
+     """
+    def attach(self, sink):
+        self.sinks.append(sink)
+        self.active = True
+        return sink
+
+
+    """
+     Detaches a previously attached sink.
+
+     @param sink: Sink to be detached.
+     """
+    def detach(self, sink):
+        self.sinks.remove(sink)
+        self.active = len(self.sinks) > 0
+
+
+    """
+     Hands an event to every attached sink.
+
+     @param event:  Event name
+     @param fields: Dict of event fields
+     """
+    def emit(self, event, fields):
+        for sink in self.sinks:
+            sink(event, fields)
+
+
+    """
+     Flushes and closes every sink that supports it.
+     """
+    def close(self):
+        for sink in self.sinks:
+            if hasattr(sink, "close"):
+                sink.close()
+
+
+"""
+---------------------------------------
+CLASS :: MemorySink
+---------------------------------------
+
+ Collects events in memory.
+ """
+class MemorySink(object):
+
+    def __init__(self):
+        self.records = list()
+
+    def __call__(self, event, fields):
+        self.records.append((event, fields))
+
+
+    """
+     Returns the collected events.
+
+     @param event: Event name to filter on (None :: all events)
+
+     @return: list of field dicts, or of (event, fields) when
+         unfiltered
+     """
+    def getEvents(self, event=None):
+        if(event is None):
+            return list(self.records)
+        return [fields for name, fields in self.records if name == event]
+
+    def clear(self):
+        del self.records[:]
+
+
+"""
+---------------------------------------
+CLASS :: JsonlSink
+---------------------------------------
+
+ Writes one JSON object per event to a file, buffering bufferSize
+ events between writes.
+ """
+class JsonlSink(object):
+
+    """
+     @param path:       Output file
+     @param bufferSize: Events held before each write
+     """
+    def __init__(self, path, bufferSize=1000):
+        self.path = path
+        self.bufferSize = bufferSize
+        self.buffer = list()
+        self.stream = open(path, "a")
+
+    def __call__(self, event, fields):
+        record = dict(fields)
+        record["event"] = event
+        self.buffer.append(json.dumps(record, default=jsonDefault))
+        if(len(self.buffer) >= self.bufferSize):
+            self.flush()
+
+    def flush(self):
+        if(self.buffer):
+            self.stream.write("\n".join(self.buffer) + "\n")
+            del self.buffer[:]
+        self.stream.flush()
+
+    def close(self):
+        if(not self.stream.closed):
+            self.flush()
+            self.stream.close()
+
+
+"""
+---------------------------------------
+CLASS :: CsvSink
+---------------------------------------
+
+ Writes one CSV row per event, flushed as it arrives. Columns are
+ taken from the first event unless given; array and list fields are
+ written as JSON.
+ """
+class CsvSink(object):
+
+    """
+     @param path:    Output file
+     @param event:   Event name to record (None :: every event)
+     @param columns: Column names (None :: fields of the first event)
+     """
+    def __init__(self, path, event=None, columns=None):
+        self.path = path
+        self.event = event
+        self.columns = columns
+        self.writer = None
+        self.stream = open(path, "w", newline="")
+
+    def __call__(self, event, fields):
+        if(self.event is not None and event != self.event):
+            return
+        if(self.writer is None):
+            if(self.columns is None):
+                self.columns = list(fields)
+            self.writer = csv.DictWriter(self.stream, self.columns,
+                                         extrasaction="ignore")
+            self.writer.writeheader()
+        row = dict()
+        for name in self.columns:
+            value = fields.get(name)
+            if(isinstance(value, (list, tuple, dict, numpy.ndarray))):
+                value = json.dumps(value, default=jsonDefault)
+            row[name] = value
+        self.writer.writerow(row)
+        self.stream.flush()
+
+    def close(self):
+        if(not self.stream.closed):
+            self.stream.close()
+
+
+"""
+---------------------------------------
+CLASS :: ConsoleSink
+---------------------------------------
+
+ Prints swarm iterations and goal hits in the style of the old
+ admin reports.
+ """
+class ConsoleSink(object):
+
+    def __call__(self, event, fields):
+        if(event == ITERATION):
+            print("Swarm Admin -->>")
+            print("        Iterations :: %s" % fields["iteration"])
+            print("Best Sol: %s" % fields["bestCost"])
+            print("Best ID:  %s" % fields["bestParticle"])
+            print("Best:     %s" % fields["bestPosition"])
+        elif(event == GOAL):
+            print("<------GOAL------->")
+            print(fields["goal"] - fields["cost"])
+
+
+"""
+ JSON fallback for NumPy values in event fields.
+ """
+def jsonDefault(value):
+    if(isinstance(value, numpy.ndarray)):
+        return value.tolist()
+    if(isinstance(value, numpy.generic)):
+        return value.item()
+    raise TypeError("%r is not JSON serializable" % (value,))
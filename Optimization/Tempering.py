@@ -0,0 +1,352 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Objectives import getObjective
+from Telemetry import Telemetry, GOAL, CHAIN
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tier 1A-Tempering
+
+    Replica exchange (parallel tempering) annealer. Every chain is a
+    ladder of replicas held at fixed temperatures, geometric from a
+    cold to a hot end. The replicas take Metropolis moves, hot ones
+    with wider steps, and every few steps neighboring replicas offer
+    to trade states with probability
+
+        min(1, exp((1/T_k - 1/T_k+1)*(E_k - E_k+1)))
+
+    so good states found by the hot replicas sink towards the cold end
+    instead of being thrown away by a reset. All replicas of all
+    chains advance as one (n*R, D) array, the layout of the
+    BatchSimulatedAnnealing, and the class takes the same constructor
+    parameters and offers the same run()/accessor interface, so the
+    Hive uses it as its "tempering" mode. Standalone ::
+
+        sim = ReplicaExchange("camelback", 100, 200, 50, .975, True, True)
+        sim.run(numpy.zeros((1, 2)))
+        sim.getBestSolution()[0]
+"""
+
+class ReplicaExchange(object):
+
+    """
+     Initialization. The first parameters are those of the other
+     annealers, read as follows.
+
+     @param funcNum:     Objective name, ObjectiveDefinition, or number
+     @param initTemp:    Temperature of the hot end of the ladder
+     @param extIters:    External iterations (sweeps)
+     @param intIters:    Moves per replica and sweep
+     @param moveCont:    Unused; the temperatures are fixed
+     @param localSearch: Scale the steps by sqrt(T/initTemp) per replica
+     @param expand:      Unused; exchange replaces the re-heat
+     @param telemetry:   Telemetry receiving GOAL and CHAIN events
+     @param stopping:    StoppingCriteria for the whole batch, checked
+         once per sweep against the evaluations and best cost
+     @param cache:       EvaluationCache for the objective, or None
+     @param schedule:    Unused; accepted for the Hive's SA options
+     @param stepControl: AcceptanceStepControl, one scale per replica
+     @param acceptance:  Unused; replicas always use Metropolis
+     @param rng:         NumPy Generator the batch draws from (None ::
+         the global numpy.random generator)
+     @param surrogate:   Unused; every replica move is evaluated
+     @param replicas:    Replicas per chain (R)
+     @param minTemp:     Temperature of the cold end of the ladder
+     @param swapEvery:   Moves between exchange rounds
+     """
+    def __init__(self, funcNum, initTemp, extIters, intIters,
+                 moveCont, localSearch, expand, telemetry=None,
+                 stopping=None, cache=None, schedule=None,
+                 stepControl=None, acceptance="metropolis", rng=None,
+                 surrogate=None, replicas=8, minTemp=1e-3, swapEvery=10):
+        """ Parameters """
+        self.objective = getObjective(funcNum)
+        self.random = numpy.random if rng is None else rng
+        self.FX = self.objective.create(rng)   # Function for Eval
+        self.range = self.objective.stepRange  # Neighborhood range
+        self.goal = self.objective.goal        # Known optimal cost
+        self.initialTemp = initTemp
+        self.external = extIters
+        self.internal = intIters
+        self.drillBit = localSearch
+        self.telemetry = telemetry or Telemetry()
+        self.stopping = stopping
+        self.FX.setCache(cache)
+        self.stepControl = stepControl
+        self.replicas = max(1, int(replicas))
+        self.minTemp = minTemp
+        self.swapEvery = max(1, int(swapEvery))
+        self.temperatures = self.ladder()
+        """ Instance variables """
+        self.setVariables(numpy.empty((0, self.FX.getDimensions())))
+
+
+    """
+     Geometric temperature ladder, cold first.
+
+     @return: array of R temperatures
+     """
+    def ladder(self):
+        if(self.replicas == 1):
+            return numpy.array([float(self.minTemp)])
+        return numpy.geomspace(self.minTemp, self.initialTemp, self.replicas)
+
+
+    """
+     The replica exchange algorithm. Each internal iteration performs
+     one move for every replica of every chain at once.
+     """
+    def SA(self):
+        telemetry = self.telemetry
+        stopping = self.stopping
+        if(stopping is not None):
+            stopping.start()
+        size = len(self.bestSolution)
+        replicas = self.replicas
+        rows, dimensions = self.position.shape
+        temps = numpy.tile(self.temperatures, size)
+        scale = numpy.ones(rows)
+        if(self.drillBit):
+            scale = numpy.sqrt(temps/self.temperatures[-1])
+        if(self.stepControl is not None):
+            self.stepControl.start(rows)
+        if(rows and numpy.isnan(self.currentSolution).any()):
+            if(stopping is not None and stopping.maxEvaluations is not None and
+               stopping.remaining(self.getEvaluations()) < rows):
+                """ the budget cannot pay for the replicas' first evaluation """
+                stopping.starve()
+                self.stopReason = stopping.getReason()
+                return
+            self.currentSolution = self.FX.evaluateArray(self.position)
+            self.totalMoves += replicas
+            self.record(self.currentSolution)
+        for i in range (self.external):
+            internal = self.internal
+            if(stopping is not None and stopping.maxEvaluations is not None):
+                internal = min(internal, stopping.remaining(self.getEvaluations())//max(1, rows))
+                if(internal == 0):
+                    """ fewer evaluations left than replicas :: no whole move remains """
+                    stopping.starve()
+                    break
+            """ random draws for the whole external iteration at once """
+            steps = self.random.uniform(-self.range, self.range,
+                                        (internal, rows, dimensions))
+            randomNums = self.random.uniform(0, 1, (internal, rows))
+            for j in range (internal):
+                stepScale = scale
+                if(self.stepControl is not None):
+                    stepScale = self.stepControl.scale
+                position = self.FX.checkArray(self.position + steps[j]*stepScale[:, numpy.newaxis])
+                current = self.FX.evaluateArray(position)
+                with numpy.errstate(over='ignore', invalid='ignore'):
+                    accepted = ((current <= self.currentSolution) |
+                                (randomNums[j] < numpy.exp((self.currentSolution - current)/temps)))
+                self.position = numpy.where(accepted[:, numpy.newaxis], position, self.position)
+                self.currentSolution = numpy.where(accepted, current, self.currentSolution)
+                self.acceptedMoves += accepted
+                self.totalMoves += replicas
+                self.record(current, position)
+                if((j + 1) % self.swapEvery == 0):
+                    self.exchange()
+            if(self.stepControl is not None):
+                self.stepControl.update(self.replicaMoves(), self.acceptedMoves)
+            if(stopping is not None and size > 0 and
+               stopping.update(self.getEvaluations(), self.bestSolution.min())):
+                break
+        self.stopReason = stopping.getReason() if stopping is not None else None
+        if(telemetry.active):
+            for chain in range (size):
+                telemetry.emit(CHAIN, {"chain": chain,
+                                       "bestCost": float(self.bestSolution[chain]),
+                                       "bestPosition": self.bestPosition[chain],
+                                       "totalMoves": int(self.totalMoves[chain]),
+                                       "movesAccepted": int(self.getMovesAccepted()[chain]),
+                                       "movesToTarget": int(self.movesToTarget[chain])})
+
+
+    """
+     Folds the costs of a move into the best values of each chain.
+
+     @param current:  Costs of the (n*R) proposed states
+     @param position: (n*R, D) proposed states (None :: the current
+                       states)
+     """
+    def record(self, current, position=None):
+        if(position is None):
+            position = self.position
+        size = len(self.bestSolution)
+        costs = current.reshape(size, self.replicas)
+        best = numpy.argmin(costs, axis=1)
+        cost = costs[numpy.arange(size), best]
+        improved = cost < self.bestSolution
+        if(not improved.any()):
+            return
+        rows = numpy.arange(size)*self.replicas + best
+        self.bestSolution = numpy.where(improved, cost, self.bestSolution)
+        self.bestPosition = numpy.where(improved[:, numpy.newaxis], position[rows],
+                                        self.bestPosition)
+        nearGoal = improved & ((self.goal - cost) > -0.00005)
+        self.movesToTarget = numpy.where(nearGoal & (self.movesToTarget == 0),
+                                         self.totalMoves, self.movesToTarget)
+        if(self.telemetry.active and nearGoal.any()):
+            for chain in numpy.flatnonzero(nearGoal).tolist():
+                self.telemetry.emit(GOAL, {"chain": chain,
+                                           "cost": float(cost[chain]),
+                                           "goal": self.goal,
+                                           "totalMoves": int(self.totalMoves[chain])})
+
+
+    """
+     One exchange round between neighboring replicas, alternating
+     the even and the odd pairs from round to round.
+     """
+    def exchange(self):
+        replicas = self.replicas
+        if(replicas < 2):
+            return
+        size = len(self.bestSolution)
+        lower = numpy.arange(self.swapParity, replicas - 1, 2)
+        self.swapParity = 1 - self.swapParity
+        if(len(lower) == 0):
+            return
+        costs = self.currentSolution.reshape(size, replicas)
+        positions = self.position.reshape(size, replicas, -1)
+        beta = 1/self.temperatures
+        with numpy.errstate(over='ignore', invalid='ignore'):
+            delta = (beta[lower] - beta[lower + 1])*(costs[:, lower] - costs[:, lower + 1])
+            swap = self.random.uniform(0, 1, (size, len(lower))) < numpy.exp(delta)
+        self.swapAttempts[lower] += size
+        self.swapAccepts[lower] += swap.sum(axis=0)
+        chains, pairs = numpy.nonzero(swap)
+        first = lower[pairs]
+        second = first + 1
+        costs[chains, first], costs[chains, second] = costs[chains, second], costs[chains, first]
+        positions[chains, first], positions[chains, second] = (positions[chains, second].copy(),
+                                                               positions[chains, first].copy())
+
+
+    """
+     Runs one batch of chains.
+
+     @param positions: (n, D) starting coord vectors, one per chain;
+         every replica of a chain starts there (None :: carry on from
+         the current replica states)
+
+     @return: Returns the best solution of every chain.
+     """
+    def run(self, positions=None):
+        self.reset(positions)
+        self.SA()
+        return self.bestSolution
+
+
+    """
+     Clears the counters and best values for a new batch.
+
+     @param positions: (n, D) starting coord vectors (None :: keep the
+         current replica states)
+     """
+    def reset(self, positions=None):
+        if(positions is None):
+            states = self.position
+            costs = self.currentSolution
+            self.setVariables(states[::self.replicas])
+            self.position = states
+            self.currentSolution = costs
+            return
+        self.setVariables(positions)
+
+
+    """
+     Resets the instance arrays and places every replica of chain i at
+     positions[i].
+
+     @param positions: (n, D) array of associated coord vectors
+     """
+    def setVariables(self, positions):
+        positions = numpy.array(positions, dtype=float)
+        size = len(positions)
+        """ reset instance arrays """
+        self.position = numpy.repeat(positions, self.replicas, axis=0)
+        self.currentSolution = numpy.full(size*self.replicas, numpy.nan)
+        self.bestSolution = numpy.full(size, numpy.inf)
+        self.bestPosition = positions.copy()
+        self.totalMoves = numpy.zeros(size, dtype=numpy.int64)
+        self.acceptedMoves = numpy.zeros(size*self.replicas, dtype=numpy.int64)
+        self.movesToTarget = numpy.zeros(size, dtype=numpy.int64)
+        self.swapAttempts = numpy.zeros(max(0, self.replicas - 1), dtype=numpy.int64)
+        self.swapAccepts = numpy.zeros(max(0, self.replicas - 1), dtype=numpy.int64)
+        self.swapParity = 0
+        self.stopReason = None
+
+
+    """
+     Moves attempted per replica, for the step control.
+
+     @return: array of n*R counts
+     """
+    def replicaMoves(self):
+        return numpy.repeat(self.totalMoves//self.replicas, self.replicas)
+
+
+    """
+     Basic accessor methods. Per chain values have one entry per
+     chain; a chain's moves count every replica.
+
+     @return: temperatures --  the ladder, cold first
+     @return: bestSolution --  best known solutions
+     @return: bestPosition --  (n, D) coord vectors for best solutions
+     @return: totalMoves --    evaluations per chain
+     @return: movesAccepted -- accepted moves per chain
+     @return: movesToTarget -- evaluations per chain to reach the goal
+     @return: evaluations --   evaluations of the whole batch
+     @return: swapRates --     accepted share of the exchanges offered
+                               between replicas k and k+1
+     @return: stopReason --    why the last run stopped early, if it did
+     """
+    def getTemperatures(self):
+        return self.temperatures
+
+    def getBestSolution(self):
+        return self.bestSolution
+
+    def getBestPosition(self):
+        return self.bestPosition
+
+    def getTotalMoves(self):
+        return self.totalMoves
+
+    def getMovesAccepted(self):
+        return self.acceptedMoves.reshape(-1, self.replicas).sum(axis=1)
+
+    def getMovesToTarget(self):
+        return self.movesToTarget
+
+    def getEvaluations(self):
+        return int(self.totalMoves.sum())
+
+    def getSwapRates(self):
+        return self.swapAccepts/numpy.maximum(self.swapAttempts, 1)
+
+    def getStopReason(self):
+        return self.stopReason
+
+    def setStopping(self, criteria):
+        self.stopping = criteria
+
+
+    """
+     Sets and returns the external iterations of the next runs.
+
+     @param value: New external iteration count.
+     """
+    def setExternal(self, value):
+        self.external = value
+
+    def getExternal(self):
+        return self.external
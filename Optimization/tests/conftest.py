@@ -0,0 +1,16 @@
+""" Python Package Support """
+import os
+import sys
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The modules import one another by their plain names, so the tests
+    run with the package directory on the path, as the modules do.
+"""
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
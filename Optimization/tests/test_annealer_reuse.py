@@ -0,0 +1,67 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Hive import Hive
+from SimulatedAnnealing import SimulatedAnnealing
+from Cooling import LogarithmicCooling
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    One annealer serves every chain until the SA settings change;
+    building it draws no random numbers, and each run starts from
+    cleared counters.
+"""
+
+
+@pytest.mark.parametrize("mode", ("scalar", "batch", "tempering"))
+def test_hive_reuses_annealer_until_settings_change(mode):
+    hive = Hive(6, "camelback", saMode=mode, rng=numpy.random.default_rng(0))
+    hive.setSASettings(10, 3, 5, .95, True, True)
+    hive.SimAnn()
+    annealer = hive.getAnnealer()
+    hive.SimAnn()
+    assert hive.getAnnealer() is annealer
+    hive.setSASettings(20, 3, 5, .95, True, True)
+    assert hive.getAnnealer() is not annealer
+    assert hive.getAnnealer().initialTemp == 20
+    annealer = hive.getAnnealer()
+    hive.setSAOptions(schedule=LogarithmicCooling())
+    assert hive.getAnnealer() is not annealer
+    if(mode == "tempering"):
+        """ the ladder replaces the schedule """
+        hive.setTempering(4)
+        assert hive.getAnnealer().replicas == 4
+    else:
+        assert isinstance(hive.getAnnealer().schedule, LogarithmicCooling)
+
+
+def test_building_annealer_draws_nothing():
+    rng = numpy.random.default_rng(1)
+    hive = Hive(6, "camelback", saMode="scalar", rng=rng)
+    hive.setSASettings(10, 3, 5, .95, True, True)
+    state = rng.bit_generator.state
+    globalState = numpy.random.get_state()[1].copy()
+    hive.getAnnealer()
+    assert rng.bit_generator.state == state
+    assert numpy.array_equal(numpy.random.get_state()[1], globalState)
+
+
+def test_runs_start_from_cleared_counters():
+    sim = SimulatedAnnealing("camelback", 10, 5, 10, .95, True, True,
+                             rng=numpy.random.default_rng(2))
+    start = numpy.array([1.0, -0.5])
+    state = sim.random.bit_generator.state
+    first = sim.run(start)
+    moves = sim.getTotalMoves()
+    position = sim.getBestPosition().copy()
+    sim.random.bit_generator.state = state
+    assert sim.run(start) == first
+    assert sim.getTotalMoves() == moves == 50
+    assert numpy.array_equal(sim.getBestPosition(), position)
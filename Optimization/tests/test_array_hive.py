@@ -0,0 +1,71 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Hive import Hive
+from ArrayHive import ArrayHive
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    An ArrayHive starts from the same population as a Hive of
+    Particles, sorts by its order index without moving rows, and its
+    particle views and writers go to the right rows.
+"""
+
+
+"""
+ Both layouts on the same seed.
+ """
+def newHives(size=6):
+    return (Hive(size, "camelback", saMode="batch", rng=numpy.random.default_rng(7)),
+            ArrayHive(size, "camelback", saMode="batch", rng=numpy.random.default_rng(7)))
+
+
+def test_starts_like_particle_hive():
+    hive, arrays = newHives()
+    assert numpy.array_equal(arrays.getPositions(), hive.getPositions())
+    assert numpy.array_equal(arrays.getBestCosts(), hive.getBestCosts())
+    assert arrays.getIDs().tolist() == list(range(6))
+    assert arrays.getEvaluations() == hive.getEvaluations() == 6
+
+
+def test_sort_moves_order_only():
+    hive, arrays = newHives()
+    rows = arrays.positions.copy()
+    arrays.sortListFitness()
+    hive.sortListFitness()
+    assert numpy.array_equal(arrays.positions, rows)
+    assert numpy.array_equal(arrays.getPositions(), rows[arrays.getIDs()])
+    assert numpy.array_equal(arrays.getBestCosts(), hive.getBestCosts())
+    assert numpy.array_equal(arrays.getPositions(), hive.getPositions())
+
+
+def test_writes_follow_population_order():
+    hive, arrays = newHives()
+    arrays.sortListFitness()
+    row = arrays.getIDs()[2]
+    arrays.setResult(2, numpy.array([0.5, 0.5]), -5.0)
+    assert arrays.bestCosts[row] == -5.0
+    assert arrays.positions[row].tolist() == [0.5, 0.5]
+    views = arrays.getPopulation()
+    assert views[2].getID() == row and views[2].getBestCost() == -5.0
+    arrays.sortListFitness()
+    assert arrays.getIDs()[0] == row
+    views[2].setVelocity(numpy.array([1.0, 2.0]))
+    assert arrays.getVelocities()[0].tolist() == [1.0, 2.0]
+
+
+def test_state_round_trip():
+    hive, arrays = newHives()
+    arrays.setResults(0, arrays.getPositions()[::-1], numpy.arange(6.0)[::-1])
+    arrays.sortListFitness()
+    restored = ArrayHive(6, "camelback", saMode="batch", rng=numpy.random.default_rng(8))
+    restored.setState(arrays.getState())
+    assert restored.getIDs().tolist() == arrays.getIDs().tolist()
+    assert numpy.array_equal(restored.getPositions(), arrays.getPositions())
+    assert numpy.array_equal(restored.getBestCosts(), arrays.getBestCosts())
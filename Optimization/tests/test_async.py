@@ -0,0 +1,55 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from AsyncObjective import AsyncEvaluator, AsyncObjectiveDefinition, LatencyObjective
+from Objectives import getObjective
+from Hive import Hive
+from ArrayHive import ArrayHive
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Hives of async objectives evaluate their starting population in
+    one batched call, and the async evaluator returns the costs of the
+    objective it stands in for.
+"""
+
+
+"""
+ Async Branin evaluated in process, one request per 64 vectors.
+ """
+def asyncBranin():
+    evaluator = AsyncEvaluator(LatencyObjective("branin", 0.0), concurrency=4, batchSize=64)
+    definition = AsyncObjectiveDefinition("asyncBranin", evaluator, [-5, 0], [10, 15],
+                                          1.5, getObjective("branin").goal)
+    return evaluator, definition
+
+
+@pytest.mark.parametrize("hive", (Hive, ArrayHive))
+def test_population_evaluated_in_one_request(hive):
+    evaluator, definition = asyncBranin()
+    built = hive(20, definition, "batch", rng=numpy.random.default_rng(0))
+    try:
+        assert evaluator.getStats()["requests"] == 1
+        assert evaluator.getStats()["evaluations"] == 20
+        assert built.getEvaluations() == 20
+        reference = getObjective("branin").create().solveArray(built.getPositions())
+        assert numpy.allclose(built.getCurrentCosts(), reference)
+        assert numpy.array_equal(built.getBestPositions(), built.getPositions())
+    finally:
+        built.shutdown()
+        evaluator.close()
+
+
+def test_definition_reads_dimensions_without_evaluating():
+    evaluator, definition = asyncBranin()
+    assert definition.getDimensions() == 2
+    assert definition.withDimensions(2).getDimensions() == 2
+    assert evaluator.getStats()["requests"] == 0
+    evaluator.close()
@@ -0,0 +1,42 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from BatchAnnealing import BatchSimulatedAnnealing
+from Objectives import getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The batch engine runs every chain for its full length, keeps each
+    chain's best consistent with the objective, and stays in bounds.
+"""
+
+
+def test_chains_run_in_lock_step():
+    rng = numpy.random.default_rng(0)
+    objective = getObjective("camelback")
+    FX = objective.create(rng)
+    starts = rng.uniform(FX.lower, FX.upper, (16, 2))
+    sim = BatchSimulatedAnnealing("camelback", 10, 20, 25, .95, True, True, rng=rng)
+    best = sim.run(starts)
+    assert best.shape == (16,)
+    assert (sim.getTotalMoves() >= 20*25).all()
+    assert sim.getEvaluations() == int(sim.getTotalMoves().sum())
+    assert numpy.allclose(FX.solveArray(sim.getBestPosition()), best)
+    assert (best <= FX.solveArray(starts)).all()
+    assert ((sim.getBestPosition() >= FX.lower) & (sim.getBestPosition() <= FX.upper)).all()
+    assert best.min() - objective.goal < 1e-2
+
+
+def test_seeded_batches_repeat():
+    def run(seed):
+        rng = numpy.random.default_rng(seed)
+        sim = BatchSimulatedAnnealing("branin", 10, 5, 10, .95, True, True, rng=rng)
+        return sim.run(rng.uniform([-5, 0], [10, 15], (4, 2)))
+    assert numpy.array_equal(run(1), run(1))
+    assert not numpy.array_equal(run(1), run(2))
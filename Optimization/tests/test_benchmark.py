@@ -0,0 +1,38 @@
+""" Python Package Support """
+#Not Applicable
+
+""" Internal Package Support """
+from Benchmark import GoalWatch, compareBaseline
+from Telemetry import GOAL, CHAIN
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The benchmark notes the first goal as reported and flags results
+    slower or larger than the baseline.
+"""
+
+
+def test_goal_watch_keeps_first_goal():
+    watch = GoalWatch()
+    watch(CHAIN, {"totalMoves": 3})
+    watch(GOAL, {"totalMoves": 40})
+    watch(GOAL, {"totalMoves": 90})
+    assert watch.moves == 40
+    assert watch.seconds is not None
+
+
+def test_compare_baseline():
+    baseline = {"results": [{"case": "Hive.SimAnn", "mode": "batch", "evalsPerSecond": 1000.0},
+                            {"case": "HiveMemory", "layout": "arrays", "bytesPerParticle": 100.0}]}
+    steady = {"results": [{"case": "Hive.SimAnn", "mode": "batch", "evalsPerSecond": 900.0},
+                          {"case": "HiveMemory", "layout": "arrays", "bytesPerParticle": 110.0}]}
+    worse = {"results": [{"case": "Hive.SimAnn", "mode": "batch", "evalsPerSecond": 700.0},
+                         {"case": "HiveMemory", "layout": "arrays", "bytesPerParticle": 130.0},
+                         {"case": "Hive.SimAnn", "mode": "scalar", "evalsPerSecond": 1.0}]}
+    assert compareBaseline(steady, baseline) == []
+    assert len(compareBaseline(worse, baseline)) == 2
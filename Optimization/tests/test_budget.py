@@ -0,0 +1,40 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Stopping import StoppingCriteria, EVALUATIONS
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Evaluation budgets end a run in every annealing mode and layout,
+    within the budget, including budgets the population does not
+    divide. The iteration cap only keeps a regression from hanging.
+"""
+
+MODES = ("scalar", "batch", "parallel", "tempering", "auto")
+LAYOUTS = ("particles", "arrays")
+BUDGETS = (2003, 2005, 1607)
+ITERATION_CAP = 10000
+
+
+@pytest.mark.parametrize("budget", BUDGETS)
+@pytest.mark.parametrize("layout", LAYOUTS)
+@pytest.mark.parametrize("mode", MODES)
+def test_budget_ends_run(mode, layout, budget):
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode=mode,
+                  workers=2, layout=layout, rng=numpy.random.default_rng(0))
+    swarm.getHive().setSASettings(10, 10, 25, .95, True, True)
+    try:
+        swarm.run(ITERATION_CAP, StoppingCriteria(budget))
+    finally:
+        swarm.getHive().shutdown()
+    assert swarm.getStopReason() == EVALUATIONS
+    assert swarm.getEvaluations() <= budget
+    assert swarm.runIterations < ITERATION_CAP
@@ -0,0 +1,79 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from EvaluationCache import EvaluationCache
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Hits, misses and least recently used eviction of the evaluation
+    cache, and that a miss reaches the objective once.
+"""
+
+
+"""
+ Objective counting the rows it is asked to cost.
+ """
+class Counter(object):
+
+    def __init__(self):
+        self.rows = 0
+
+    def __call__(self, positions):
+        positions = numpy.atleast_2d(positions)
+        self.rows = self.rows + len(positions)
+        return (positions**2).sum(axis=1)
+
+    def scalar(self, position):
+        return float(self(position)[0])
+
+
+def test_hits_and_misses():
+    cache = EvaluationCache(resolution=1e-3)
+    objective = Counter()
+    assert cache.evaluate(numpy.array([1.0, 2.0]), objective.scalar) == 5.0
+    assert cache.evaluate(numpy.array([1.0002, 2.0]), objective.scalar) == 5.0
+    assert objective.rows == 1
+    assert cache.getStats()["hits"] == 1 and cache.getStats()["misses"] == 1
+
+
+def test_batch_computes_each_key_once():
+    cache = EvaluationCache(resolution=1e-3)
+    objective = Counter()
+    positions = numpy.array([[1.0, 0.0], [0.0, 2.0], [1.0, 0.0], [1.0001, 0.0], [0.0, 2.0]])
+    assert cache.evaluateArray(positions, objective).tolist() == [1.0, 4.0, 1.0, 1.0, 4.0]
+    assert objective.rows == 2
+    assert cache.getStats()["misses"] == 2 and cache.getStats()["hits"] == 3
+    assert cache.evaluateArray(positions[:2], objective).tolist() == [1.0, 4.0]
+    assert objective.rows == 2
+
+
+def test_least_recently_used_evicted():
+    cache = EvaluationCache(resolution=1e-3, maxSize=2)
+    objective = Counter()
+    a, b, c = numpy.array([1.0]), numpy.array([2.0]), numpy.array([3.0])
+    cache.evaluate(a, objective.scalar)
+    cache.evaluate(b, objective.scalar)
+    cache.evaluate(a, objective.scalar)
+    cache.evaluate(c, objective.scalar)
+    assert cache.getStats()["evictions"] == 1 and len(cache) == 2
+    cache.evaluate(a, objective.scalar)
+    assert objective.rows == 3
+    cache.evaluate(b, objective.scalar)
+    assert objective.rows == 4
+
+
+def test_state_round_trip():
+    cache = EvaluationCache(resolution=1e-3, maxSize=3)
+    objective = Counter()
+    cache.evaluateArray(numpy.array([[1.0], [2.0], [3.0]]), objective)
+    restored = EvaluationCache()
+    restored.setState(cache.getState())
+    assert restored.evaluateArray(numpy.array([[3.0], [1.0]]), objective).tolist() == [9.0, 1.0]
+    assert objective.rows == 3
+    assert restored.getStats()["hits"] == 2 and restored.getStats()["misses"] == 3
@@ -0,0 +1,61 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm, resumeSwarm
+from Stopping import StoppingCriteria
+from EvaluationCache import EvaluationCache
+from Checkpoint import writeCheckpoint, readCheckpoint
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    A checkpoint keeps plain values and arrays apart and returns both,
+    and a run resumed from a checkpoint finishes exactly as the
+    uninterrupted run does.
+"""
+
+
+def test_sections_round_trip(tmp_path):
+    path = str(tmp_path/"state.npz")
+    writeCheckpoint(path, {"first": {"size": 3, "name": "x", "values": numpy.arange(3.0)},
+                           "second": {"missing": None}})
+    sections = readCheckpoint(path)
+    assert sections["first"]["size"] == 3 and sections["first"]["name"] == "x"
+    assert sections["first"]["values"].tolist() == [0.0, 1.0, 2.0]
+    assert sections["second"] == {"missing": None}
+    assert [entry.name for entry in tmp_path.iterdir()] == ["state.npz"]
+
+
+"""
+ Swarm of the resume tests.
+ """
+def newSwarm(layout):
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode="batch",
+                  layout=layout, cache=EvaluationCache(),
+                  rng=numpy.random.default_rng(4))
+    swarm.getHive().setSASettings(5, 5, 25, .95, True, True)
+    return swarm
+
+
+@pytest.mark.parametrize("layout", ("particles", "arrays"))
+def test_resumed_run_matches_uninterrupted(tmp_path, layout):
+    path = str(tmp_path/"swarm.npz")
+    whole = newSwarm(layout)
+    whole.run(6, StoppingCriteria(100000))
+    interrupted = newSwarm(layout)
+    for snapshot in interrupted.iterate(6, StoppingCriteria(100000), path, 3):
+        if(interrupted.runIterations == 3):
+            break
+    resumed, stopping = resumeSwarm(path)
+    assert stopping.maxEvaluations == 100000
+    resumed.run(6, stopping, resume=True)
+    assert resumed.getBestCost() == whole.getBestCost()
+    assert resumed.getEvaluations() == whole.getEvaluations()
+    assert numpy.array_equal(resumed.getBestPosition(), whole.getBestPosition())
+    assert numpy.array_equal(resumed.getHive().getPositions(), whole.getHive().getPositions())
@@ -0,0 +1,87 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Cooling import (GeometricCooling, LogarithmicCooling, LundyMeesCooling,
+                     ReheatingCooling, AcceptanceStepControl)
+from SimulatedAnnealing import SimulatedAnnealing
+from BatchAnnealing import BatchSimulatedAnnealing
+from Hive import Hive
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Temperature sequences of the cooling schedules, the step control's
+    response to the acceptance ratio, and the acceptance rule it needs.
+"""
+
+
+"""
+ Temperatures after each of a number of external iterations.
+ """
+def sequence(schedule, steps, initialTemp=100.0, alpha=0.5, improved=False):
+    schedule.start(initialTemp, steps, alpha, initialTemp)
+    temp = initialTemp
+    temps = list()
+    for i in range (steps):
+        temp = float(schedule.update(temp, improved))
+        temps.append(temp)
+    return temps
+
+
+def test_geometric_resets_below_floor():
+    assert sequence(GeometricCooling(floor=10.0), 5) == [50.0, 25.0, 12.5, 100.0, 50.0]
+    assert sequence(GeometricCooling(alpha=0.9), 2) == pytest.approx([90.0, 81.0])
+
+
+def test_logarithmic():
+    temps = sequence(LogarithmicCooling(c=2.0), 3)
+    assert temps == pytest.approx([100.0/(1 + 2.0*numpy.log(k + 1)) for k in (1, 2, 3)])
+
+
+def test_lundy_mees_reaches_final_temperature():
+    temps = sequence(LundyMeesCooling(finalTemp=2.0), 20)
+    assert temps[-1] == pytest.approx(2.0)
+    assert all(later < earlier for earlier, later in zip(temps, temps[1:]))
+
+
+def test_reheating_after_patience():
+    temps = sequence(ReheatingCooling(GeometricCooling(floor=1e-9), patience=3,
+                                      fraction=0.5), 5, alpha=0.2)
+    assert temps == pytest.approx([20.0, 4.0, 50.0, 10.0, 2.0])
+
+
+def test_schedules_run_per_chain():
+    schedule = LundyMeesCooling(beta=0.01)
+    temps = numpy.array([100.0, 10.0])
+    schedule.start(100.0, 10, 0.9, temps)
+    assert schedule.update(temps, numpy.array([True, False])) == pytest.approx([50.0, 10.0/1.1])
+
+
+def test_step_control_follows_acceptance():
+    control = AcceptanceStepControl(target=0.4, factor=2.0, minScale=0.1, maxScale=1.0)
+    control.start()
+    assert control.update(10, 1) == 0.5
+    assert control.update(20, 2) == 0.25
+    assert control.update(30, 10) == 0.5
+    control.start(2)
+    assert control.update(numpy.array([10, 10]), numpy.array([9, 1])).tolist() == [1.0, 0.5]
+
+
+def test_step_control_needs_metropolis():
+    with pytest.raises(ValueError):
+        SimulatedAnnealing(1, 10, 5, 5, .95, True, True,
+                           stepControl=AcceptanceStepControl())
+    with pytest.raises(ValueError):
+        BatchSimulatedAnnealing(1, 10, 5, 5, .95, True, True,
+                                stepControl=AcceptanceStepControl())
+    hive = Hive(4, 1, "batch", seed=1)
+    with pytest.raises(ValueError):
+        hive.setSAOptions(stepControl=AcceptanceStepControl())
+    hive.setSAOptions(stepControl=AcceptanceStepControl(), acceptance="metropolis")
+    hive.shutdown()
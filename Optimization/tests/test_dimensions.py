@@ -0,0 +1,63 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Objectives import getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Objectives built for any number of dimensions keep their optimum,
+    moves stay inside the domain, and swarms of every layout and mode
+    run in N dimensions on contiguous (n, D) arrays.
+"""
+
+SCALABLE = ("rastrigin", "ackley", "griewank", "rosenbrock")
+
+
+@pytest.mark.parametrize("name", SCALABLE)
+@pytest.mark.parametrize("dimensions", (1, 3, 25))
+def test_optimum_in_any_dimension(name, dimensions):
+    objective = getObjective(name).withDimensions(dimensions)
+    function = objective.create(numpy.random.default_rng(0))
+    assert objective.getDimensions() == function.getDimensions() == dimensions
+    assert function.getPosition().shape == (dimensions,)
+    assert len(objective.optimum) == dimensions
+    assert abs(function.cost(objective.optimum) - objective.goal) < 1e-9
+
+
+@pytest.mark.parametrize("name", SCALABLE + ("camelback", "branin"))
+def test_moves_wrap_inside_domain(name):
+    function = getObjective(name).create(numpy.random.default_rng(0))
+    dimensions = function.getDimensions()
+    rng = numpy.random.default_rng(1)
+    positions = rng.uniform(function.lower, function.upper, (500, dimensions))
+    width = function.upper - function.lower
+    moved = function.checkArray(positions + rng.uniform(-1, 1, positions.shape)*width)
+    assert numpy.all((moved >= function.lower) & (moved <= function.upper))
+    """ inside the domain nothing moves """
+    assert numpy.array_equal(function.checkArray(positions), positions)
+
+
+@pytest.mark.parametrize("layout", ("particles", "arrays"))
+@pytest.mark.parametrize("mode", ("scalar", "batch", "tempering"))
+def test_swarm_in_dimensions(mode, layout):
+    objective = getObjective("rastrigin").withDimensions(6)
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, objective, saMode=mode, layout=layout,
+                  rng=numpy.random.default_rng(2))
+    swarm.getHive().setSASettings(5, 3, 10, .95, True, True)
+    swarm.run(3)
+    hive = swarm.getHive()
+    positions = hive.getPositions()
+    assert positions.shape == (8, 6) and positions.flags.c_contiguous
+    assert positions.dtype == numpy.float64
+    function = hive.getFunction()
+    assert numpy.all((positions >= function.lower) & (positions <= function.upper))
+    assert swarm.getBestPosition().shape == (6,)
+    assert numpy.isclose(function.cost(swarm.getBestPosition()), swarm.getBestCost())
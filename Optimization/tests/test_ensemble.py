@@ -0,0 +1,78 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Ensemble import Ensemble, EnsembleStats, runMember
+from Telemetry import RUN
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Ensemble members depend on their own seed only and leave the
+    global random state alone, and the statistics aggregate the runs
+    as they finish.
+"""
+
+SA_SETTINGS = (10, 5, 10, .95, True, True)
+
+
+def test_member_depends_on_seed_only():
+    settings = Ensemble(8, "camelback", 3, saSettings=SA_SETTINGS, workers=1).settings
+    numpy.random.seed(1)
+    state = numpy.random.get_state()[1].copy()
+    first = runMember(settings, 0, 11)
+    assert numpy.array_equal(numpy.random.get_state()[1], state)
+    numpy.random.seed(2)
+    second = runMember(settings, 0, 11)
+    for key in ("bestCost", "bestPosition", "evaluations", "iterations"):
+        assert first[key] == second[key]
+    assert runMember(settings, 0, 12)["bestPosition"] != first["bestPosition"]
+
+
+def test_seeded_ensemble_repeats():
+    ensemble = Ensemble(8, "camelback", 3, saSettings=SA_SETTINGS, workers=1)
+    results = ensemble.run(3, seed=5)
+    again = Ensemble(8, "camelback", 3, saSettings=SA_SETTINGS, workers=1).run(3, seed=5)
+    assert ([result["bestCost"] for result in results] ==
+            [result["bestCost"] for result in again])
+
+
+"""
+ Result dict of a member run, as runMember() returns it.
+ """
+def result(run, cost, seconds=None, evaluations=None):
+    return {"run": run, "bestCost": cost, "success": seconds is not None,
+            "secondsToTarget": seconds, "evalsToTarget": evaluations}
+
+
+def test_stats_aggregate_finished_runs():
+    stats = EnsembleStats()
+    stats.expect(5)
+    assert stats.getStats()["successRate"] is None
+    for entry in (result(0, 1.0, 2.0, 100), result(1, 3.0),
+                  result(2, 0.5, 4.0, 300), result(3, 2.0, 6.0, 200)):
+        stats.add(entry)
+    stats("iteration", result(9, -9.0))
+    values = stats.getStats()
+    assert values["finished"] == 4 and values["pending"] == 1
+    assert values["successes"] == 3 and values["successRate"] == 0.75
+    assert values["bestCost"] == 0.5 and values["medianCost"] == 1.5
+    assert values["secondsToTarget_p50"] == 4.0
+    assert values["evalsToTarget_p50"] == 200.0
+    stats(RUN, result(4, 4.0))
+    assert stats.getStats()["pending"] == 0
+
+
+def test_stats_follow_streamed_results():
+    ensemble = Ensemble(8, "camelback", 3, saSettings=SA_SETTINGS, workers=1)
+    costs = list()
+    for entry in ensemble.iterResults(3, seed=5):
+        costs.append(entry["bestCost"])
+        values = ensemble.getStats().getStats()
+        assert values["finished"] == len(costs)
+        assert values["pending"] == 3 - len(costs)
+        assert values["bestCost"] == min(costs)
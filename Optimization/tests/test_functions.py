@@ -0,0 +1,47 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Objectives import getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Array evaluation agrees with the one-vector cost, the known optima
+    reach the registered goals, and the moves keep the coordinates in
+    the domain.
+"""
+
+
+@pytest.mark.parametrize("name", ("camelback", "branin"))
+def test_array_matches_scalar_cost(name):
+    rng = numpy.random.default_rng(0)
+    FX = getObjective(name).create(rng)
+    positions = rng.uniform(FX.lower, FX.upper, (50, 2))
+    assert numpy.allclose(FX.solveArray(positions), [FX.cost(row) for row in positions],
+                          rtol=1e-12, atol=1e-12)
+
+
+@pytest.mark.parametrize("name", ("camelback", "branin", "rastrigin", "rosenbrock",
+                                  "ackley", "griewank"))
+def test_optimum_reaches_goal(name):
+    objective = getObjective(name)
+    FX = objective.create(numpy.random.default_rng(0))
+    assert FX.solveArray(objective.optimum[numpy.newaxis, :])[0] == \
+        pytest.approx(objective.goal, abs=1e-5)
+
+
+def test_solve_tracks_best():
+    FX = getObjective("camelback").create(numpy.random.default_rng(1))
+    first = FX.bestSolution
+    FX.processValues(numpy.array([0.089842, -0.712656]))
+    assert FX.bestSolution == pytest.approx(-1.0316, abs=1e-4)
+    assert FX.bestSolution <= first
+    FX.processValues(numpy.array([2.5, 2.5]))
+    assert FX.currentSolution > FX.bestSolution
+    assert FX.bestPosition.tolist() == [0.089842, -0.712656]
@@ -0,0 +1,87 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Islands import IslandModel, migrationRoutes
+from Swarm import Swarm
+from Stopping import StoppingCriteria, EVALUATIONS
+from Telemetry import Telemetry, MIGRATION
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The island model keeps to its evaluation budget, reports the best
+    of its islands, and repeats itself when seeded.
+"""
+
+SA_SETTINGS = (10, 5, 10, .95, True, True)
+
+
+"""
+ Builds a small island model on the six-hump camelback.
+ """
+def islandModel(shareBest=False, telemetry=None):
+    return IslandModel(4, 20, "camelback", interval=2, saMode="batch",
+                       saSettings=SA_SETTINGS, telemetry=telemetry,
+                       shareBest=shareBest)
+
+
+"""
+ Island best costs at every migration epoch of a run.
+ """
+def epochCosts(shareBest, seed):
+    telemetry = Telemetry()
+    epochs = list()
+    telemetry.attach(lambda event, fields: epochs.append(fields["islandCosts"])
+                     if event == MIGRATION else None)
+    islandModel(shareBest, telemetry).run(4, seed=seed)
+    return epochs
+
+
+@pytest.mark.parametrize("budget", (2000, 3007, 6007))
+def test_budget_covers_initial_populations(budget):
+    model = islandModel()
+    model.run(None, StoppingCriteria(budget), seed=1)
+    assert model.getStopReason() == EVALUATIONS
+    assert model.getEvaluations() <= budget
+
+
+def test_best_of_islands_and_seeded_repeat():
+    model = islandModel()
+    bestCost = model.run(6, seed=4)
+    reports = model.getIslandReports()
+    assert bestCost == min(report["bestCost"] for report in reports)
+    assert model.getBestIsland() == min(reports, key=lambda report: report["bestCost"])["island"]
+    again = islandModel()
+    assert again.run(6, seed=4) == bestCost
+    assert again.getEvaluations() == model.getEvaluations()
+
+
+def test_immigrants_replace_worst_and_lead():
+    swarm = Swarm(6, 2.05, 2.05, 1.0, .7298, "camelback", saMode="batch",
+                  rng=numpy.random.default_rng(2))
+    hive = swarm.getHive()
+    worst = hive.getBestCosts()[-2:].copy()
+    optimum = numpy.array([[0.089842, -0.712656], [-0.089842, 0.712656]])
+    assert swarm.immigrate(numpy.array([-1.0316, -1.03]), optimum) == 2
+    assert swarm.getBestCost() == -1.0316
+    assert numpy.array_equal(swarm.getBestPosition(), optimum[0])
+    assert hive.getBestCosts()[0] == -1.0316
+    assert not numpy.isin(worst, hive.getBestCosts()).any()
+    hive.shutdown()
+
+
+def test_shared_board_reaches_every_island():
+    first, second = epochCosts(True, 2)
+    assert max(second) <= min(first)
+
+
+def test_routes():
+    assert migrationRoutes("ring", 3) == [[2], [0], [1]]
+    assert migrationRoutes("full", 3) == [[1, 2], [0, 2], [0, 1]]
+    assert migrationRoutes("ring", 1) == [[]]
@@ -0,0 +1,70 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Stopping import StoppingCriteria, EVALUATIONS
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Swarm.iterate() yields one snapshot per iteration that agrees with
+    run(), and a consumer closing it early leaves the swarm as it
+    stood after the last snapshot.
+"""
+
+
+"""
+ Swarm of the iterate tests.
+ """
+def newSwarm():
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode="batch",
+                  rng=numpy.random.default_rng(6))
+    swarm.getHive().setSASettings(5, 5, 25, .95, True, True)
+    return swarm
+
+
+def test_snapshots_match_run():
+    swarm = newSwarm()
+    snapshots = list(swarm.iterate(5))
+    assert [snapshot.runIteration for snapshot in snapshots] == [1, 2, 3, 4, 5]
+    costs = [snapshot.bestCost for snapshot in snapshots]
+    assert costs == sorted(costs, reverse=True)
+    assert all(snapshot.improvement >= 0 for snapshot in snapshots)
+    evaluations = [snapshot.evaluations for snapshot in snapshots]
+    assert evaluations == sorted(evaluations) and evaluations[0] > 0
+    assert snapshots[-1].stopReason is None
+    whole = newSwarm()
+    assert whole.run(5) == costs[-1]
+    assert whole.getEvaluations() == evaluations[-1]
+
+
+def test_snapshot_position_is_read_only():
+    snapshot = next(newSwarm().iterate(1))
+    with pytest.raises(ValueError):
+        snapshot.bestPosition[0] = 0.0
+
+
+def test_close_stops_early():
+    swarm = newSwarm()
+    run = swarm.iterate(10)
+    for snapshot in run:
+        if(snapshot.runIteration == 2):
+            break
+    run.close()
+    assert swarm.runIterations == 2
+    assert swarm.getBestCost() == snapshot.bestCost
+    assert swarm.getEvaluations() == snapshot.evaluations
+    assert swarm.getStopReason() is None
+
+
+def test_last_snapshot_carries_stop_reason():
+    snapshots = list(newSwarm().iterate(100, StoppingCriteria(500)))
+    assert snapshots[-1].stopReason == EVALUATIONS
+    assert all(snapshot.stopReason is None for snapshot in snapshots[:-1])
+    assert snapshots[-1].evaluations <= 500
@@ -0,0 +1,54 @@
+""" Python Package Support """
+import random
+import numpy
+
+""" Internal Package Support """
+from Leaderboard import Leaderboard
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The leaderboard keeps the k best entries, one per particle, through
+    replacements and evictions, and its heap stays bounded.
+"""
+
+
+def test_order_after_replacements():
+    board = Leaderboard(3)
+    for particle, cost in ((0, 5.0), (1, 4.0), (2, 3.0)):
+        board.offer(cost, particle, numpy.array([cost]))
+    assert board.threshold() == 5.0
+    assert not board.offer(6.0, 3, numpy.zeros(1))
+    assert not board.offer(5.5, 0, numpy.zeros(1))
+    assert board.offer(1.0, 0, numpy.array([1.0]))
+    assert [(cost, particle) for cost, particle, position in board.getTop()] == \
+        [(1.0, 0), (3.0, 2), (4.0, 1)]
+    assert board.threshold() == 4.0
+    assert not board.offer(2.0, 3, numpy.array([2.0]))
+    assert [particle for cost, particle, position in board.getTop()] == [0, 3, 2]
+    assert board.threshold() == 3.0
+    assert board.getBestCost() == 1.0 and board.getBestParticle() == 0
+    assert board.getBestPosition().tolist() == [1.0]
+    assert len(board) == 3
+
+
+def test_matches_reference():
+    rng = random.Random(3)
+    board = Leaderboard(5)
+    best = dict()
+    for i in range (5000):
+        particle = rng.randrange(12)
+        cost = rng.random()
+        board.offer(cost, particle, numpy.array([cost]))
+        if(cost < best.get(particle, float("inf"))):
+            best[particle] = cost
+        """ the board holds the k best of the particles' bests, ties aside """
+        expected = sorted(best.values())[:5]
+        top = [entry[0] for entry in board.getTop()]
+        assert top == expected[:len(top)]
+        assert board.threshold() == (expected[-1] if len(expected) == 5 else float("inf"))
+        assert len(board.heap) <= 2*5 + 1
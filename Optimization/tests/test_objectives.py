@@ -0,0 +1,35 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Objectives import getObjective, listObjectives
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Objective definitions describe their Functions without building
+    one, and resolve any integral key.
+"""
+
+
+@pytest.mark.parametrize("name", listObjectives())
+def test_definition_describes_function(name):
+    objective = getObjective(name)
+    function = objective.create(numpy.random.default_rng(0))
+    assert objective.getDimensions() == function.getDimensions()
+    assert numpy.array_equal(numpy.broadcast_to(objective.lower, (function.getDimensions(),)),
+                             function.lower)
+    assert objective.wrap == function.wrap
+
+
+def test_integral_keys():
+    assert getObjective(numpy.int64(1)).name == "camelback"
+    assert getObjective(numpy.int64(3)).name == "branin"
+    assert getObjective(1) is getObjective("camelback")
+    with pytest.raises(KeyError):
+        getObjective("nonesuch")
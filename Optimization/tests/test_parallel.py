@@ -0,0 +1,68 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from Hive import Hive, annealChunk
+from EvaluationCache import EvaluationCache
+from Objectives import getObjective
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    A chain's result depends on its own seed only, not on the chunk it
+    shares a worker with, so the pool returns exactly what the chains
+    give in process, and the workers' evaluations and cache counters
+    reach the hive.
+"""
+
+SA_SETTINGS = (10, 3, 5, .95, True, True)
+SA_OPTIONS = {"schedule": None, "stepControl": None, "acceptance": "legacy",
+              "surrogate": None}
+
+
+"""
+ Chains of the parallel tests, one per starting position.
+ """
+def newTasks(positions, seed):
+    seeds = numpy.random.SeedSequence(seed).spawn(len(positions))
+    return [(positions[i], seeds[i], SA_SETTINGS[1]) for i in range (len(positions))]
+
+
+def test_chains_independent_of_chunking():
+    positions = numpy.random.default_rng(0).uniform(-2, 2, (5, 2))
+    objective = getObjective("camelback")
+    together, moves, counts = annealChunk(objective, SA_SETTINGS, SA_OPTIONS, None, None,
+                                          newTasks(positions, 1))
+    assert counts is None and moves == 5*3*5
+    for i in range (5):
+        alone = annealChunk(objective, SA_SETTINGS, SA_OPTIONS, None, None,
+                            newTasks(positions, 1)[i:i+1])[0][0]
+        assert numpy.array_equal(alone[0], together[i][0])
+        assert alone[1:] == together[i][1:]
+
+
+def test_pool_matches_in_process():
+    rng = numpy.random.default_rng(2)
+    cache = EvaluationCache()
+    hive = Hive(6, "camelback", saMode="parallel", workers=2, cache=cache, rng=rng)
+    hive.setSASettings(*SA_SETTINGS)
+    positions = hive.getPositions()
+    spent = hive.getEvaluations()
+    """ the hive's draw of the chains' root seed, replayed """
+    replay = numpy.random.default_rng()
+    replay.bit_generator.state = rng.bit_generator.state
+    seeds = numpy.random.SeedSequence(int(replay.integers(2**63))).spawn(6)
+    tasks = [(positions[i], seeds[i], SA_SETTINGS[1]) for i in range (6)]
+    expected, moves, counts = annealChunk(getObjective("camelback"), SA_SETTINGS,
+                                          SA_OPTIONS, None, None, tasks)
+    try:
+        hive.SimAnn()
+    finally:
+        hive.shutdown()
+    assert sorted(hive.getBestCosts().tolist()) == sorted(result[1] for result in expected)
+    assert hive.getEvaluations() - spent == moves
+    assert cache.hits + cache.misses == moves
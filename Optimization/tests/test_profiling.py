@@ -0,0 +1,89 @@
+""" Python Package Support """
+import time
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Objectives import getObjective
+from Profiling import (Profiler, PhaseTimer, ITERATION, VELOCITY, ANNEALING,
+                       SORTING, ADMIN, EVALUATION)
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Phase timers add up nested and repeated use once per outer call,
+    instrumented objectives count every evaluation once, and a
+    profiled swarm accounts for each phase of every iteration and the
+    evaluations of every particle.
+"""
+
+
+def test_timer_counts_outer_calls():
+    timer = PhaseTimer()
+    with timer:
+        with timer:
+            time.sleep(0.01)
+    with timer:
+        pass
+    assert timer.calls == 2 and timer.depth == 0
+    assert timer.seconds >= 0.01
+
+
+def test_inactive_profiler_records_nothing():
+    profiler = Profiler(active=False)
+    with profiler.phase(SORTING):
+        pass
+    FX = profiler.instrument(getObjective("camelback").create())
+    profiler.countEvaluations([0, 1], 5)
+    assert profiler.getStats() == dict()
+    assert not hasattr(FX, "profiler")
+    assert len(profiler.getParticleEvaluations()) == 0
+
+
+def test_instrumented_evaluations_counted_once():
+    profiler = Profiler()
+    FX = getObjective("camelback").create()
+    profiler.instrument(FX)
+    profiler.instrument(FX)
+    FX.cost(numpy.zeros(2))
+    FX.solveArray(numpy.zeros((4, 2)))
+    stats = profiler.getStats()[EVALUATION]
+    assert stats["evaluations"] == 5
+    assert stats["calls"] == 2
+
+
+def test_particle_counts_grow_and_accumulate():
+    profiler = Profiler()
+    profiler.countEvaluations([1, 1, 3], [2, 3, 4])
+    profiler.countEvaluations(6, 10)
+    assert profiler.getParticleEvaluations()[:7].tolist() == [0, 5, 0, 4, 0, 0, 10]
+
+
+@pytest.mark.parametrize("mode", ("scalar", "batch"))
+def test_swarm_phases(mode):
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode=mode,
+                  rng=numpy.random.default_rng(0))
+    swarm.getHive().setSASettings(5, 5, 25, .95, True, True)
+    profiler = Profiler()
+    swarm.setProfiler(profiler)
+    spent = swarm.getEvaluations()
+    swarm.run(3)
+    stats = profiler.getStats()
+    for name in (ITERATION, VELOCITY, ANNEALING, SORTING, ADMIN):
+        assert stats[name]["calls"] == 3
+    assert stats[ANNEALING]["seconds"] <= stats[ITERATION]["seconds"]
+    assert stats[EVALUATION]["evaluations"] == swarm.getEvaluations() - spent
+    assert profiler.getParticleEvaluations().sum() == swarm.getEvaluations() - spent
+    """ a detached profiler, or one replaced, hears of no further calls """
+    swarm.setProfiler(None)
+    swarm.run(1)
+    other = Profiler()
+    swarm.setProfiler(other)
+    swarm.run(1)
+    assert profiler.getStats() == stats
+    assert other.getStats()[EVALUATION]["evaluations"] == 1000
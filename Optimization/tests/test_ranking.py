@@ -0,0 +1,51 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Hive import Hive
+from ArrayHive import ArrayHive
+from Swarm import Swarm
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Both hive layouts rank the population best first, ties in their
+    previous order, and the swarm's global best follows the
+    leaderboard.
+"""
+
+COSTS = [3.0, 1.0, 2.0, 1.0, 0.5, 2.0]
+
+
+@pytest.mark.parametrize("layout", (Hive, ArrayHive))
+def test_sort_is_stable_best_first(layout):
+    hive = layout(len(COSTS), "camelback", saMode="batch", rng=numpy.random.default_rng(0))
+    positions = hive.getPositions()
+    hive.setResults(0, positions, COSTS)
+    ids = hive.getIDs().tolist()
+    hive.sortListFitness()
+    assert hive.getBestCosts().tolist() == sorted(COSTS)
+    expected = sorted(range(len(COSTS)), key=lambda i: COSTS[i])
+    assert hive.getIDs().tolist() == [ids[i] for i in expected]
+    assert numpy.array_equal(hive.getBestPosition(0), positions[4])
+
+
+@pytest.mark.parametrize("layout", ("particles", "arrays"))
+def test_global_best_follows_leaderboard(layout):
+    swarm = Swarm(12, 2.05, 2.05, .7, .7298, "camelback", saMode="batch",
+                  layout=layout, topK=4, rng=numpy.random.default_rng(2))
+    swarm.getHive().setSASettings(5, 5, 25, .95, True, True)
+    seen = float("inf")
+    for snapshot in swarm.iterate(5):
+        seen = min(seen, swarm.getHive().getBestCosts().min())
+        board = swarm.getLeaderboard()
+        top = board.getTop()
+        assert [entry[0] for entry in top] == sorted(entry[0] for entry in top)
+        assert len(top) == 4
+        assert swarm.getBestCost() == board.getBestCost() == top[0][0]
+        assert board.getBestCost() <= seen
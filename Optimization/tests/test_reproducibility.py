@@ -0,0 +1,68 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm, resumeSwarm
+from Stopping import StoppingCriteria
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    A seeded swarm gives the same result whichever way it is run: in
+    either layout, on one worker or several, and through a checkpoint
+    and resume.
+"""
+
+MODES = ("scalar", "batch", "parallel", "tempering")
+
+
+"""
+ Builds a small seeded swarm on the six-hump camelback.
+ """
+def seededSwarm(saMode, layout="particles", workers=None, seed=3):
+    swarm = Swarm(8, 2.05, 2.05, 1.0, .7298, "camelback", saMode=saMode, workers=workers,
+                  layout=layout, rng=numpy.random.default_rng(seed))
+    swarm.getHive().setSASettings(10, 5, 10, .95, True, True)
+    return swarm
+
+
+"""
+ Runs a swarm and returns what a run is judged by.
+ """
+def outcome(swarm, maxIterations, stopping=None, **options):
+    try:
+        swarm.run(maxIterations, stopping, **options)
+        return (swarm.getBestCost(), swarm.getEvaluations(),
+                numpy.asarray(swarm.getBestPosition(), dtype=float).tolist())
+    finally:
+        swarm.getHive().shutdown()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_layouts_agree(mode):
+    assert (outcome(seededSwarm(mode, "particles"), 4) ==
+            outcome(seededSwarm(mode, "arrays"), 4))
+
+
+@pytest.mark.parametrize("workers", (2, 3))
+def test_workers_agree(workers):
+    assert (outcome(seededSwarm("parallel", workers=1), 3) ==
+            outcome(seededSwarm("parallel", workers=workers), 3))
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_resume_matches_uninterrupted(mode, tmp_path):
+    path = str(tmp_path / "swarm.npz")
+    expected = outcome(seededSwarm(mode), 4, StoppingCriteria(100000))
+    interrupted = seededSwarm(mode)
+    try:
+        interrupted.run(2, StoppingCriteria(100000), path)
+    finally:
+        interrupted.getHive().shutdown()
+    swarm, stopping = resumeSwarm(path)
+    assert outcome(swarm, 4, stopping, resume=True) == expected
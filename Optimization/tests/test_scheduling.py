@@ -0,0 +1,68 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Swarm import Swarm, resumeSwarm
+from Stopping import StoppingCriteria
+from Scheduling import FixedBudget, Stagnating
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Annealing policies keep to their budgets and survive a checkpoint.
+"""
+
+
+def test_fixed_budget_never_overshoots():
+    ids = numpy.arange(6)
+    costs = numpy.array([5.0, 1.0, 3.0, 2.0, 4.0, 0.0])
+    indices, externals = FixedBudget(40).plan(ids, costs, 10, 50)
+    assert len(indices) == 0 and len(externals) == 0
+    indices, externals = FixedBudget(120).plan(ids, costs, 10, 50)
+    assert indices.tolist() == [5, 1]
+    assert (externals*50).sum() <= 120
+
+
+@pytest.mark.parametrize("mode", ("batch", "tempering"))
+def test_fixed_budget_holds_per_iteration(mode):
+    swarm = Swarm(10, 2.05, 2.05, .7, .7298, "camelback", saMode=mode,
+                  rng=numpy.random.default_rng(0))
+    hive = swarm.getHive()
+    hive.setSASettings(10, 10, 5, .95, True, True)
+    hive.setTempering(4)
+    hive.setAnnealingPolicy(FixedBudget(200))
+    try:
+        for i in range (3):
+            spent = swarm.getEvaluations()
+            swarm.updateWithVels()
+            assert 0 < swarm.getEvaluations() - spent <= 200
+    finally:
+        hive.shutdown()
+
+
+def test_resume_keeps_policy_state(tmp_path):
+    path = str(tmp_path / "swarm.npz")
+
+    def build():
+        swarm = Swarm(8, 2.05, 2.05, 1.0, .7298, "camelback", saMode="batch",
+                      rng=numpy.random.default_rng(5))
+        swarm.getHive().setSASettings(10, 5, 10, .95, True, True)
+        swarm.getHive().setAnnealingPolicy(Stagnating(patience=2, limit=3))
+        return swarm
+
+    swarm = build()
+    swarm.run(6, StoppingCriteria(100000))
+    expected = (swarm.getBestCost(), swarm.getEvaluations())
+    swarm.getHive().shutdown()
+    swarm = build()
+    swarm.run(3, StoppingCriteria(100000), path)
+    swarm.getHive().shutdown()
+    swarm, stopping = resumeSwarm(path, policy=Stagnating(patience=2, limit=3))
+    swarm.run(6, stopping, resume=True)
+    swarm.getHive().shutdown()
+    assert (swarm.getBestCost(), swarm.getEvaluations()) == expected
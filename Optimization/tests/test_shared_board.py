@@ -0,0 +1,90 @@
+""" Python Package Support """
+import multiprocessing
+import numpy
+import pytest
+
+""" Internal Package Support """
+from SharedBoard import SharedBestBoard
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The shared board keeps the best offer of any process, readers give
+    up on an entry left mid-update, and a writer losing the race for
+    the lock does not overwrite a better entry.
+"""
+
+
+"""
+ Offers random solutions to a board from a worker process.
+ """
+def offerMany(board, owner, seed):
+    rng = numpy.random.default_rng(seed)
+    for i in range (200):
+        position = rng.uniform(-1, 1, board.getDimensions())
+        board.offer(float((position**2).sum()), position, owner)
+    board.close()
+
+
+"""
+ Lock stand-in letting another writer publish just before entry.
+ """
+class RacingLock(object):
+
+    def __init__(self, board, cost):
+        self.board = board
+        self.cost = cost
+
+    def __enter__(self):
+        self.board.entry[0] = self.cost
+
+    def __exit__(self, *exception):
+        return False
+
+
+@pytest.fixture
+def board():
+    board = SharedBestBoard(2)
+    yield board
+    board.unlink()
+
+
+def test_offer_and_read(board):
+    assert board.read() == (float("inf"), pytest.approx([0.0, 0.0]), -1, 0)
+    assert board.offer(3.0, numpy.array([1.0, 1.0]), 4)
+    assert not board.offer(3.0, numpy.array([2.0, 2.0]), 5)
+    assert board.offer(1.0, numpy.array([0.5, 0.5]), 6)
+    cost, position, owner, updates = board.read()
+    assert (cost, position.tolist(), owner, updates) == (1.0, [0.5, 0.5], 6, 2)
+
+
+def test_reader_gives_up_on_dead_writer(board):
+    board.header[0] = 1
+    with pytest.raises(RuntimeError):
+        board.read(timeout=0.05)
+
+
+def test_offer_rechecks_under_lock(board):
+    board.lock = RacingLock(board, 0.5)
+    assert not board.offer(1.0, numpy.array([1.0, 1.0]))
+    assert board.getBestCost() == 0.5
+    assert board.getUpdates() == 0
+
+
+def test_processes_keep_best(board):
+    processes = [multiprocessing.Process(target=offerMany, args=(board, owner, owner))
+                 for owner in range (3)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(30)
+    best = min((float((position**2).sum()), owner)
+               for owner in range (3)
+               for position in numpy.random.default_rng(owner).uniform(-1, 1, (200, 2)))
+    cost, position, owner, updates = board.read()
+    assert cost == best[0] and owner == best[1]
+    assert float((position**2).sum()) == cost
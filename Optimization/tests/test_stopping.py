@@ -0,0 +1,90 @@
+""" Python Package Support """
+import time
+import numpy
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Stopping import StoppingCriteria, EVALUATIONS, TARGET, STAGNATION, DEADLINE
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Each stopping criterion reports its own reason at the checkpoint
+    that crosses it, child criteria split the remaining budget, and a
+    swarm given a reachable target stops on it.
+"""
+
+
+def test_budget():
+    criteria = StoppingCriteria(100)
+    assert criteria.update(99, 1.0) is None
+    assert criteria.remaining(99) == 1
+    assert criteria.update(100, 0.5) == EVALUATIONS
+    assert criteria.remaining(150) == 0
+    assert StoppingCriteria().remaining(10) is None
+
+
+def test_target_within_tolerance():
+    criteria = StoppingCriteria(target=1.0, tolerance=0.01)
+    assert not criteria.reached(1.02)
+    assert criteria.update(10, 1.02) is None
+    assert criteria.reached(1.005)
+    assert criteria.update(20, 1.005) == TARGET
+
+
+def test_stagnation_counts_checkpoints_without_improvement():
+    criteria = StoppingCriteria(stagnation=3)
+    assert [criteria.update(i, cost) for i, cost in
+            enumerate((5.0, 4.0, 4.0, 4.0, 3.0, 3.0, 3.0))] == [None]*7
+    assert criteria.update(7, 3.0) == STAGNATION
+
+
+def test_deadline():
+    criteria = StoppingCriteria(deadline=0.05)
+    assert criteria.update(0, 1.0) is None
+    time.sleep(0.06)
+    assert criteria.exhausted(0) == DEADLINE
+
+
+def test_start_clears_progress():
+    criteria = StoppingCriteria(stagnation=1)
+    criteria.update(0, 1.0)
+    assert criteria.update(1, 1.0) == STAGNATION
+    criteria.start()
+    assert criteria.getReason() is None
+    assert criteria.update(2, 1.0) is None
+
+
+def test_child_splits_remaining_budget():
+    criteria = StoppingCriteria(1000, target=2.0, deadline=10)
+    child = criteria.child(400, shares=4, stagnation=2)
+    assert child.maxEvaluations == 150
+    assert child.target == 2.0 and child.stagnation == 2
+    assert child.endTime == criteria.endTime
+    limits = criteria.limits()
+    assert limits.maxEvaluations == 1000 and limits.stagnation is None
+    assert limits.endTime == criteria.endTime
+
+
+def test_state_round_trip():
+    criteria = StoppingCriteria(500, target=0.0, stagnation=4, deadline=30)
+    criteria.update(10, 2.0)
+    criteria.update(20, 2.0)
+    restored = StoppingCriteria()
+    restored.setState(criteria.getState())
+    assert restored.maxEvaluations == 500 and restored.stagnation == 4
+    assert restored.bestSeen == 2.0 and restored.sinceImprovement == 1
+    assert 0 < restored.endTime - time.monotonic() <= 30
+
+
+def test_swarm_stops_on_target():
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode="batch",
+                  rng=numpy.random.default_rng(1))
+    swarm.getHive().setSASettings(10, 10, 25, .95, True, True)
+    swarm.run(1000, StoppingCriteria(target=-1.0316, tolerance=0.01))
+    assert swarm.getStopReason() == TARGET
+    assert swarm.runIterations < 1000
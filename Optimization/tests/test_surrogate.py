@@ -0,0 +1,65 @@
+""" Python Package Support """
+import numpy
+import pytest
+
+""" Internal Package Support """
+from Surrogate import RBFSurrogate
+from SimulatedAnnealing import SimulatedAnnealing
+from BatchAnnealing import BatchSimulatedAnnealing
+from Hive import Hive
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The incrementally updated surrogate predicts what a full solve of
+    its interpolation system does, and screening is refused under the
+    legacy acceptance rule.
+"""
+
+
+"""
+ Predictions of a full solve of the surrogate's current system.
+ """
+def solved(surrogate, positions):
+    size, dimensions = surrogate.getPoints().shape
+    tail = numpy.hstack((numpy.ones((size, 1)), surrogate.getPoints()))
+    system = numpy.zeros((size + dimensions + 1, size + dimensions + 1))
+    system[:size, :size] = surrogate.kernel + surrogate.ridge*numpy.eye(size)
+    system[:size, size:] = tail
+    system[size:, :size] = tail.T
+    weights = numpy.linalg.solve(system, numpy.concatenate((surrogate.getCosts(),
+                                                             numpy.zeros(dimensions + 1))))
+    distances = numpy.linalg.norm(positions[:, numpy.newaxis, :] - surrogate.getPoints(),
+                                  axis=2)
+    return distances**3 @ weights[:size] + weights[size] + positions @ weights[size + 1:]
+
+
+def test_incremental_matches_full_solve():
+    rng = numpy.random.default_rng(0)
+    surrogate = RBFSurrogate(maxPoints=60)
+    probes = rng.uniform(-2, 2, (20, 3))
+    for i in range (300):
+        position = rng.uniform(-2, 2, (1, 3))
+        surrogate.update(position, (position**2).sum(axis=1) + numpy.sin(3*position).sum(axis=1))
+        if(surrogate.ready(3)):
+            assert numpy.allclose(surrogate.predict(probes), solved(surrogate, probes),
+                                  rtol=1e-6, atol=1e-6)
+    stats = surrogate.getStats()
+    assert stats["points"] == 60
+    assert stats["updates"] > 10*stats["fits"]
+
+
+def test_legacy_acceptance_refused():
+    with pytest.raises(ValueError):
+        SimulatedAnnealing(1, 10, 5, 5, .95, True, True, surrogate=RBFSurrogate())
+    with pytest.raises(ValueError):
+        BatchSimulatedAnnealing(1, 10, 5, 5, .95, True, True, surrogate=RBFSurrogate())
+    hive = Hive(4, 1, "batch", seed=1)
+    with pytest.raises(ValueError):
+        hive.setSAOptions(surrogate=RBFSurrogate())
+    hive.setSAOptions(acceptance="metropolis", surrogate=RBFSurrogate())
+    hive.shutdown()
@@ -0,0 +1,90 @@
+""" Python Package Support """
+import csv
+import json
+import numpy
+
+""" Internal Package Support """
+from Swarm import Swarm
+from Telemetry import (Telemetry, MemorySink, JsonlSink, CsvSink, ITERATION,
+                       GLOBAL_BEST, CHAIN)
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Sinks receive every event while attached, a run reports its
+    iterations, global bests and chains without printing or changing
+    its results, and the file sinks write what they receive.
+"""
+
+
+"""
+ Swarm of the telemetry tests.
+ """
+def newSwarm(telemetry=None):
+    swarm = Swarm(8, 2.05, 2.05, .7, .7298, "camelback", saMode="batch",
+                  telemetry=telemetry, rng=numpy.random.default_rng(0))
+    swarm.getHive().setSASettings(5, 3, 10, .95, True, True)
+    return swarm
+
+
+def test_attach_and_detach():
+    telemetry = Telemetry()
+    assert not telemetry.active
+    first = telemetry.attach(MemorySink())
+    second = telemetry.attach(MemorySink())
+    telemetry.emit(ITERATION, {"iteration": 1})
+    telemetry.detach(first)
+    assert telemetry.active
+    telemetry.emit(ITERATION, {"iteration": 2})
+    telemetry.detach(second)
+    assert not telemetry.active
+    assert [fields["iteration"] for fields in first.getEvents(ITERATION)] == [1]
+    assert [fields["iteration"] for fields in second.getEvents(ITERATION)] == [1, 2]
+
+
+def test_run_reports_events(capsys):
+    telemetry = Telemetry()
+    sink = telemetry.attach(MemorySink())
+    swarm = newSwarm(telemetry)
+    swarm.run(4)
+    assert capsys.readouterr().out == ""
+    """ the starting population is reported as the first iteration """
+    assert [fields["iteration"] for fields in sink.getEvents(ITERATION)] == [1, 2, 3, 4, 5]
+    bests = [fields["bestCost"] for fields in sink.getEvents(GLOBAL_BEST)]
+    assert bests == sorted(bests, reverse=True) and len(set(bests)) == len(bests)
+    assert bests[-1] == swarm.getBestCost()
+    assert len(sink.getEvents(CHAIN)) == 4*8
+    silent = newSwarm()
+    silent.run(4)
+    assert silent.getBestCost() == swarm.getBestCost()
+    assert silent.getEvaluations() == swarm.getEvaluations()
+
+
+def test_jsonl_sink(tmp_path):
+    path = str(tmp_path/"events.jsonl")
+    sink = JsonlSink(path, bufferSize=2)
+    sink(ITERATION, {"iteration": numpy.int64(1), "bestPosition": numpy.array([0.5, 1.0])})
+    assert open(path).read() == ""
+    sink(ITERATION, {"iteration": 2, "bestPosition": None})
+    sink(CHAIN, {"bestCost": numpy.float64(-1.0)})
+    assert len(open(path).read().splitlines()) == 2
+    sink.close()
+    records = [json.loads(line) for line in open(path)]
+    assert records[0] == {"iteration": 1, "bestPosition": [0.5, 1.0], "event": ITERATION}
+    assert records[2] == {"bestCost": -1.0, "event": CHAIN}
+
+
+def test_csv_sink(tmp_path):
+    path = str(tmp_path/"iterations.csv")
+    sink = CsvSink(path, event=ITERATION)
+    sink(CHAIN, {"bestCost": 0.0})
+    sink(ITERATION, {"iteration": 1, "bestPosition": numpy.array([0.5, 1.0])})
+    sink(ITERATION, {"iteration": 2, "bestPosition": [0.0, 0.0], "extra": 3})
+    sink.close()
+    rows = list(csv.DictReader(open(path, newline="")))
+    assert rows == [{"iteration": "1", "bestPosition": "[0.5, 1.0]"},
+                    {"iteration": "2", "bestPosition": "[0.0, 0.0]"}]
@@ -0,0 +1,90 @@
+""" Python Package Support """
+import math
+import numpy
+
+""" Internal Package Support """
+from Tempering import ReplicaExchange
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    The replica ladder is geometric and cold first, exchanges trade
+    whole states with the Metropolis swap probability and never lose
+    or duplicate one, and the best of every chain is tracked across
+    its replicas.
+"""
+
+
+"""
+ Annealer of the tempering tests.
+ """
+def newAnnealer(replicas=4, swapEvery=1, seed=0):
+    return ReplicaExchange("camelback", 10, 4, 5, .95, True, True, replicas=replicas,
+                           minTemp=0.1, swapEvery=swapEvery,
+                           rng=numpy.random.default_rng(seed))
+
+
+def test_ladder_geometric_cold_first():
+    temps = newAnnealer(5).getTemperatures()
+    assert temps[0] == 0.1 and math.isclose(temps[-1], 10)
+    assert numpy.allclose(temps[1:]/temps[:-1], temps[1]/temps[0])
+    assert newAnnealer(1).getTemperatures().tolist() == [0.1]
+
+
+def test_exchange_keeps_states_with_their_costs():
+    sim = newAnnealer(4)
+    rng = numpy.random.default_rng(1)
+    sim.setVariables(rng.uniform(-2, 2, (50, 2)))
+    sim.position = rng.uniform(-2, 2, sim.position.shape)
+    sim.currentSolution = sim.FX.evaluateArray(sim.position)
+    before = numpy.sort(sim.currentSolution.reshape(50, 4), axis=1)
+    for i in range (10):
+        sim.exchange()
+    """ states only move within their own chain, with their costs """
+    assert numpy.array_equal(numpy.sort(sim.currentSolution.reshape(50, 4), axis=1), before)
+    assert numpy.array_equal(sim.currentSolution, sim.FX.evaluateArray(sim.position))
+    assert sim.swapAccepts.sum() > 0
+    """ even pairs (0, 2) and odd pair (1) in turn """
+    assert sim.swapAttempts.tolist() == [250, 250, 250]
+
+
+def test_exchange_rate_matches_metropolis():
+    sim = newAnnealer(2)
+    size = 20000
+    sim.setVariables(numpy.zeros((size, 2)))
+    beta = 1/sim.getTemperatures()
+    """ the cold replica holds the better state :: swap with exp(delta) """
+    delta = math.log(0.3)
+    sim.currentSolution = numpy.tile([0.0, -delta/(beta[0] - beta[1])], size)
+    sim.exchange()
+    assert abs(sim.getSwapRates()[0] - 0.3) < 0.02
+    """ the cold replica holds the worse state :: always swap """
+    sim.setVariables(numpy.zeros((size, 2)))
+    sim.currentSolution = numpy.tile([1.0, 0.0], size)
+    sim.exchange()
+    assert sim.getSwapRates()[0] == 1.0
+    assert sim.currentSolution.reshape(size, 2)[:, 0].max() == 0.0
+
+
+def test_run_tracks_best_of_every_replica():
+    sim = newAnnealer(4, swapEvery=2)
+    starts = numpy.random.default_rng(2).uniform(-2, 2, (6, 2))
+    best = sim.run(starts)
+    assert sim.getEvaluations() == 6*4*(1 + 4*5)
+    assert numpy.array_equal(sim.currentSolution, sim.FX.evaluateArray(sim.position))
+    assert numpy.all(best <= sim.currentSolution.reshape(6, 4).min(axis=1))
+    assert numpy.allclose(best, sim.FX.evaluateArray(sim.getBestPosition()))
+    rates = sim.getSwapRates()
+    assert numpy.all((rates >= 0) & (rates <= 1)) and sim.swapAttempts.sum() > 0
+
+
+def test_seeded_runs_repeat():
+    starts = numpy.zeros((3, 2))
+    first = newAnnealer(seed=5)
+    second = newAnnealer(seed=5)
+    assert numpy.array_equal(first.run(starts), second.run(starts))
+    assert numpy.array_equal(first.getBestPosition(), second.getBestPosition())
@@ -0,0 +1,59 @@
+""" Python Package Support """
+import numpy
+
+""" Internal Package Support """
+from SA_Package import runTrial, ParameterSpace, RacingTuner
+
+"""
+    @author:     Matthew J Swann
+    @version:    1.0, Last Update: 2026-10-18
+
+    Program:     Reflective Optimization
+    Integration: Tests
+
+    Tuner trials end within their budget whatever the configuration,
+    candidates are drawn inside their ranges, and each rung of a race
+    keeps the best of the one before at a larger budget.
+"""
+
+CONFIGURATION = {"phiOne": 2.05, "phiTwo": 2.05, "inertia": 0.7,
+                 "constant": 0.7298, "initTemp": 10.0, "alpha": 0.95,
+                 "extIters": 10, "intIters": 25}
+
+
+def test_trial_budget_not_multiple_of_population():
+    result = runTrial(1, 7, "batch", CONFIGURATION, 1, 2003)
+    assert result["evaluations"] <= 2003
+
+
+def test_samples_within_ranges():
+    space = ParameterSpace(fixed={"alpha": 0.9})
+    assert "alpha" not in space.ranges
+    rng = numpy.random.default_rng(0)
+    for i in range (200):
+        configuration = space.sample(rng)
+        assert configuration["alpha"] == 0.9
+        for name, (low, high, kind) in space.ranges.items():
+            assert low <= configuration[name] <= high
+            assert isinstance(configuration[name], int if kind == "int" else float)
+
+
+def test_race_keeps_leaders_at_growing_budget():
+    fixed = dict(CONFIGURATION)
+    del fixed["phiOne"]
+    tuner = RacingTuner("camelback", popSize=6, trials=2, eta=2, minBudget=500,
+                        maxBudget=2000, space=ParameterSpace(fixed=fixed),
+                        workers=1, seed=3)
+    best = tuner.tune(4)
+    history = tuner.getHistory()
+    rungs = [[record for record in history if record["rung"] == rung] for rung in range (3)]
+    assert [len(records) for records in rungs] == [4, 2, 1]
+    assert [records[0]["budget"] for records in rungs] == [500, 1000, 2000]
+    for previous, records in zip(rungs, rungs[1:]):
+        """ only phiOne varies :: it names the candidate """
+        assert (sorted(record["configuration"]["phiOne"] for record in records) ==
+                sorted(record["configuration"]["phiOne"] for record in previous[:len(records)]))
+        scores = [record["score"] for record in records]
+        assert scores == sorted(scores)
+    assert best is rungs[2][0]
+    assert all(record["score"] <= 2*record["budget"] for record in history)